@@ -0,0 +1,183 @@
+"""
+solver 결과의 무복사 전달 (공유 메모리 / 메모리 맵 파일)
+
+web_layer와 같은 컨테이너 (b"URSL" | uint32 헤더 길이 | JSON 헤더 | 8바이트 정렬 버퍼)에
+원본 정밀도로 기록한다.
+
+    coords          (N, 2) float64  — UTM 52S (m)
+    ring_offsets    (R + 1,) int64
+    part_offsets    (P + 1,) int64
+    geom_offsets    (F + 1,) int64
+    centroids       (F, 2) float64
+    value:<이름>     (F,) float64
+
+소비자는 세그먼트/파일을 열고 헤더의 offset으로 배열 view만 만든다 (파싱/복사 없음).
+C# 쪽은 MemoryMappedFile.OpenExisting(name) (Windows 공유 메모리) 또는
+MemoryMappedFile.CreateFromFile(path)로 같은 구조를 읽는다 — works/URSUS/SharedResultReader.cs
+"""
+
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from src.io_format.web_layer import _pad, decode_container, encode_container
+from src.utils.gis.packed_geometry import PackedPolygons
+
+_RESULT_VERSION = 1
+# 이 프로세스가 만든 세그먼트 이름 (같은 프로세스에서 열 때는 resource_tracker 등록을 건드리지 않는다)
+_created = set()
+
+
+def _result_buffers(
+    polygons: PackedPolygons,
+    centroids: np.ndarray,
+    values: Dict[str, Sequence[float]],
+    ids: Optional[Sequence[str]],
+):
+    header = {
+        "format": "ursus-result",
+        "version": _RESULT_VERSION,
+        "crs": "EPSG:32652",
+        "feature_count": len(polygons),
+        "columns": list(values),
+    }
+    if ids is not None:
+        header["ids"] = [str(i) for i in ids]
+    buffers = {
+        "coords": np.asarray(polygons.coords, dtype=np.float64),
+        "ring_offsets": np.asarray(polygons.ring_offsets, dtype=np.int64),
+        "part_offsets": np.asarray(polygons.part_offsets, dtype=np.int64),
+        "geom_offsets": np.asarray(polygons.geom_offsets, dtype=np.int64),
+        "centroids": np.asarray(centroids, dtype=np.float64).reshape(-1, 2),
+    }
+    for name, column in values.items():
+        buffers[f"value:{name}"] = np.asarray(column, dtype=np.float64)
+    return encode_container(header, buffers)
+
+
+def _fill(target: memoryview, placed: list, prefix: bytes) -> None:
+    target[:len(prefix)] = prefix
+    raw = np.frombuffer(target, dtype=np.uint8)
+    for start, array in placed:
+        raw[start:start + array.nbytes] = array.view(np.uint8).ravel()
+
+
+class SharedResult:
+    """
+    결과 컨테이너 view — 공유 메모리 세그먼트 또는 메모리 맵 파일 위에 있다
+
+    header: 스키마 헤더 dict / buffers: {이름: 배열 view}
+    view는 close() 전까지만 유효하다 (계속 쓰려면 np.array(view)로 복사)
+    """
+
+    def __init__(self, raw: np.ndarray, handle, name: str, owner: bool):
+        self.header, self.buffers = decode_container(raw, _RESULT_VERSION)
+        if self.header.get("format") != "ursus-result":
+            raise ValueError(f"Not an URSUS result container: {name}")
+        self._raw = raw
+        self._handle = handle
+        self.name = name
+        self.owner = owner
+
+    @classmethod
+    def create(
+        cls,
+        polygons: PackedPolygons,
+        centroids: np.ndarray,
+        values: Dict[str, Sequence[float]],
+        ids: Optional[Sequence[str]] = None,
+        name: Optional[str] = None,
+        path: Optional[Union[str, Path]] = None,
+    ) -> "SharedResult":
+        """
+        결과 기록 — path가 있으면 메모리 맵 파일, 없으면 이름 있는 공유 메모리 (name=None이면 자동 이름)
+        공유 메모리는 만든 쪽이 unlink()할 때까지 (Windows는 마지막 핸들이 닫힐 때까지) 남는다
+        """
+        prefix, placed, size = _result_buffers(polygons, centroids, values, ids)
+        size += _pad(size)
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            raw = np.memmap(path, dtype=np.uint8, mode="w+", shape=(size,))
+            _fill(memoryview(raw), placed, prefix)
+            raw.flush()
+            return cls(raw, None, str(path), owner=True)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _fill(shm.buf, placed, prefix)
+        _created.add(shm.name)
+        return cls(np.frombuffer(shm.buf, dtype=np.uint8), shm, shm.name, owner=True)
+
+    @classmethod
+    def open(cls, target: Union[str, Path]) -> "SharedResult":
+        """
+        기존 결과 열기 — 존재하는 파일 경로면 메모리 맵, 아니면 공유 메모리 이름으로 본다
+        """
+        if Path(target).is_file():
+            raw = np.memmap(target, dtype=np.uint8, mode="r")
+            return cls(raw, None, str(target), owner=False)
+        shm = _attach(str(target))
+        return cls(np.frombuffer(shm.buf, dtype=np.uint8), shm, shm.name, owner=False)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._raw)
+
+    @property
+    def columns(self) -> list:
+        return list(self.header["columns"])
+
+    def polygons(self) -> PackedPolygons:
+        b = self.buffers
+        return PackedPolygons(b["coords"], b["ring_offsets"], b["part_offsets"], b["geom_offsets"])
+
+    def centroids(self) -> np.ndarray:
+        return self.buffers["centroids"]
+
+    def values(self, name: str) -> np.ndarray:
+        return self.buffers[f"value:{name}"]
+
+    def close(self) -> None:
+        """view 해제 (공유 메모리는 남겨 둔다)"""
+        self.buffers = {}
+        self._raw = None
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except BufferError:
+                pass  # 바깥에 아직 살아 있는 배열 view가 있으면 GC 때 해제된다
+
+    def unlink(self) -> None:
+        """공유 메모리 세그먼트 / 파일 삭제 (만든 쪽에서 호출)"""
+        if self._handle is not None:
+            self._handle.unlink()
+            _created.discard(self.name)
+        else:
+            Path(self.name).unlink(missing_ok=True)
+
+    def __enter__(self) -> "SharedResult":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    기존 세그먼트에 붙기 — 소비자 프로세스가 끝날 때 resource_tracker가
+    세그먼트를 지우지 않도록 추적하지 않는다
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        if shm.name in _created:
+            return shm
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
@@ -0,0 +1,276 @@
+"""
+웹 지도 레이어(deck.gl / kepler.gl)용 바이너리 컬럼 내보내기
+
+단일 파일 (.bin) 구조 — 모두 little-endian
+    b"URSL" | uint32 헤더 길이 | JSON 헤더 (8바이트 정렬 패딩) | 버퍼들 (각 8바이트 정렬)
+
+버퍼
+    positions       (N, 2) float32  — coordinate_origin 기준 오프셋 (deck.gl *_OFFSETS 좌표계)
+                    또는 uint16     — quantize_bits를 주면 bbox 기준 양자화 (헤더의 scale/translate로 복원)
+    ring_offsets    (R + 1,) uint32 — 링 i = positions[ring_offsets[i]:ring_offsets[i + 1]]
+    part_offsets    (P + 1,) uint32 — part j의 링 범위
+    geom_offsets    (F + 1,) uint32 — 피처 k의 part 범위
+    centroids       (F, 2) float32  — positions와 같은 좌표계
+    value:<이름>     (F,) float32    — 피처별 지표 컬럼
+
+JS 쪽은 fetch -> ArrayBuffer 한 번 받고 헤더의 offset으로 TypedArray view만 만들면 된다 (파싱 없음).
+GeoArrow (Arrow IPC / GeoParquet 1.1 native encoding)는 pyarrow가 있을 때만 사용할 수 있다.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.gis.gps_to_upm import GPStoUTM
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.optional_deps import require
+
+_MAGIC = b"URSL"
+_FORMAT_VERSION = 1
+_ALIGN = 8
+# 법정동 좌표는 UTM 52S (서울)
+_UTM_ZONE = (52, "S")
+_UTM_CRS = "EPSG:32652"
+
+
+def _pad(n: int) -> int:
+    return (-n) % _ALIGN
+
+
+def encode_container(header: dict, buffers: Dict[str, np.ndarray]) -> Tuple[bytes, list, int]:
+    """
+    헤더 + 버퍼 -> (magic·길이·JSON 헤더 바이트, [(버퍼 시작 위치, 배열)], 전체 바이트 수)
+    버퍼 위치는 헤더에 헤더 끝 기준 상대 offset으로 기록한다
+    """
+    offset = 0
+    entries, placed = [], []
+    for name, array in buffers.items():
+        array = np.ascontiguousarray(array)
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        entries.append({
+            "name": name,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+            "byte_length": array.nbytes,
+        })
+        placed.append((offset, array))
+        offset += array.nbytes + _pad(array.nbytes)
+    header = {**header, "buffers": entries}
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * _pad(len(_MAGIC) + 4 + len(header_bytes))
+    prefix = _MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes
+    return prefix, [(len(prefix) + o, a) for o, a in placed], len(prefix) + offset
+
+
+def decode_container(raw: np.ndarray, version: int = _FORMAT_VERSION):
+    """uint8 배열 (파일 mmap / 공유 메모리 view) -> (헤더, {이름: 배열 view})"""
+    if bytes(raw[:4]) != _MAGIC:
+        raise ValueError("Not an URSUS binary container")
+    (header_len,) = struct.unpack("<I", bytes(raw[4:8]))
+    header = json.loads(bytes(raw[8:8 + header_len]).decode("utf-8"))
+    if header.get("version") != version:
+        raise ValueError(f"Unsupported container version: {header.get('version')}")
+    base = 8 + header_len
+    buffers = {}
+    for entry in header["buffers"]:
+        start = base + entry["offset"]
+        chunk = raw[start:start + entry["byte_length"]]
+        buffers[entry["name"]] = chunk.view(np.dtype(entry["dtype"])).reshape(entry["shape"])
+    return header, buffers
+
+
+def _to_lnglat(xy: np.ndarray) -> np.ndarray:
+    lat, lon = GPStoUTM().UTMtoLLArray(xy[:, 1], xy[:, 0], *_UTM_ZONE)
+    return np.column_stack((lon, lat))
+
+
+def _layer_buffers(
+    polygons: PackedPolygons,
+    values: Dict[str, Sequence[float]],
+    centroids: Optional[np.ndarray],
+    coordinates: str,
+    quantize_bits: Optional[int],
+):
+    if coordinates == "lnglat":
+        coords = _to_lnglat(polygons.coords)
+        crs = "EPSG:4326"
+        cent = None if centroids is None else _to_lnglat(np.asarray(centroids, dtype=np.float64))
+    elif coordinates == "utm":
+        coords = polygons.coords
+        crs = _UTM_CRS
+        cent = None if centroids is None else np.asarray(centroids, dtype=np.float64)
+    else:
+        raise ValueError(f"Unknown coordinates: {coordinates}")
+
+    lo = coords.min(axis=0) if len(coords) else np.zeros(2)
+    hi = coords.max(axis=0) if len(coords) else np.zeros(2)
+    origin = 0.5 * (lo + hi)
+    header = {
+        "format": "ursus-layer",
+        "version": _FORMAT_VERSION,
+        "crs": crs,
+        "coordinate_origin": origin.tolist(),
+        "bbox": [*lo.tolist(), *hi.tolist()],
+        "feature_count": len(polygons),
+    }
+    if quantize_bits:
+        if not 1 <= quantize_bits <= 16:
+            raise ValueError("quantize_bits must be in 1..16")
+        levels = (1 << quantize_bits) - 1
+        extent = np.where(hi > lo, hi - lo, 1.0)
+        positions = np.round((coords - lo) / extent * levels).astype(np.uint16)
+        header["quantization"] = {
+            "bits": quantize_bits,
+            "scale": (extent / levels).tolist(),
+            "translate": lo.tolist(),
+        }
+    else:
+        positions = (coords - origin).astype(np.float32)
+
+    buffers = {
+        "positions": positions,
+        "ring_offsets": polygons.ring_offsets.astype(np.uint32),
+        "part_offsets": polygons.part_offsets.astype(np.uint32),
+        "geom_offsets": polygons.geom_offsets.astype(np.uint32),
+    }
+    if cent is not None:
+        buffers["centroids"] = (cent - origin).astype(np.float32)
+    for name, column in values.items():
+        column = np.asarray(column, dtype=np.float32)
+        if len(column) != len(polygons):
+            raise ValueError(f"Column {name} has {len(column)} values for {len(polygons)} features")
+        buffers[f"value:{name}"] = column
+    return header, buffers
+
+
+def write_binary_layer(
+    path: Path,
+    polygons: PackedPolygons,
+    values: Dict[str, Sequence[float]],
+    ids: Optional[Sequence[str]] = None,
+    centroids: Optional[np.ndarray] = None,
+    coordinates: str = "lnglat",
+    quantize_bits: Optional[int] = None,
+) -> Path:
+    """
+    PackedPolygons + 지표 컬럼 -> 단일 바이너리 레이어 파일
+
+    coordinates: "lnglat" (EPSG:4326, deck.gl LNGLAT_OFFSETS) | "utm" (EPSG:32652, 미터)
+    quantize_bits: 주면 positions를 uintN 양자화 (16 이하, 저장은 uint16)
+    ids: 피처 id (예: legald_cd) — 헤더 JSON에 함께 기록
+    """
+    header, buffers = _layer_buffers(polygons, values, centroids, coordinates, quantize_bits)
+    if ids is not None:
+        header["ids"] = [str(i) for i in ids]
+
+    prefix, placed, _ = encode_container(header, buffers)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(prefix)
+        for _, array in placed:
+            f.write(array.tobytes())
+            f.write(b"\0" * _pad(array.nbytes))
+    return path
+
+
+def read_binary_layer(path: Path, mmap: bool = True):
+    """
+    바이너리 레이어 -> (헤더 dict, {버퍼 이름: 배열})
+    mmap이면 버퍼는 파일을 가리키는 읽기 전용 view (복사 없음)
+    """
+    path = Path(path)
+    if mmap:
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+    else:
+        raw = np.frombuffer(path.read_bytes(), dtype=np.uint8)
+    return decode_container(raw)
+
+
+def decode_positions(header: dict, buffers: dict) -> np.ndarray:
+    """positions 버퍼 -> 절대 좌표 (N, 2) float64"""
+    positions = buffers["positions"].astype(np.float64)
+    quant = header.get("quantization")
+    if quant:
+        return positions * np.asarray(quant["scale"]) + np.asarray(quant["translate"])
+    return positions + np.asarray(header["coordinate_origin"])
+
+
+def layer_to_polygons(header: dict, buffers: dict) -> PackedPolygons:
+    return PackedPolygons(
+        decode_positions(header, buffers),
+        buffers["ring_offsets"].astype(np.int64),
+        buffers["part_offsets"].astype(np.int64),
+        buffers["geom_offsets"].astype(np.int64),
+    )
+
+
+def write_geoarrow(
+    path: Path,
+    polygons: PackedPolygons,
+    values: Dict[str, Sequence[float]],
+    ids: Optional[Sequence[str]] = None,
+    coordinates: str = "lnglat",
+) -> Path:
+    """
+    GeoArrow multipolygon (interleaved xy) 테이블로 저장 — .parquet이면 GeoParquet 1.1, 그 외 Arrow IPC
+    pyarrow가 필요하다
+    """
+    pa = require("pyarrow", "write_geoarrow")
+
+    if coordinates == "lnglat":
+        coords, crs = _to_lnglat(polygons.coords), "EPSG:4326"
+    elif coordinates == "utm":
+        coords, crs = polygons.coords, _UTM_CRS
+    else:
+        raise ValueError(f"Unknown coordinates: {coordinates}")
+
+    xy = pa.FixedSizeListArray.from_arrays(pa.array(coords.ravel(), pa.float64()), 2)
+    rings = pa.ListArray.from_arrays(pa.array(polygons.ring_offsets.astype(np.int32)), xy)
+    parts = pa.ListArray.from_arrays(pa.array(polygons.part_offsets.astype(np.int32)), rings)
+    geometry = pa.ListArray.from_arrays(pa.array(polygons.geom_offsets.astype(np.int32)), parts)
+
+    field = pa.field(
+        "geometry",
+        geometry.type,
+        metadata={
+            "ARROW:extension:name": "geoarrow.multipolygon",
+            "ARROW:extension:metadata": json.dumps({"crs": crs}),
+        },
+    )
+    columns, fields = [geometry], [field]
+    if ids is not None:
+        columns.append(pa.array([str(i) for i in ids], pa.string()))
+        fields.append(pa.field("id", pa.string()))
+    for name, column in values.items():
+        columns.append(pa.array(np.asarray(column, dtype=np.float64)))
+        fields.append(pa.field(name, pa.float64()))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        geo = {
+            "version": "1.1.0",
+            "primary_column": "geometry",
+            "columns": {
+                "geometry": {
+                    "encoding": "multipolygon",
+                    "geometry_types": ["MultiPolygon"],
+                }
+            },
+        }
+        if crs != "EPSG:4326":  # 생략하면 OGC:CRS84 (경위도)
+            geo["columns"]["geometry"]["crs"] = {"id": {"authority": "EPSG", "code": 32652}}
+        schema = pa.schema(fields, metadata={"geo": json.dumps(geo)})
+        pq.write_table(pa.Table.from_arrays(columns, schema=schema), path)
+    else:
+        import pyarrow.feather as feather
+
+        feather.write_feather(pa.Table.from_arrays(columns, schema=pa.schema(fields)), path)
+    return path
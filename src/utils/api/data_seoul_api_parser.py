@@ -1,10 +1,16 @@
 #! python3
 # venv: JAH
 
-import requests
-import pandas as pd
+from __future__ import annotations
+
 import xml.etree.ElementTree as ET
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple, Iterator
+from src.utils.api.http_transport import HttpTransport, get_default_transport
+from src.utils.api.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class DataSeoulOpenAPIParser:
     """
@@ -12,9 +18,15 @@ class DataSeoulOpenAPIParser:
     with data.seoul.go.kr OPEN API
     """
 
-    def __init__(self, api_key: str, base_url: str = "http://openapi.seoul.go.kr:8088"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://openapi.seoul.go.kr:8088",
+        transport: Optional[HttpTransport] = None,
+    ):
         self.api_key = api_key
         self.base_url = base_url
+        self.transport = transport or get_default_transport()
 
     def _build_url(self, service_name: str, start: int, end: int) -> str:
         return f"{self.base_url}/{self.api_key}/xml/{service_name}/{start}/{end}/"
@@ -23,20 +35,72 @@ class DataSeoulOpenAPIParser:
         """
         url -> XML
         """
-        resp = requests.get(url, timeout=30)
+        resp = self.transport.get(url)
         resp.raise_for_status()
         root = ET.fromstring(resp.content)
 
         # API 응답 내 에러 처리 (RESULT 코드 확인)
+        # INFO-000 = 정상, 그 외에도 "정상 처리되었습니다" 메시지면 통과
         result = root.find(".//RESULT")
         if result is not None:
-            code = (result.findtext("CODE") or "").strip()
-            msg  = (result.findtext("MESSAGE") or "").strip()
-            # INFO-000 = 정상, 그 외에도 "정상 처리되었습니다" 메시지면 통과
-            if code and code != "INFO-000" and "정상" not in msg:
-                raise RuntimeError(f"API 오류: {code} - {msg}")
+            self._check_result(result)
         return root
 
+    def _check_result(self, result: ET.Element) -> None:
+        code = (result.findtext("CODE") or "").strip()
+        msg  = (result.findtext("MESSAGE") or "").strip()
+        if code and code != "INFO-000" and "정상" not in msg:
+            raise RuntimeError(f"API 오류: {code} - {msg}")
+
+    def _stream_columns(self, url: str) -> Tuple[Optional[int], Dict[str, List[str]]]:
+        """
+        url -> (list_total_count, {col: [val, ...]})
+
+        응답 스트림을 iterparse로 읽으며 <row>를 dict로 만들지 않고
+        컬럼별 버퍼에 바로 적재한다. 처리한 엘리먼트는 즉시 해제.
+        """
+        resp = self.transport.get(url, stream=True)
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+
+        total_count: Optional[int] = None
+        columns: Dict[str, List[str]] = {}
+        n_rows = 0
+        try:
+            for _, elem in ET.iterparse(resp.raw, events=("end",)):
+                tag = elem.tag
+                if tag == "row":
+                    for child in elem:
+                        buf = columns.get(child.tag)
+                        if buf is None:
+                            # 앞선 행에 없던 컬럼은 빈 문자열로 채움
+                            buf = columns[child.tag] = [""] * n_rows
+                        buf.append((child.text or "").strip())
+                    n_rows += 1
+                    for buf in columns.values():
+                        if len(buf) < n_rows:
+                            buf.append("")
+                    elem.clear()
+                elif tag == "list_total_count":
+                    txt = (elem.text or "").strip()
+                    total_count = int(txt) if txt.isdigit() else None
+                elif tag == "RESULT":
+                    self._check_result(elem)
+        finally:
+            resp.close()
+        return total_count, columns
+
+    def _columns_to_frame(
+        self, columns: Dict[str, List[str]], dtypes: Optional[Dict[str, str]]
+    ) -> pd.DataFrame:
+        import pandas as pd
+
+        df = pd.DataFrame(columns)
+        for col, dtype in (dtypes or {}).items():
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+        return df
+
     def _xml_to_records(self, root: ET.Element) -> List[Dict[str, Any]]:
         """
         <row> -> list[dict[col, val]]
@@ -55,13 +119,96 @@ class DataSeoulOpenAPIParser:
         txt = node.text.strip()
         return int(txt) if txt.isdigit() else None
 
+    def _plan_windows(
+        self, next_start: int, last: int, page_size: int
+    ) -> List[Tuple[int, int]]:
+        """[next_start, last] 구간을 page_size 단위 (start, end) 목록으로 분할"""
+        return [
+            (s, min(s + page_size - 1, last))
+            for s in range(next_start, last + 1, page_size)
+        ]
+
+    def _fetch_window(
+        self, service_name: str, window: Tuple[int, int], limiter: Optional[RateLimiter]
+    ) -> List[Dict[str, Any]]:
+        if limiter is not None:
+            limiter.acquire()
+        root = self._fetch_xml_root(self._build_url(service_name, *window))
+        return self._xml_to_records(root)
+
+    def get_total_count(self, service_name: str) -> Optional[int]:
+        """1건만 요청하여 list_total_count 확인"""
+        root = self._fetch_xml_root(self._build_url(service_name, 1, 1))
+        return self._get_list_total_count(root)
+
     def to_dataframe(self, service_name: str, start: int = 1, end: int = 100) -> pd.DataFrame:
         """단일 구간 호출 -> DataFrame"""
+        import pandas as pd
+
         url = self._build_url(service_name, start, end)
         root = self._fetch_xml_root(url)
         records = self._xml_to_records(root)
         return pd.DataFrame(records)
 
+    def iter_dataframes(
+        self,
+        service_name: str,
+        page_size: int = 1000,
+        start: int = 1,
+        end: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+        verbose: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        페이지 단위 DataFrame 청크 제너레이터 (스트리밍 파싱).
+
+        한 번에 한 페이지 분량만 메모리에 두므로 수백만 행 서비스도
+        일정한 메모리로 처리할 수 있다.
+
+        Parameters
+        ----------
+        dtypes : Optional[Dict[str, str]]
+            컬럼별 숫자 dtype (예: {"MT_AVRG_INCOME_AMT": "float64"}).
+            지정하지 않은 컬럼은 문자열로 유지
+        그 외 인자는 to_dataframe_full과 동일
+        """
+        if page_size <= 0:
+            raise ValueError("page_size는 양의 정수여야 합니다.")
+
+        limit = None if end is None else end - start + 1
+        fetched = 0
+        page_start = start
+        while True:
+            if limit is not None and fetched >= limit:
+                break
+            if max_rows is not None and fetched >= max_rows:
+                break
+
+            page_end = page_start + page_size - 1
+            if end is not None:
+                page_end = min(page_end, end)
+
+            url = self._build_url(service_name, page_start, page_end)
+            total_count, columns = self._stream_columns(url)
+            n_rows = len(next(iter(columns.values()), []))
+            if verbose:
+                print(f"[INFO] fetched {n_rows} rows (start={page_start} ~ end={page_end})")
+            if n_rows == 0:
+                break
+
+            # 첫 페이지에서 알게 된 total_count로 목표량 확정
+            if limit is None and total_count is not None:
+                limit = max(total_count - (start - 1), 0)
+
+            chunk = self._columns_to_frame(columns, dtypes)
+            if max_rows is not None and fetched + n_rows > max_rows:
+                chunk = chunk.iloc[: max_rows - fetched]
+            fetched += len(chunk)
+            yield chunk
+
+            page_start = page_end + 1
+
     def to_dataframe_full(
         self,
         service_name: str,
@@ -70,6 +217,8 @@ class DataSeoulOpenAPIParser:
         end: Optional[int] = None,
         max_rows: Optional[int] = None,
         verbose: bool = False,
+        concurrency: int = 1,
+        rate_limit: Optional[float] = None,
     ) -> pd.DataFrame:
         """
         자동 페이지네이션으로 전체(또는 지정량) 수집.
@@ -90,13 +239,25 @@ class DataSeoulOpenAPIParser:
             페이지간 대기(레이트 리밋 회피용)
         verbose : bool, default False
             진행상황 출력 여부
+        concurrency : int, default 1
+            동시 요청 수. 2 이상이면 total_count 확인 후 남은 구간을
+            한 번에 계획하여 스레드 풀로 병렬 수집 (결과 순서는 유지)
+        rate_limit : Optional[float]
+            초당 최대 요청 수 (클라이언트 측 제한)
         """
+        import pandas as pd
+
         if page_size <= 0:
             raise ValueError("page_size는 양의 정수여야 합니다.")
+        if concurrency <= 0:
+            raise ValueError("concurrency는 양의 정수여야 합니다.")
+        limiter = RateLimiter(rate_limit) if rate_limit else None
 
         # 1페이지 먼저 호출하여 total_count 파악
         first_end = start + page_size - 1 if end is None else min(end, start + page_size - 1)
         url = self._build_url(service_name, start, first_end)
+        if limiter is not None:
+            limiter.acquire()
         root = self._fetch_xml_root(url)
 
         total_count = self._get_list_total_count(root)  # 없을 수도 있음
@@ -122,6 +283,17 @@ class DataSeoulOpenAPIParser:
         fetched = len(first_batch)
         next_start = first_end + 1
 
+        if concurrency > 1 and target_total is not None:
+            records.extend(
+                self._fetch_remaining_concurrent(
+                    service_name, next_start, start, target_total, page_size,
+                    max_rows, concurrency, limiter, verbose,
+                )
+            )
+            if max_rows is not None and len(records) > max_rows:
+                records = records[:max_rows]
+            return pd.DataFrame(records)
+
         while True:
             # 종료 조건 1: target_total(알고 있는 총량)에 도달
             if target_total is not None and fetched >= target_total:
@@ -135,9 +307,7 @@ class DataSeoulOpenAPIParser:
             if end is not None:
                 next_end = min(next_end, end)
 
-            url = self._build_url(service_name, next_start, next_end)
-            root = self._fetch_xml_root(url)
-            batch = self._xml_to_records(root)
+            batch = self._fetch_window(service_name, (next_start, next_end), limiter)
 
             if verbose:
                 print(f"[INFO] fetched {len(batch)} rows (start={next_start} ~ end={next_end})")
@@ -163,3 +333,38 @@ class DataSeoulOpenAPIParser:
             records = records[:max_rows]
 
         return pd.DataFrame(records)
+
+    def _fetch_remaining_concurrent(
+        self,
+        service_name: str,
+        next_start: int,
+        start: int,
+        target_total: int,
+        page_size: int,
+        max_rows: Optional[int],
+        concurrency: int,
+        limiter: Optional[RateLimiter],
+        verbose: bool,
+    ) -> List[Dict[str, Any]]:
+        """남은 구간을 계획한 뒤 bounded 스레드 풀로 병렬 수집 (페이지 순서 유지)"""
+        limit = target_total if max_rows is None else min(target_total, max_rows)
+        windows = self._plan_windows(next_start, start + limit - 1, page_size)
+        if not windows:
+            return []
+        if verbose:
+            print(f"[INFO] {len(windows)} pages planned (concurrency={concurrency})")
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(windows))) as pool:
+            batches = list(
+                pool.map(lambda w: self._fetch_window(service_name, w, limiter), windows)
+            )
+
+        records: List[Dict[str, Any]] = []
+        for window, batch in zip(windows, batches):
+            if verbose:
+                print(f"[INFO] fetched {len(batch)} rows (start={window[0]} ~ end={window[1]})")
+            # 순차 모드와 동일하게 빈 페이지 이후는 버림
+            if not batch:
+                break
+            records.extend(batch)
+        return records
@@ -0,0 +1,163 @@
+#! python3
+# venv: JAH
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    import requests
+
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    bytes: int = 0
+    latency_sec: float = 0.0
+
+
+class HttpTransport:
+    """
+    두 API 파서가 공유하는 HTTP 전송 계층
+
+    - keep-alive 커넥션 풀을 가진 requests.Session 하나를 재사용 (첫 요청 때 생성 — requests import도 그때)
+    - 연결/읽기 타임아웃
+    - 5xx/429/타임아웃/연결 오류 시 지수 백오프 + 지터로 재시도
+    - 호스트별 재시도 예산 (성공할 때마다 budget_refill만큼 회복)
+    - 호스트별 요청 수/재시도/바이트/누적 지연 카운터
+    """
+
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 30.0),
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        retry_budget: float = 10.0,
+        budget_refill: float = 0.1,
+        pool_maxsize: int = 16,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_budget = retry_budget
+        self.budget_refill = budget_refill
+        self.pool_maxsize = pool_maxsize
+
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, float] = {}
+        self._stats: Dict[str, HostStats] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def _backoff(self, attempt: int) -> float:
+        """full jitter: [0, min(max, base * 2^attempt)]"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _take_retry(self, host: str) -> bool:
+        with self._lock:
+            budget = self._budgets.get(host, self.retry_budget)
+            if budget < 1:
+                return False
+            self._budgets[host] = budget - 1
+            self._stats.setdefault(host, HostStats()).retries += 1
+            return True
+
+    def _record(self, host: str, elapsed: float, nbytes: int, ok: bool) -> None:
+        with self._lock:
+            st = self._stats.setdefault(host, HostStats())
+            st.requests += 1
+            st.latency_sec += elapsed
+            st.bytes += nbytes
+            if ok:
+                budget = self._budgets.get(host, self.retry_budget)
+                self._budgets[host] = min(self.retry_budget, budget + self.budget_refill)
+            else:
+                st.failures += 1
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        stream: bool = False,
+        timeout: Union[float, Tuple[float, float], None] = None,
+    ) -> requests.Response:
+        """
+        GET 요청. 재시도 가능한 상태 코드가 끝내 반복되면 마지막 응답을 반환하고,
+        네트워크 예외가 예산을 넘기면 마지막 예외를 다시 발생시킨다.
+        """
+        import requests
+
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            t0 = time.perf_counter()
+            try:
+                resp = self.session.get(
+                    url, params=params, stream=stream, timeout=timeout or self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(host, time.perf_counter() - t0, 0, ok=False)
+                if attempt >= self.max_retries or not self._take_retry(host):
+                    raise
+            else:
+                nbytes = int(resp.headers.get("Content-Length", 0)) if stream else len(resp.content)
+                retryable = resp.status_code in _RETRY_STATUSES
+                self._record(host, time.perf_counter() - t0, nbytes, ok=not retryable)
+                if not retryable or attempt >= self.max_retries or not self._take_retry(host):
+                    return resp
+                resp.close()
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def stats(self) -> Dict[str, dict]:
+        """호스트별 카운터 스냅샷 (평균 지연 포함)"""
+        with self._lock:
+            return {
+                host: {
+                    **vars(st),
+                    "avg_latency_sec": st.latency_sec / st.requests if st.requests else 0.0,
+                }
+                for host, st in self._stats.items()
+            }
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """프로세스 전역 공유 transport (최초 호출 시 생성)"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
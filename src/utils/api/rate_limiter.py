@@ -0,0 +1,38 @@
+#! python3
+# venv: JAH
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    클라이언트 측 토큰 버킷 레이트 리미터 (스레드 안전)
+
+    rate 건/초로 토큰이 채워지고 최대 burst개까지 쌓인다.
+    acquire()는 토큰이 생길 때까지 블록한다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate는 양수여야 합니다.")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -1,16 +1,24 @@
 #! python3
 # venv: JAH
 
-import json
-import time
-import pandas as pd
-import requests
+from __future__ import annotations
+
+import numpy as np
 from pathlib import Path
-from typing import Optional
-import Rhino.Geometry as rg
+from typing import TYPE_CHECKING, Optional
+from src.utils.api.http_transport import HttpTransport, get_default_transport
+from src.utils.api.vworld_geocoder import VworldGeocoder
+from src.utils.api.wfs_tile_harvester import WfsTileHarvester
+from src.utils.cache.cache_store import CacheStore
 from src.utils.gis.gps_to_upm import GPStoUTM
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.topology import Topology
+
+if TYPE_CHECKING:
+    import pandas as pd
 
-_CACHE_TTL_DAYS = 30
+# 캐시 페이로드 구조가 바뀌면 올린다 (이전 캐시는 자동으로 무효)
+_CACHE_SCHEMA_VERSION = 4
 
 
 class VworldOpenAPIParser:
@@ -19,11 +27,18 @@ class VworldOpenAPIParser:
     with vworld.kr OPEN API
     """
 
-    def __init__(self, api_key: str, cache_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: Optional[Path] = None,
+        transport: Optional[HttpTransport] = None,
+        cache: Optional[CacheStore] = None,
+    ):
         self.api_key   = api_key
         self.cache_dir = cache_dir
+        self.cache = cache or (CacheStore(cache_dir) if cache_dir else None)
+        self.transport = transport or get_default_transport()
         self.wfs_url = "https://api.vworld.kr/req/wfs"
-        self.geocoder_url = "https://api.vworld.kr/req/address"
         self.wfs_params = {
             "SERVICE": "WFS",
             "REQUEST": "GetFeature",
@@ -37,124 +52,114 @@ class VworldOpenAPIParser:
             "EXCEPTIONS": "text/xml",
             "KEY": self.api_key,
         }
-        self.geocoder_params = {
-            "service": "address",
-            "request": "getcoord",
-            "crs": "EPSG:4326",
-            "address": None,
-            "format": "json",
-            "type": "road",
-            "key": self.api_key,
-        }
+        cache_root = self.cache.root if self.cache else cache_dir
+        self.geocoder = VworldGeocoder(
+            api_key,
+            transport=self.transport,
+            cache_path=cache_root / "geocode.sqlite" if cache_root else None,
+        )
 
     def get_legal_district_by_addresses(
-        self, address1: str, address2: str
+        self, address1: str, address2: str, refresh: bool = False
     ) -> pd.DataFrame:
-        """법정동 경계 DataFrame (TTL 캐시 적용)"""
-        cache_path = self.cache_dir / "legald_boundaries.json" if self.cache_dir else None
-
-        if cache_path and self._is_cache_valid(cache_path):
-            remaining = _CACHE_TTL_DAYS - (time.time() - cache_path.stat().st_mtime) / 86400
-            print(f"[CACHE] legald_boundaries 캐시 사용 (만료까지 {remaining:.1f}일)")
-            return self._load_cache(cache_path)
+        """
+        법정동 경계 DataFrame (CacheStore 캐시 적용, 키에 주소 포함)
+        refresh면 캐시를 읽지 않고 다시 받아 덮어쓴다
+        """
+        key = CacheStore.make_key(
+            "vworld/wfs/lt_c_ademd_info",
+            {"address1": address1, "address2": address2},
+            _CACHE_SCHEMA_VERSION,
+        )
+        if self.cache and not refresh:
+            arrays = self.cache.get_arrays(key)
+            if arrays is not None:
+                print(f"[CACHE] legald_boundaries 캐시 사용 (만료까지 {self.cache.remaining_days(key) or 0:.1f}일)")
+                return self._arrays_to_df(arrays)
 
         print("[CACHE] legald_boundaries API 호출 중...")
         df = self._fetch_legal_district(address1, address2)
 
-        if cache_path:
-            self._save_cache(df, cache_path)
+        if self.cache:
+            self.cache.put_arrays(key, self._df_to_arrays(df))
+            print(f"[CACHE] legald_boundaries 저장 완료 ({len(df)}건)")
 
         return df
 
     def _fetch_legal_district(self, address1: str, address2: str) -> pd.DataFrame:
-        """실제 API 호출 + Geometry 생성"""
-        res = []
+        """실제 API 호출 + 좌표 배열 기반 Geometry 생성 (MultiPolygon/hole 포함, Rhino 불필요)"""
+        codes, names, geometries = [], [], []
         data = self._get_full_row_data(address1=address1, address2=address2)
         for datum in data:
             for feature in datum["features"]:
-                coords = feature["geometry"]["coordinates"]
                 feat_name = feature["properties"]["full_nm"]
                 if "서울" in feat_name:
-                    points = []
-                    for coord in coords[0][0]:
-                        gps_to_utm = GPStoUTM()
-                        x, y = gps_to_utm.LLtoUTM(coord[1], coord[0])
-                        try:
-                            pt = rg.Point3d(x, y, 0)
-                            points.append(pt)
-                        except:
-                            ValueError("Coordinate conversion error")
-                    try:
-                        polyline = rg.Polyline(points)
-                        if not polyline.IsClosed:
-                            polyline.Add(polyline[0])
-                        polyline_curve = rg.PolylineCurve(polyline)
-                        amp = rg.AreaMassProperties.Compute(polyline_curve)
-                        res.append({
-                            "legald_cd": feature["properties"]["emd_cd"],
-                            "name":      feat_name,
-                            "geometry":  polyline_curve,
-                            "area":      amp.Area,
-                            "centroid":  amp.Centroid,
-                        })
-                    except:
-                        ValueError("Geometry creation error")
-        return pd.DataFrame(res)
-
-    def _is_cache_valid(self, path: Path) -> bool:
-        if not path.exists():
-            return False
-        age_days = (time.time() - path.stat().st_mtime) / 86400
-        return age_days < _CACHE_TTL_DAYS
-
-    def _save_cache(self, df: pd.DataFrame, path: Path) -> None:
-        """PolylineCurve/Point3d → 좌표 배열로 직렬화하여 저장"""
-        records = []
-        for _, row in df.iterrows():
-            pl = row["geometry"].ToPolyline()
-            records.append({
-                "legald_cd": row["legald_cd"],
-                "name":      row["name"],
-                "area":      row["area"],
-                "centroid":  [row["centroid"].X, row["centroid"].Y],
-                "coords":    [[pt.X, pt.Y] for pt in pl],
-            })
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(str(path), "w", encoding="utf-8") as f:
-            json.dump(records, f, ensure_ascii=False)
-        print(f"[CACHE] legald_boundaries 저장 완료 ({len(records)}건)")
-
-    def _load_cache(self, path: Path) -> pd.DataFrame:
-        """좌표 배열 → Rhino Geometry 재생성"""
-        with open(str(path), "r", encoding="utf-8") as f:
-            records = json.load(f)
-        rows = []
-        for r in records:
-            points = [rg.Point3d(c[0], c[1], 0) for c in r["coords"]]
-            pl = rg.Polyline(points)
-            if not pl.IsClosed:
-                pl.Add(pl[0])
-            rows.append({
-                "legald_cd": r["legald_cd"],
-                "name":      r["name"],
-                "geometry":  rg.PolylineCurve(pl),
-                "area":      r["area"],
-                "centroid":  rg.Point3d(r["centroid"][0], r["centroid"][1], 0),
-            })
-        return pd.DataFrame(rows)
+                    codes.append(feature["properties"]["emd_cd"])
+                    names.append(feat_name)
+                    geometries.append(feature["geometry"])
+
+        # 모든 part/링의 정점을 한 번에 투영하고 면적/중심도 한 번에 계산
+        packed = PackedPolygons.from_geojson(geometries)
+        x, y = GPStoUTM().LLtoUTMArray(packed.coords[:, 1], packed.coords[:, 0])
+        packed = packed.with_coords(np.column_stack((x, y)))
+        # 이웃 법정동의 공유 경계가 같은 정점을 쓰도록 토폴로지를 거친 좌표를 반환 (캐시 복원 결과와 동일)
+        return self._packed_to_df(
+            Topology.from_polygons(packed).to_polygons(),
+            np.array(codes, dtype=str), np.array(names, dtype=str),
+            packed.areas(), packed.centroids(),
+        )
+
+    def _packed_to_df(
+        self,
+        packed: PackedPolygons,
+        codes: np.ndarray,
+        names: np.ndarray,
+        areas: np.ndarray,
+        centroids: np.ndarray,
+    ) -> pd.DataFrame:
+        """
+        geometry: [part][ring] (n, 2) 좌표 배열 (packed.coords의 view, 각 part의 첫 링이 외곽)
+        centroid: (x, y) 튜플
+        Rhino 객체는 필요할 때 src.utils.gis.rhino_geometry로 변환
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            "legald_cd": codes.tolist(),
+            "name":      names.tolist(),
+            "geometry":  packed.features(),
+            "area":      areas,
+            "centroid":  [tuple(c) for c in centroids.tolist()],
+        })
+
+    def _df_to_arrays(self, df: pd.DataFrame) -> dict:
+        """
+        DataFrame → 공유 arc 토폴로지로 직렬화 (이웃 법정동 공유 경계는 한 번만, 1mm 격자 int32 차분)
+        면적/중심은 스냅 전 좌표로 계산한 값을 그대로 저장
+        """
+        topology = Topology.from_polygons(PackedPolygons.from_geometries(df["geometry"]))
+        return {
+            "legald_cd": df["legald_cd"].to_numpy().astype(str),
+            "name":      df["name"].to_numpy().astype(str),
+            "area":      df["area"].to_numpy(dtype=np.float64),
+            "centroid":  np.array(df["centroid"].to_list(), dtype=np.float64).reshape(-1, 2),
+            **topology.to_arrays(),
+        }
+
+    def _arrays_to_df(self, arrays: dict) -> pd.DataFrame:
+        """캐시 배열 → DataFrame (arc를 한 번에 이어 붙여 복원, 피처 geometry는 view)"""
+        return self._packed_to_df(
+            Topology.from_arrays(arrays).to_polygons(),
+            arrays["legald_cd"], arrays["name"], arrays["area"], arrays["centroid"],
+        )
 
     def _get_wfs_url(self, params: dict):
         query_string = "&".join([f"{key}={value}" for key, value in params.items()])
         full_url = f"{self.wfs_url}?{query_string}"
         return full_url
 
-    def _get_geocoder_url(self, params: dict):
-        query_string = "&".join([f"{key}={value}" for key, value in params.items()])
-        full_url = f"{self.geocoder_url}?{query_string}"
-        return full_url
-
     def _fetch_json(self, url: str):
-        response = requests.get(url)
+        response = self.transport.get(url)
         if response.status_code != 200:
             raise ValueError(f"HTTP Error {response.status_code} for URL: {url}")
 
@@ -166,14 +171,13 @@ class VworldOpenAPIParser:
             print(response.text[:500])
             raise ValueError("Invalid JSON returned from server")
 
-    def _address_to_coord(self, address: str):
-        params = self.geocoder_params.copy()
-        params["address"] = address
-        url = self._get_geocoder_url(params)
-        data = self._fetch_json(url)
-        x_coord = data["response"]["result"]["point"]["x"]
-        y_coord = data["response"]["result"]["point"]["y"]
-        return tuple(map(float, [x_coord, y_coord]))
+    def _addresses_to_coords(self, *addresses: str):
+        """여러 주소를 동시에 지오코딩"""
+        coords = self.geocoder.geocode_many(addresses)
+        for address, coord in zip(addresses, coords):
+            if coord is None:
+                raise ValueError(f"Address not found: {address}")
+        return coords
 
     def _get_district_boundary_data(self, start_index, count, ymin, xmin, ymax, xmax):
         params = self.wfs_params.copy()
@@ -189,62 +193,25 @@ class VworldOpenAPIParser:
         address1: str,
         address2: str,
         batch_size: int = 1000,
-        start: int = 0,
-        end: Optional[int] = 1000,
-        max_rows: Optional[int] = None,
+        concurrency: int = 4,
+        max_depth: int = 6,
         verbose: bool = False,
     ):
-        first_end = (
-            start + batch_size - 1 if end is None else min(end, start + batch_size - 1)
-        )
-        xmin, ymin = self._address_to_coord(address1)
-        xmax, ymax = self._address_to_coord(address2)
-        first_batch = self._get_district_boundary_data(
-            start, batch_size, ymin, xmin, ymax, xmax
+        """
+        두 주소가 만드는 bbox 전체를 쿼드트리 타일로 나눠 수집.
+        반환 형태는 FeatureCollection 목록 (피처는 emd_cd로 중복 제거됨)
+        """
+        (xmin, ymin), (xmax, ymax) = self._addresses_to_coords(address1, address2)
+        bbox = (min(xmin, xmax), min(ymin, ymax), max(xmin, xmax), max(ymin, ymax))
+
+        harvester = WfsTileHarvester(
+            lambda start, count, b: self._get_district_boundary_data(
+                start, count, b[1], b[0], b[3], b[2]
+            ),
+            page_size=batch_size,
+            max_depth=max_depth,
+            concurrency=concurrency,
+            verbose=verbose,
         )
-        records = []
-        records.append(first_batch)
-
-        if verbose:
-            print(
-                f"[INFO] fetched {len(first_batch)} rows (start={start} ~ end={first_end})"
-            )
-
-        # 다음 페이지부터 루프
-        fetched = len(first_batch)
-        next_start = first_end + 1
-
-        while True:
-            # 종료 조건 1: end(명시된 구간 끝)에 도달
-            if end is not None and next_start > end:
-                break
-
-            next_end = next_start + batch_size - 1
-            if end is not None:
-                next_end = min(next_end, end)
-
-            batch = self._get_district_boundary_data(
-                next_start, batch_size, ymin, xmin, ymax, xmax
-            )
-
-            if verbose:
-                print(
-                    f"[INFO] fetched {len(batch)} rows (start={next_start} ~ end={next_end})"
-                )
-
-            # 종료 조건 2: 더 이상 데이터가 안 나옴 (total_count를 못 얻은 경우 유용)
-            if not batch:
-                break
-
-            records.append(batch)
-            fetched += len(batch)
-
-            # 종료 조건 3: max_rows 상한
-            if max_rows is not None and fetched >= max_rows:
-                if verbose:
-                    print(f"[INFO] reached max_rows={max_rows}, stop.")
-                break
-
-            # 다음 루프 준비
-            next_start = next_end + 1
-        return records
+        features = harvester.harvest(bbox)
+        return [{"type": "FeatureCollection", "features": features}]
@@ -0,0 +1,199 @@
+#! python3
+# venv: JAH
+
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.utils.api.http_transport import HttpTransport, get_default_transport
+from src.utils.api.rate_limiter import RateLimiter
+
+Coord = Tuple[float, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    address TEXT PRIMARY KEY,
+    x       REAL,
+    y       REAL,
+    found   INTEGER NOT NULL,
+    type    TEXT,
+    updated REAL NOT NULL
+)
+"""
+
+
+class GeocodeError(RuntimeError):
+    """
+    geocode_many에서 일부 주소 요청이 실패함 (나머지 주소는 해석/캐시가 끝난 상태)
+
+    errors: {입력 주소: 예외}, coords: 입력 순서대로 (x, y) 또는 None (실패한 주소는 None)
+    """
+
+    def __init__(self, errors: Dict[str, BaseException], coords: List[Optional[Coord]]):
+        self.errors = errors
+        self.coords = coords
+        detail = "; ".join(f"{a}: {e}" for a, e in list(errors.items())[:3])
+        super().__init__(f"Geocoding failed for {len(errors)} address(es): {detail}")
+
+
+def normalize_address(address: str) -> str:
+    """NFC 정규화 + 공백/쉼표 정리 (캐시 키)"""
+    text = unicodedata.normalize("NFC", address or "")
+    text = text.replace(",", " ")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class VworldGeocoder:
+    """
+    vworld.kr 주소 -> 좌표 (EPSG:4326)
+
+    - 정규화한 주소를 키로 SQLite에 영구 캐시
+    - 찾지 못한 주소(NOT_FOUND)도 negative_ttl_days 동안 캐시 (재요청 방지)
+      — 그 외 오류 응답은 캐시하지 않고 예외
+    - 도로명(road)으로 실패하면 지번(parcel)으로 재시도
+    - geocode_many: 중복 제거 후 캐시 미스만 스레드 풀 + 레이트 리미터로 병렬 요청
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        transport: Optional[HttpTransport] = None,
+        cache_path: Optional[Path] = None,
+        negative_ttl_days: float = 7,
+        concurrency: int = 8,
+        rate_limit: Optional[float] = 20.0,
+        url: str = "https://api.vworld.kr/req/address",
+    ):
+        self.api_key = api_key
+        self.transport = transport or get_default_transport()
+        self.negative_ttl_days = negative_ttl_days
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.url = url
+
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if cache_path is not None:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(cache_path), check_same_thread=False)
+            self._db.execute(_SCHEMA)
+            self._db.commit()
+
+    # ---------- cache ----------
+
+    def _cache_get(self, key: str) -> Tuple[bool, Optional[Coord]]:
+        """(캐시 적중 여부, 좌표 또는 None)"""
+        if self._db is None:
+            return False, None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT x, y, found, updated FROM geocode WHERE address = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return False, None
+        x, y, found, updated = row
+        if found:
+            return True, (x, y)
+        if (time.time() - updated) / 86400 < self.negative_ttl_days:
+            return True, None
+        return False, None
+
+    def _cache_put_many(self, rows: List[Tuple[str, Optional[Coord], Optional[str]]]) -> None:
+        if self._db is None or not rows:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (key, *(coord or (None, None)), int(coord is not None), typ, now)
+                    for key, coord, typ in rows
+                ],
+            )
+            self._db.commit()
+
+    # ---------- api ----------
+
+    def _request(self, address: str, addr_type: str) -> Optional[Coord]:
+        if self.limiter is not None:
+            self.limiter.acquire()
+        params = {
+            "service": "address",
+            "request": "getcoord",
+            "crs": "EPSG:4326",
+            "address": address,
+            "format": "json",
+            "type": addr_type,
+            "key": self.api_key,
+        }
+        resp = self.transport.get(self.url, params=params)
+        if resp.status_code != 200:
+            raise ValueError(f"HTTP Error {resp.status_code} for URL: {resp.url}")
+        data = resp.json().get("response", {})
+        status = data.get("status")
+        if status == "NOT_FOUND":
+            return None
+        if status != "OK":
+            error = data.get("error") or {}
+            raise RuntimeError(
+                f"Geocoder {status} for {address!r} ({addr_type}): "
+                f"{error.get('code', '')} {error.get('text', '')}".rstrip()
+            )
+        point = data["result"]["point"]
+        return float(point["x"]), float(point["y"])
+
+    def _resolve(self, address: str) -> Tuple[Optional[Coord], Optional[str]]:
+        for addr_type in ("road", "parcel"):
+            coord = self._request(address, addr_type)
+            if coord is not None:
+                return coord, addr_type
+        return None, None
+
+    def geocode(self, address: str) -> Optional[Coord]:
+        """주소 하나 -> (x, y) 또는 None"""
+        return self.geocode_many([address])[0]
+
+    def geocode_many(self, addresses: Sequence[str]) -> List[Optional[Coord]]:
+        """
+        주소 목록 -> 입력 순서대로 (x, y) 또는 None
+
+        요청이 실패한 주소가 있어도 나머지는 끝까지 해석/캐시한 뒤 GeocodeError로 모아서 알린다
+        """
+        keys = [normalize_address(a) for a in addresses]
+        resolved: Dict[str, Optional[Coord]] = {}
+        misses = []
+        for key in dict.fromkeys(keys):
+            hit, coord = self._cache_get(key)
+            if hit:
+                resolved[key] = coord
+            else:
+                misses.append(key)
+
+        failed: Dict[str, BaseException] = {}
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(misses))) as pool:
+                futures = {key: pool.submit(self._resolve, key) for key in misses}
+            results = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    failed[key] = e
+            self._cache_put_many([(key, coord, typ) for key, (coord, typ) in results.items()])
+            resolved.update((key, coord) for key, (coord, _) in results.items())
+
+        coords = [resolved.get(k) for k in keys]
+        if failed:
+            errors = {a: failed[k] for a, k in zip(addresses, keys) if k in failed}
+            raise GeocodeError(errors, coords)
+        return coords
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,105 @@
+#! python3
+# venv: JAH
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.utils.api.rate_limiter import RateLimiter
+
+BBox = Tuple[float, float, float, float]  # (xmin, ymin, xmax, ymax)
+
+
+class WfsTileHarvester:
+    """
+    쿼드트리 타일 분할 WFS 수집기
+
+    - 타일의 numberMatched가 tile_cap을 넘으면 4분할 (max_depth까지)
+    - 분할하지 않는 타일은 numberMatched/numberReturned 기준으로 STARTINDEX 페이지네이션
+    - 같은 깊이의 타일들은 bounded 스레드 풀로 동시에 요청
+    - 타일 경계에 걸친 피처는 key_field(emd_cd)로 중복 제거 (먼저 나온 것 유지)
+
+    fetch_page(start_index, count, bbox) -> GeoJSON FeatureCollection dict
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int, BBox], dict],
+        page_size: int = 1000,
+        tile_cap: Optional[int] = None,
+        max_depth: int = 6,
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+        key_field: str = "emd_cd",
+        verbose: bool = False,
+    ):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.tile_cap = tile_cap or page_size
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.key_field = key_field
+        self.verbose = verbose
+
+    def _fetch(self, start_index: int, bbox: BBox) -> dict:
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return self.fetch_page(start_index, self.page_size, bbox)
+
+    @staticmethod
+    def _split(bbox: BBox) -> List[BBox]:
+        xmin, ymin, xmax, ymax = bbox
+        xm, ym = (xmin + xmax) / 2, (ymin + ymax) / 2
+        return [
+            (xmin, ymin, xm, ym),
+            (xm, ymin, xmax, ym),
+            (xmin, ym, xm, ymax),
+            (xm, ym, xmax, ymax),
+        ]
+
+    def _process_tile(self, tile: Tuple[BBox, int]) -> Tuple[List[dict], List[Tuple[BBox, int]]]:
+        """타일 하나 처리 -> (수집한 피처, 더 쪼갤 하위 타일)"""
+        bbox, depth = tile
+        page = self._fetch(0, bbox)
+        features = list(page.get("features") or [])
+        returned = page.get("numberReturned", len(features))
+        matched = page.get("numberMatched")
+
+        over_cap = (matched is not None and matched > self.tile_cap) or (
+            matched is None and returned >= self.page_size
+        )
+        if over_cap and depth < self.max_depth:
+            return [], [(b, depth + 1) for b in self._split(bbox)]
+
+        start = returned
+        while returned > 0 and (matched is None or start < matched):
+            page = self._fetch(start, bbox)
+            batch = page.get("features") or []
+            returned = page.get("numberReturned", len(batch))
+            if not batch:
+                break
+            features.extend(batch)
+            start += returned
+        return features, []
+
+    def harvest(self, bbox: BBox) -> List[dict]:
+        """bbox 전체 피처 (중복 제거, 타일 순서로 결정적)"""
+        seen: Dict[str, None] = {}
+        result: List[dict] = []
+        pending = [(bbox, 0)]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while pending:
+                outputs = list(pool.map(self._process_tile, pending))
+                pending = []
+                for features, subtiles in outputs:
+                    pending.extend(subtiles)
+                    for feat in features:
+                        key = (feat.get("properties") or {}).get(self.key_field)
+                        if key is None:
+                            result.append(feat)
+                        elif key not in seen:
+                            seen[key] = None
+                            result.append(feat)
+                if self.verbose:
+                    print(f"[INFO] harvested {len(result)} features, {len(pending)} tiles to split")
+        return result
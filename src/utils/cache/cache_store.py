@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """같은 디렉터리 임시 파일에 쓴 뒤 os.replace로 교체"""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, str(path))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def npz_bytes(arrays: Dict[str, np.ndarray]) -> bytes:
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **arrays)
+    return buf.getvalue()
+
+
+def frame_to_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """숫자 컬럼은 그대로, 그 외 컬럼은 유니코드 배열로"""
+    arrays = {"__columns__": np.array([str(c) for c in df.columns])}
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        if values.dtype.kind not in "biuf":
+            values = values.astype(str)
+        arrays[f"c{i}"] = values
+    return arrays
+
+
+def arrays_to_frame(arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+    import pandas as pd
+
+
+
+    columns = arrays["__columns__"].tolist()
+    return pd.DataFrame({col: arrays[f"c{i}"] for i, col in enumerate(columns)})
+
+
+class CacheStore:
+    """
+    내용 주소 기반 온디스크 캐시
+
+    - 키: (endpoint, params, schema_version)의 sha256
+    - 값: 컬럼형 압축 NumPy(.npz) 페이로드
+    - 임시 파일 + os.replace 원자적 쓰기
+    - TTL(생성 시각 기준) + 총 용량 상한 LRU 축출(마지막 접근 시각 기준)
+    - hit/miss/expired/eviction 통계 (프로세스별)
+
+    항목별 메타데이터는 공유 인덱스 파일 없이 각 .npz 파일 자체에 둔다.
+    생성 시각 = mtime (쓴 뒤 바뀌지 않음), 마지막 접근 = atime (적중 때 os.utime으로 기록), 크기 = st_size.
+    여러 프로세스(Grasshopper, 데몬, CLI)가 같은 디렉터리를 써도 서로의 갱신을 덮어쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        ttl_days: Optional[float] = 30,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.root = Path(root)
+        self.ttl_days = ttl_days
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[dict] = None, schema_version: int = 1) -> str:
+        payload = json.dumps(
+            {"endpoint": endpoint, "params": params or {}, "schema": schema_version},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ---------- entries ----------
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.npz"
+
+    def _stat(self, key: str) -> Optional[os.stat_result]:
+        try:
+            return self._path(key).stat()
+        except FileNotFoundError:
+            return None
+
+    def _expired(self, st: os.stat_result) -> bool:
+        return self.ttl_days is not None and (time.time() - st.st_mtime) / 86400 >= self.ttl_days
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.root.glob("*.npz"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                pass  # 다른 프로세스가 방금 지움
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(st.st_size for _, st in entries)
+        for path, st in sorted(entries, key=lambda e: e[1].st_atime):
+            if total <= self.max_bytes:
+                break
+            total -= st.st_size
+            path.unlink(missing_ok=True)
+            self._counters["evictions"] += 1
+
+    # ---------- arrays ----------
+
+    def get_arrays(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        path = self._path(key)
+        st = self._stat(key)
+        if st is not None and self._expired(st):
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._counters["expired"] += 1
+            st = None
+        try:
+            if st is None:
+                raise FileNotFoundError(path)
+            with np.load(str(path), allow_pickle=False) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+            os.utime(str(path), (time.time(), st.st_mtime))
+        except FileNotFoundError:
+            # 없거나, 읽는 사이 다른 프로세스가 축출함
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+        with self._lock:
+            self._counters["hits"] += 1
+        return arrays
+
+    def put_arrays(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        atomic_write(self._path(key), npz_bytes(arrays))
+        with self._lock:
+            self._evict()
+
+    # ---------- frames / bytes ----------
+
+    def get_frame(self, key: str) -> Optional[pd.DataFrame]:
+        arrays = self.get_arrays(key)
+        return None if arrays is None else arrays_to_frame(arrays)
+
+    def put_frame(self, key: str, df: pd.DataFrame) -> None:
+        self.put_arrays(key, frame_to_arrays(df))
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        arrays = self.get_arrays(key)
+        return None if arrays is None else arrays["data"].tobytes()
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        self.put_arrays(key, {"data": np.frombuffer(data, dtype=np.uint8)})
+
+    # ---------- maintenance ----------
+
+    def remaining_days(self, key: str) -> Optional[float]:
+        """만료까지 남은 일수 (항목이 없거나 TTL이 없으면 None)"""
+        st = self._stat(key)
+        if st is None or self.ttl_days is None:
+            return None
+        return self.ttl_days - (time.time() - st.st_mtime) / 86400
+
+    def invalidate(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(entries),
+                "bytes": sum(st.st_size for _, st in entries),
+            }
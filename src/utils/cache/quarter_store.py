@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.cache.cache_store import arrays_to_frame, atomic_write, frame_to_arrays, npz_bytes
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_MANIFEST_NAME = "manifest.json"
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """파티션 내용 해시 (컬럼, dtype, 행 순서 포함)"""
+    h = hashlib.sha256()
+    for name, values in frame_to_arrays(df).items():
+        h.update(f"{name}:{values.dtype.str}:{len(values)}".encode("utf-8"))
+        h.update(np.ascontiguousarray(values).tobytes())
+    return h.hexdigest()
+
+
+class QuarterPartitionStore:
+    """
+    분기(stdr_yyqu_cd)별 파티션 로컬 저장소 — 서비스 하나당 디렉터리 하나
+
+    root/
+      manifest.json         {"total_count", "order", "quarters": {분기: 행 수},
+                             "files": {분기: 파일명}, "digests": {분기: sha256}, "refreshed"}
+      20241.<digest>.npz    분기별 원본 행 (문자열 컬럼, API 응답 순서)
+
+    refresh()는 list_total_count 차이만큼의 새 행만 받아 해당 분기 파티션에 덧붙이고,
+    총량이 같으면 최신 분기 파티션을 다시 받아 해시로 수정 여부를 확인한다.
+    새 파티션 파일을 모두 쓴 뒤 manifest를 마지막에 교체하므로, 수집이 실패하거나
+    중간에 끊기면 이전 manifest와 파티션이 그대로 남는다.
+    """
+
+    def __init__(self, root: Path, quarter_col: str = "STDR_YYQU_CD"):
+        self.root = Path(root)
+        self.quarter_col = quarter_col
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest = self._read_manifest()
+
+    # ---------- manifest / partitions ----------
+
+    @staticmethod
+    def _empty_manifest() -> dict:
+        return {
+            "total_count": 0, "order": None, "quarters": {}, "files": {}, "digests": {},
+            "refreshed": 0.0,
+        }
+
+    def _read_manifest(self) -> dict:
+        manifest = self._empty_manifest()
+        path = self.root / _MANIFEST_NAME
+        if path.exists():
+            with open(str(path), "r", encoding="utf-8") as f:
+                manifest.update(json.load(f))
+        return manifest
+
+    def _read_partition(self, quarter: str) -> pd.DataFrame:
+        with np.load(str(self.root / self.manifest["files"][quarter]), allow_pickle=False) as npz:
+            return arrays_to_frame({name: npz[name] for name in npz.files})
+
+    def _stage_partition(self, manifest: dict, quarter: str, df: pd.DataFrame) -> None:
+        """내용 해시 이름의 새 파일로 파티션을 쓰고 manifest(아직 미기록)에 반영"""
+        digest = _frame_digest(df)
+        name = f"{quarter}.{digest[:16]}.npz"
+        if not (self.root / name).exists():
+            atomic_write(self.root / name, npz_bytes(frame_to_arrays(df)))
+        manifest["quarters"][quarter] = len(df)
+        manifest["files"][quarter] = name
+        manifest["digests"][quarter] = digest
+
+    def _commit(self, manifest: dict) -> None:
+        """manifest 교체 후 더 이상 참조되지 않는 파티션 파일 삭제"""
+        manifest["refreshed"] = time.time()
+        data = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+        atomic_write(self.root / _MANIFEST_NAME, data)
+        self.manifest = manifest
+        live = set(manifest["files"].values())
+        for path in self.root.glob("*.npz"):
+            if path.name not in live:
+                path.unlink(missing_ok=True)
+
+    @property
+    def quarters(self) -> List[str]:
+        return sorted(self.manifest["quarters"])
+
+    def age_days(self) -> float:
+        return (time.time() - self.manifest["refreshed"]) / 86400
+
+    def _spans(self, manifest: dict) -> Dict[str, Tuple[int, int]]:
+        """분기 -> API 행 구간 (1부터, 양 끝 포함). order가 없으면 빈 dict"""
+        if manifest["order"] not in ("asc", "desc"):
+            return {}
+        spans, start = {}, 1
+        for quarter in sorted(manifest["quarters"], reverse=manifest["order"] == "desc"):
+            end = start + manifest["quarters"][quarter] - 1
+            spans[quarter] = (start, end)
+            start = end + 1
+        return spans
+
+    # ---------- refresh ----------
+
+    @staticmethod
+    def _fetch(
+        parser, service_name: str, page_size: int, start: int = 1, end: Optional[int] = None
+    ) -> pd.DataFrame:
+        import pandas as pd
+
+        return pd.concat(
+            list(parser.iter_dataframes(service_name, page_size=page_size, start=start, end=end)),
+            ignore_index=True,
+        )
+
+    def _split(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """분기별로 나눔 (행 순서 유지)"""
+        keys = df[self.quarter_col].astype(str)
+        return {str(q): part.reset_index(drop=True) for q, part in df.groupby(keys, sort=False)}
+
+    def _order(self, df: pd.DataFrame) -> Optional[str]:
+        keys = df[self.quarter_col].astype(str)
+        if keys.is_monotonic_decreasing:
+            return "desc"
+        if keys.is_monotonic_increasing:
+            return "asc"
+        return None
+
+    def _verify(self, parser, service_name: str, manifest: dict, page_size: int, verify: int):
+        """
+        총량이 같을 때 최신 verify개 분기 파티션을 다시 받아 해시 비교, 바뀐 파티션만 교체
+        Returns: (mode, 바뀐 분기, 받은 행 수) — 행 위치가 맞지 않으면 mode="full"
+        """
+        spans = self._spans(manifest)
+        revised, fetched = [], 0
+        for quarter in sorted(manifest["quarters"])[-verify:] if verify > 0 else []:
+            start, end = spans[quarter]
+            df = self._fetch(parser, service_name, page_size, start, end)
+            fetched += len(df)
+            parts = self._split(df)
+            if len(df) != end - start + 1 or list(parts) != [quarter]:
+                return "full", [], fetched
+            if _frame_digest(parts[quarter]) != manifest["digests"].get(quarter):
+                self._stage_partition(manifest, quarter, parts[quarter])
+                revised.append(quarter)
+        return ("revised" if revised else "noop"), revised, fetched
+
+    def refresh(
+        self,
+        parser,
+        service_name: str,
+        page_size: int = 1000,
+        verify: int = 1,
+        verbose: bool = False,
+    ) -> dict:
+        """
+        증분 갱신. 새 분기 행은 응답의 맨 앞(최신순) 또는 맨 뒤(과거순)에 붙는다고 보고
+        head/tail 한 건으로 방향을 판단해 그 구간만 받는다. 과거 행이 바뀌었거나
+        (총량 감소, 새 구간에 기존보다 오래된 분기 포함) 판단이 안 되면 전체 재수집.
+        총량이 같으면 최신 verify개 분기 파티션을 다시 받아 행 수/해시가 바뀐 것만 교체한다.
+
+        Returns: {"mode": "noop"|"revised"|"incremental"|"full", "fetched_rows", "quarters"}
+        """
+        import pandas as pd
+
+        total = parser.get_total_count(service_name) or 0
+        stored = self.manifest["total_count"]
+        n_new = total - stored
+        newest = self.quarters[-1] if self.quarters else None
+        manifest = json.loads(json.dumps(self.manifest))
+
+        mode, window, order = "full", None, None
+        touched: List[str] = []
+        fetched = 0
+        if newest is not None and n_new == 0 and self._spans(manifest):
+            mode, touched, fetched = self._verify(parser, service_name, manifest, page_size, verify)
+        elif newest is not None and n_new > 0:
+            head = parser.to_dataframe(service_name, 1, 1)
+            if not head.empty and str(head[self.quarter_col].iloc[0]) > newest:
+                mode, window, order = "incremental", (1, n_new), "desc"
+            else:
+                tail = parser.to_dataframe(service_name, total, total)
+                if not tail.empty and str(tail[self.quarter_col].iloc[0]) >= newest:
+                    mode, window, order = "incremental", (stored + 1, total), "asc"
+
+        if mode == "incremental":
+            df = self._fetch(parser, service_name, page_size, *window)
+            if len(df) != n_new or (df[self.quarter_col].astype(str) < newest).any():
+                mode = "full"
+            else:
+                for quarter, part in self._split(df).items():
+                    if quarter in manifest["quarters"]:
+                        old = self._read_partition(quarter)
+                        # 파티션 행 순서를 API 응답 순서와 맞춘다 (verify 해시 비교용)
+                        pair = [part, old] if order == "desc" else [old, part]
+                        part = pd.concat(pair, ignore_index=True)
+                    self._stage_partition(manifest, quarter, part)
+                    touched.append(quarter)
+                manifest["order"] = order
+                fetched = len(df)
+        if mode == "full":
+            df = self._fetch(parser, service_name, page_size)
+            manifest = self._empty_manifest()
+            manifest["order"] = self._order(df)
+            for quarter, part in self._split(df).items():
+                self._stage_partition(manifest, quarter, part)
+            touched = sorted(manifest["quarters"])
+            fetched = total = len(df)
+
+        manifest["total_count"] = total
+        self._commit(manifest)
+        if verbose:
+            print(f"[INFO] {service_name} refresh={mode}, rows={fetched}, quarters={sorted(touched)}")
+        return {"mode": mode, "fetched_rows": fetched, "quarters": sorted(touched)}
+
+    # ---------- load ----------
+
+    def load(
+        self, quarters: Optional[Sequence[str]] = None, window: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        quarters: 지정 분기들만, window: 최신 N개 분기 (둘 다 없으면 전체)
+        저장소에 없는 분기만 지정하면 빈 DataFrame
+        """
+        import pandas as pd
+
+        if window is not None and window <= 0:
+            raise ValueError(f"window must be a positive number of quarters, got {window}")
+        selected = self.quarters
+        if quarters is not None:
+            wanted = {str(q) for q in quarters}
+            selected = [q for q in selected if q in wanted]
+        if window is not None:
+            selected = selected[-window:]
+        frames: Dict[str, pd.DataFrame] = {q: self._read_partition(q) for q in selected}
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames.values(), ignore_index=True)
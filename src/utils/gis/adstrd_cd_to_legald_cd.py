@@ -1,13 +1,145 @@
-import pandas as pd
+from __future__ import annotations
 
+import hashlib
+import io
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-def get_mapping_df(file_path) -> pd.DataFrame:
+import numpy as np
+
+from src.utils.cache.cache_store import atomic_write
+from src.utils.optional_deps import require
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 컴파일 산출물 구조가 바뀌면 올린다
+_COMPILED_VERSION = 1
+_DTYPE = np.dtype([("adstrd_cd", "<i8"), ("legald_cd", "<i8"), ("sido", "<i2")])
+
+
+@dataclass
+class CodeMapping:
+    """
+    행정동 <-> 법정동 다대다 매핑 (정수 코드, adstrd_cd 기준 정렬)
+
+    table은 np.load(mmap_mode="r")로 연 구조화 배열일 수 있다.
+    """
+
+    table: np.ndarray
+    sido_names: List[str]
+    _legald_order: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def adstrd_cd(self) -> np.ndarray:
+        return self.table["adstrd_cd"]
+
+    @property
+    def legald_cd(self) -> np.ndarray:
+        return self.table["legald_cd"]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def filter(self, sido: Optional[str]) -> "CodeMapping":
+        """시도명 접두어로 필터 (None이면 전체)"""
+        if sido is None:
+            return self
+        ids = [i for i, name in enumerate(self.sido_names) if name.startswith(sido)]
+        return CodeMapping(self.table[np.isin(self.table["sido"], ids)], self.sido_names)
+
+    def legald_for(self, adstrd_cd: int) -> np.ndarray:
+        lo, hi = np.searchsorted(self.adstrd_cd, [adstrd_cd, adstrd_cd + 1])
+        return np.asarray(self.legald_cd[lo:hi])
+
+    def adstrd_for(self, legald_cd: int) -> np.ndarray:
+        if self._legald_order is None:
+            self._legald_order = np.argsort(self.legald_cd, kind="stable")
+        keys = self.legald_cd[self._legald_order]
+        lo, hi = np.searchsorted(keys, [legald_cd, legald_cd + 1])
+        return np.asarray(self.adstrd_cd[self._legald_order[lo:hi]])
+
+    def to_frame(self) -> pd.DataFrame:
+        """solver 병합용 문자열 코드 DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame({
+            "adstrd_cd": self.adstrd_cd.astype(str),
+            "legald_cd": self.legald_cd.astype(str),
+        })
+
+
+def _file_hash(file_path: Path) -> str:
+    h = hashlib.sha256()
+    with open(str(file_path), "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _parse_xlsx(file_path: Path) -> CodeMapping:
+    """원본 엑셀 파싱 (openpyxl) -> CodeMapping"""
+    require("openpyxl", "Parsing the adstrd/legald mapping xlsx")
+    import pandas as pd
+
+    df = pd.read_excel(
+        file_path, engine="openpyxl", usecols=["시도명", "행정동코드", "법정동코드"]
+    )
+    df = df.dropna(subset=["행정동코드", "법정동코드"])
+    sido = df["시도명"].fillna("").astype(str)
+    sido_names = sorted(sido.unique())
+    sido_ids = {name: i for i, name in enumerate(sido_names)}
+
+    table = np.empty(len(df), dtype=_DTYPE)
+    # 10자리 코드의 끝 두 자리(00)를 떼어 8자리 코드로
+    table["adstrd_cd"] = df["행정동코드"].to_numpy(dtype=np.int64) // 100
+    table["legald_cd"] = df["법정동코드"].to_numpy(dtype=np.int64) // 100
+    table["sido"] = sido.map(sido_ids).to_numpy(dtype=np.int16)
+    table = table[np.argsort(table, order=("adstrd_cd", "legald_cd"), kind="stable")]
+    return CodeMapping(table, sido_names)
+
+
+def load_mapping(file_path, cache_dir: Optional[Path] = None) -> CodeMapping:
+    """
+    컴파일된 매핑 로드. 원본 파일 해시가 바뀌었거나 산출물이 없으면 다시 컴파일.
+    cache_dir가 없으면 매번 엑셀을 파싱한다.
+    """
+    file_path = Path(file_path)
+    if cache_dir is None:
+        return _parse_xlsx(file_path)
+
+    cache_dir = Path(cache_dir)
+    stem = f"{file_path.stem}.v{_COMPILED_VERSION}.{_file_hash(file_path)[:16]}"
+    table_path = cache_dir / f"{stem}.npy"
+    meta_path = cache_dir / f"{stem}.json"
+
+    if table_path.exists() and meta_path.exists():
+        with open(str(meta_path), "r", encoding="utf-8") as f:
+            sido_names = json.load(f)["sido_names"]
+        return CodeMapping(np.load(str(table_path), mmap_mode="r"), sido_names)
+
+    mapping = _parse_xlsx(file_path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # 임시 파일 + os.replace — 동시에 읽는 프로세스가 반쯤 쓴 파일을 보지 않도록, meta를 마지막에
+    buf = io.BytesIO()
+    np.save(buf, mapping.table)
+    atomic_write(table_path, buf.getvalue())
+    meta = json.dumps({"sido_names": mapping.sido_names}, ensure_ascii=False)
+    atomic_write(meta_path, meta.encode("utf-8"))
+    # 이전 해시의 산출물 정리 (다른 프로세스가 mmap으로 열고 있으면 남겨 둔다)
+    for old in cache_dir.glob(f"{file_path.stem}.v*.*"):
+        if old.suffix in (".npy", ".json") and not old.name.startswith(f"{stem}."):
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return mapping
+
+
+def get_mapping_df(
+    file_path, sido: Optional[str] = "서울", cache_dir: Optional[Path] = None
+) -> pd.DataFrame:
     """행정동 코드를 법정동 코드로 매핑하는 데이터프레임 반환"""
-    df = pd.read_excel(file_path, engine="openpyxl")
-    df = df[df["시도명"].str.startswith("서울", na=False)]
-    mapping = {"행정동코드": "adstrd_cd", "법정동코드": "legald_cd"}
-    df_grouped = df[list(mapping.keys())]
-    df_renamed = df_grouped.rename(columns=mapping)
-    cols = list(mapping.values())
-    df_renamed[cols] = df_renamed[cols].astype(str).apply(lambda col: col.str[:-2])
-    return df_renamed
+    return load_mapping(file_path, cache_dir).filter(sido).to_frame()
@@ -0,0 +1,140 @@
+"""
+행정동 -> 법정동 희소 가중치 크로스워크
+
+legald x adstrd CSR 행렬(행 합 = 1)을 한 번 만들어 두고,
+지표 여러 개를 (adstrd, k) 2차원 배열로 한 번에 재배분한다.
+평균/비율 지표는 행 정규화 가중 평균, 총량 지표(인구, 사업체 수 등)는 열 정규화로 나눠
+행정동 합계를 보존한다 (reallocate(extensive=True)).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class Crosswalk:
+    legald_codes: np.ndarray  # (L,) 행
+    adstrd_codes: np.ndarray  # (A,) 열 (정렬됨)
+    indptr: np.ndarray        # (L + 1,)
+    indices: np.ndarray       # (nnz,) 열 인덱스
+    weights: np.ndarray       # (nnz,) 행별 합이 1
+    overlap: np.ndarray       # (nnz,) 정규화 전 쌍별 가중치 (총량 배분용)
+
+    @classmethod
+    def from_pairs(
+        cls,
+        legald_cd: Sequence,
+        adstrd_cd: Sequence,
+        overlap: Optional[Sequence[float]] = None,
+    ) -> "Crosswalk":
+        """
+        (legald_cd, adstrd_cd) 쌍 -> 크로스워크
+
+        overlap이 없으면 균등 가중(기존 groupby mean과 동일),
+        있으면 쌍별 겹침 면적에 비례한 가중 (폴리곤 overlay 결과를 넣는다)
+        """
+        legald = np.asarray(legald_cd).astype(str)
+        adstrd = np.asarray(adstrd_cd).astype(str)
+        w = np.ones(len(legald)) if overlap is None else np.asarray(overlap, dtype=np.float64)
+
+        legald_codes, rows = np.unique(legald, return_inverse=True)
+        adstrd_codes, cols = np.unique(adstrd, return_inverse=True)
+
+        # 같은 (행, 열) 쌍은 가중치를 더해 하나로 (균등 가중이면 중복 횟수 = groupby mean과 동일)
+        pair = rows.astype(np.int64) * len(adstrd_codes) + cols
+        pair_u, inv = np.unique(pair, return_inverse=True)
+        w = np.bincount(inv, weights=w, minlength=len(pair_u))
+        rows, cols = pair_u // len(adstrd_codes), pair_u % len(adstrd_codes)
+
+        row_sum = np.bincount(rows, weights=w, minlength=len(legald_codes))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(row_sum[rows] > 0, w / row_sum[rows], 0.0)
+        indptr = np.zeros(len(legald_codes) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(rows, minlength=len(legald_codes)))
+        return cls(legald_codes, adstrd_codes, indptr, cols.astype(np.int64), normalized, w)
+
+    @classmethod
+    def from_frame(cls, mapping: pd.DataFrame, overlap_col: Optional[str] = None) -> "Crosswalk":
+        """
+        get_mapping_df 결과 (adstrd_cd, legald_cd[, overlap]) -> 크로스워크
+
+        overlap_col은 쌍별 겹침 면적 컬럼 (행정동/법정동 폴리곤 overlay 결과).
+        이 저장소에는 행정동 경계 폴리곤이 없어 면적 overlay를 만들 수 없으므로
+        solver는 overlap 없이 매핑 쌍 기준 균등 가중을 쓴다 (면적 가중이 아님)
+        """
+        overlap = None if overlap_col is None else mapping[overlap_col].to_numpy()
+        return cls.from_pairs(mapping["legald_cd"], mapping["adstrd_cd"], overlap)
+
+    @property
+    def shape(self):
+        return (len(self.legald_codes), len(self.adstrd_codes))
+
+    def align(self, adstrd_cd: Sequence, values: np.ndarray) -> np.ndarray:
+        """임의 순서의 (adstrd_cd, values) -> 열 순서 (A, k) 배열. 없는 행정동은 NaN"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values.reshape(len(values), -1)
+        out = np.full((len(self.adstrd_codes), values.shape[1]), np.nan)
+        codes = np.asarray(adstrd_cd).astype(str)
+        pos = np.searchsorted(self.adstrd_codes, codes)
+        pos = np.minimum(pos, len(self.adstrd_codes) - 1)
+        found = (len(self.adstrd_codes) > 0) & (self.adstrd_codes[pos] == codes)
+        out[pos[found]] = values[found]
+        return out
+
+    def shares(self) -> np.ndarray:
+        """(nnz,) 열(행정동)별 합이 1인 가중치 — 행정동 값이 각 법정동으로 가는 몫"""
+        col_sum = np.bincount(self.indices, weights=self.overlap, minlength=len(self.adstrd_codes))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(col_sum[self.indices] > 0, self.overlap / col_sum[self.indices], 0.0)
+
+    def reallocate(self, values: np.ndarray, extensive: bool = False) -> np.ndarray:
+        """
+        (A,) 또는 (A, k) -> (L,) 또는 (L, k) 희소 행렬 곱
+
+        평균(extensive=False): NaN 값은 건너뛰고 남은 가중치로 다시 정규화한다
+        (pandas mean과 동일). 연결된 값이 모두 NaN인 행은 NaN
+        총량(extensive=True): 행정동 값을 shares()로 나눠 더한다 — 매핑된 행정동의
+        합계가 보존된다. NaN은 0으로 본다
+        """
+        values = np.asarray(values, dtype=np.float64)
+        squeeze = values.ndim == 1
+        V = values.reshape(len(values), -1)
+        if extensive:
+            out = np.zeros((len(self.legald_codes), V.shape[1]))
+            nonempty = np.diff(self.indptr) > 0
+            if nonempty.any():
+                contrib = np.nan_to_num(V[self.indices]) * self.shares()[:, None]
+                out[nonempty] = np.add.reduceat(contrib, self.indptr[:-1][nonempty], axis=0)
+            return out[:, 0] if squeeze else out
+
+        gathered = V[self.indices]                       # (nnz, k)
+        valid = ~np.isnan(gathered)
+        w = self.weights[:, None] * valid
+        num = np.zeros((len(self.legald_codes), V.shape[1]))
+        den = np.zeros_like(num)
+        nonempty = np.diff(self.indptr) > 0
+        if nonempty.any():
+            starts = self.indptr[:-1][nonempty]
+            num[nonempty] = np.add.reduceat(np.where(valid, gathered, 0.0) * w, starts, axis=0)
+            den[nonempty] = np.add.reduceat(w, starts, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.where(den > 0, num / den, np.nan)
+        return out[:, 0] if squeeze else out
+
+    def to_frame(
+        self, values: np.ndarray, columns: Sequence[str], extensive: bool = False
+    ) -> pd.DataFrame:
+        """reallocate 결과 -> legald_cd + 지표 컬럼 DataFrame"""
+        import pandas as pd
+
+        out = self.reallocate(values, extensive).reshape(len(self.legald_codes), -1)
+        df = pd.DataFrame(out, columns=list(columns))
+        df.insert(0, "legald_cd", self.legald_codes)
+        return df
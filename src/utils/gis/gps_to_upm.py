@@ -1,5 +1,7 @@
 from math import sin, cos, tan, pi, sqrt
 
+import numpy as np
+
 
 RADIANS_PER_DEGREE = pi/180.0
 DEGREES_PER_RADIAN = 180.0/pi
@@ -19,6 +21,16 @@ UTM_E4 =   (UTM_E2*UTM_E2)
 UTM_E6 =   (UTM_E4*UTM_E2)
 UTM_EP2 =  (UTM_E2/(1-UTM_E2))
 
+# 배치 변환용 급수 계수 (점마다 다시 계산하지 않도록 모듈 로드 시 1회 계산)
+_M_C0 = 1 - UTM_E2/4 - 3*UTM_E4/64 - 5*UTM_E6/256
+_M_C2 = 3*UTM_E2/8 + 3*UTM_E4/32 + 45*UTM_E6/1024
+_M_C4 = 15*UTM_E4/256 + 45*UTM_E6/1024
+_M_C6 = 35*UTM_E6/3072
+_E1 = (1-sqrt(1-UTM_E2))/(1+sqrt(1-UTM_E2))
+_PHI_C2 = 3*_E1/2 - 27*_E1**3/32
+_PHI_C4 = 21*_E1**2/16 - 55*_E1**4/32
+_PHI_C6 = 151*_E1**3/96
+
 class GPStoUTM(object):
     def __init__(self, **kwargs):
         pass
@@ -215,3 +227,102 @@ class GPStoUTM(object):
         self.Long = self.LongOrigin + self.Long * DEGREES_PER_RADIAN
 
         return (self.Lat, self.Long)
+
+    def LLtoUTMArray(self, Lat, Long, ZoneNumber=None):
+        '''
+        Vectorized LLtoUTM. Takes lat/lon arrays, returns (easting, northing) arrays.
+        If ZoneNumber is None the zone is picked per point like LLtoUTM.
+        '''
+        lat = np.asarray(Lat, dtype=np.float64)
+        lon = np.asarray(Long, dtype=np.float64)
+
+        lon_temp = (lon+180) - np.trunc((lon+180)/360)*360 - 180
+        lat_rad = lat * RADIANS_PER_DEGREE
+        lon_rad = lon_temp * RADIANS_PER_DEGREE
+
+        if ZoneNumber is None:
+            zone = np.trunc((lon_temp+180)/6) + 1
+        else:
+            zone = float(ZoneNumber)
+        lon_origin_rad = ((zone-1)*6 - 180 + 3) * RADIANS_PER_DEGREE
+
+        sin_lat = np.sin(lat_rad)
+        cos_lat = np.cos(lat_rad)
+        tan_lat = np.tan(lat_rad)
+
+        N = WGS84_A / np.sqrt(1 - UTM_E2*sin_lat*sin_lat)
+        T = tan_lat*tan_lat
+        C = UTM_EP2*cos_lat*cos_lat
+        A = cos_lat*(lon_rad - lon_origin_rad)
+        M = WGS84_A*(_M_C0*lat_rad - _M_C2*np.sin(2*lat_rad)
+            + _M_C4*np.sin(4*lat_rad) - _M_C6*np.sin(6*lat_rad))
+
+        A2 = A*A
+        A3 = A2*A
+        A4 = A2*A2
+        easting = UTM_K0*N*(A + (1-T+C)*A3/6 + (5-18*T+T*T+72*C-58*UTM_EP2)
+            *A4/120) + UTM_FE
+        northing = UTM_K0*(M + N*tan_lat*(A2/2 + (5-T+9*C+4*C*C)*A4/24
+            + (61-58*T+T*T+600*C-330*UTM_EP2)*A4*A2/720))
+        northing = np.where(lat < 0, northing + UTM_FN_S, northing)
+
+        return (easting, northing)
+
+    def UTMtoLLArray(self, UTMNorthing, UTMEasting, UTMNumber, UTMLetter):
+        '''
+        Vectorized UTMtoLL. Takes northing/easting arrays of a single zone,
+        returns (lat, lon) arrays.
+        '''
+        x = np.asarray(UTMEasting, dtype=np.float64) - UTM_FE
+        y = np.asarray(UTMNorthing, dtype=np.float64)
+        if UTMLetter < 'N':
+            y = y - UTM_FN_S
+
+        long_origin = (int(UTMNumber) - 1)*6 - 180 + 3
+
+        mu = (y/UTM_K0) / (WGS84_A*_M_C0)
+        phi1 = mu + _PHI_C2*np.sin(2*mu) + _PHI_C4*np.sin(4*mu) \
+            + _PHI_C6*np.sin(6*mu)
+
+        sin_phi1 = np.sin(phi1)
+        cos_phi1 = np.cos(phi1)
+        tan_phi1 = np.tan(phi1)
+        w = 1 - UTM_E2*sin_phi1*sin_phi1
+
+        N1 = WGS84_A/np.sqrt(w)
+        T1 = tan_phi1*tan_phi1
+        C1 = UTM_EP2*cos_phi1*cos_phi1
+        R1 = WGS84_A*(1-UTM_E2)/(w*np.sqrt(w))
+        D = x/(N1*UTM_K0)
+
+        D2 = D*D
+        D4 = D2*D2
+        lat = phi1 - (N1*tan_phi1/R1)*(D2/2 - (5+3*T1+10*C1-4*C1*C1-9*UTM_EP2)
+            *D4/24 + (61+90*T1+298*C1+45*T1*T1-252*UTM_EP2-3*C1*C1)*D4*D2/720)
+        lon = (D - (1+2*T1+C1)*D2*D/6 + (5-2*C1+28*T1-3*C1*C1+8*UTM_EP2
+            +24*T1*T1)*D4*D/120) / cos_phi1
+
+        return (lat*DEGREES_PER_RADIAN, long_origin + lon*DEGREES_PER_RADIAN)
+
+    def LLtoUTMRing(self, coords, ZoneNumber=None):
+        '''
+        GeoJSON ring ([[lon, lat], ...]) -> (n, 2) UTM array in one pass.
+        '''
+        arr = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        x, y = self.LLtoUTMArray(arr[:, 1], arr[:, 0], ZoneNumber)
+        return np.column_stack((x, y))
+
+    def LLtoUTMRings(self, rings, ZoneNumber=None):
+        '''
+        Many GeoJSON rings -> ((N, 2) UTM array, offsets). Ring i is
+        xy[offsets[i]:offsets[i+1]]. All vertices are projected in a single call.
+        '''
+        arrays = [np.asarray(r, dtype=np.float64).reshape(-1, 2) for r in rings]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        if arrays:
+            offsets[1:] = np.cumsum([len(a) for a in arrays])
+            lonlat = np.concatenate(arrays)
+        else:
+            lonlat = np.empty((0, 2), dtype=np.float64)
+        x, y = self.LLtoUTMArray(lonlat[:, 1], lonlat[:, 0], ZoneNumber)
+        return np.column_stack((x, y)), offsets
@@ -0,0 +1,136 @@
+"""
+IDW(역거리 가중) 보간 — IDWVisualizer.cs의 SpatialField를 헤드리스로 옮긴 것
+
+solver.run()의 centroids / avg_incomes와 메시 정점 배열을 받아
+정점별 보간값 1차원 배열을 반환한다 (입력 순서 유지).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from src.utils.optional_deps import has_module
+
+
+def _as_xy(points) -> np.ndarray:
+    arr = np.asarray(points, dtype=np.float64)
+    if arr.size == 0:
+        return np.empty((0, 2))
+    return arr.reshape(-1, arr.shape[-1])[:, :2]
+
+
+def _weighted(d2: np.ndarray, vals: np.ndarray, power: float) -> np.ndarray:
+    """d2: (q, k) 제곱거리, vals: (q, k) 값. 거리 0이면 해당 값을 그대로 사용"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = 1.0 / d2 if power == 2 else d2 ** (-0.5 * power)  # inf -> 0
+        exact = d2 == 0
+        hit = exact.any(axis=1)
+        w[hit] = exact[hit]
+        num = np.einsum("ij,ij->i", w, vals)
+        den = w.sum(axis=1)
+        return np.where(den > 0, num / den, np.nan)
+
+
+def _idw_chunk(
+    sources: np.ndarray,
+    values: np.ndarray,
+    queries: np.ndarray,
+    power: float,
+    k: Optional[int],
+    radius: Optional[float],
+) -> np.ndarray:
+    dx = queries[:, 0, None] - sources[None, :, 0]
+    dy = queries[:, 1, None] - sources[None, :, 1]
+    d2 = dx * dx + dy * dy
+    vals = np.broadcast_to(values, d2.shape)
+    if k is not None and k < len(sources):
+        idx = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        d2 = np.take_along_axis(d2, idx, axis=1)
+        vals = values[idx]
+    if radius is not None:
+        d2 = np.where(d2 <= radius * radius, d2, np.inf)
+    return _weighted(d2, vals, power)
+
+
+def _idw_tree_chunk(tree, values, queries, power, k, radius) -> np.ndarray:
+    dist, idx = tree.query(
+        queries, k=k, distance_upper_bound=np.inf if radius is None else radius
+    )
+    dist = dist.reshape(len(queries), -1)
+    idx = idx.reshape(len(queries), -1)
+    found = idx < len(values)  # 반경 밖 이웃은 idx == n
+    vals = np.where(found, values[np.minimum(idx, len(values) - 1)], 0.0)
+    d2 = np.where(found, dist * dist, np.inf)
+    return _weighted(d2, vals, power)
+
+
+def idw(
+    sources,
+    values,
+    queries,
+    power: float = 2.0,
+    k: Optional[int] = None,
+    radius: Optional[float] = None,
+    chunk_size: int = 8192,
+    workers: int = 1,
+) -> np.ndarray:
+    """
+    IDW 보간
+
+    Parameters
+    ----------
+    sources : (n, 2|3) 또는 (x, y) 튜플 목록
+        표본 위치 (예: solver 중심점)
+    values : (n,)
+        표본 값 (예: avg_incomes)
+    queries : (m, 2|3)
+        보간할 위치 (예: 메시 정점)
+    power : float, default 2.0
+        거리 지수 p
+    k : Optional[int]
+        가까운 k개 표본만 사용 (None이면 전체). scipy가 있으면 KD-tree 사용
+    radius : Optional[float]
+        이 거리 밖 표본은 무시. 반경 안에 표본이 없으면 NaN
+    chunk_size : int
+        한 번에 처리할 질의 점 수 (메모리 = chunk_size * n)
+    workers : int
+        2 이상이면 청크를 프로세스 풀에 분산
+
+    Returns
+    -------
+    (m,) float64 보간값
+    """
+    src = _as_xy(sources)
+    vals = np.asarray(values, dtype=np.float64).ravel()
+    qry = _as_xy(queries)
+    if len(src) != len(vals):
+        raise ValueError("sources와 values의 개수가 다릅니다.")
+    if len(src) == 0:
+        return np.full(len(qry), np.nan)
+
+    # scipy가 없으면 청크 단위 전수 탐색으로 kNN
+    use_tree = has_module("scipy") and (k is not None or radius is not None)
+    if use_tree:
+        from scipy.spatial import cKDTree
+
+        tree = cKDTree(src)
+        k_eff = min(k or len(src), len(src))
+        args = (tree, vals)
+        func = _idw_tree_chunk
+    else:
+        k_eff = k
+        args = (src, vals)
+        func = _idw_chunk
+
+    bounds = range(0, len(qry), chunk_size)
+    chunks = [qry[i:i + chunk_size] for i in bounds]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(func, *args, c, power, k_eff, radius) for c in chunks
+            ]
+            parts = [f.result() for f in futures]
+    else:
+        parts = [func(*args, c, power, k_eff, radius) for c in chunks]
+    return np.concatenate(parts) if parts else np.empty(0)
@@ -0,0 +1,229 @@
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+@dataclass
+class PackedRings:
+    """
+    링 여러 개를 하나의 연속 float64 좌표 배열 + 오프셋으로 보관
+
+    링 i = coords[offsets[i]:offsets[i + 1]]
+    면적/중심 계산은 모든 링에 대해 한 번에 벡터화하여 수행한다.
+    """
+
+    coords: np.ndarray   # (N, 2) float64
+    offsets: np.ndarray  # (R + 1,) int64
+
+    @classmethod
+    def from_rings(cls, rings: Iterable[Sequence[Sequence[float]]]) -> "PackedRings":
+        arrays = [np.asarray(r, dtype=np.float64).reshape(-1, 2) for r in rings]
+        offsets = _counts_to_offsets([len(a) for a in arrays])
+        if not arrays:
+            return cls(np.empty((0, 2), dtype=np.float64), offsets)
+        return cls(np.concatenate(arrays), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def ring(self, i: int) -> np.ndarray:
+        return self.coords[self.offsets[i]:self.offsets[i + 1]]
+
+    def rings(self) -> list:
+        return [self.ring(i) for i in range(len(self))]
+
+    def ring_ids(self) -> np.ndarray:
+        """정점별 소속 링 인덱스"""
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+    def _next_index(self) -> np.ndarray:
+        """정점별 같은 링 안의 다음 정점 인덱스 (마지막 정점은 첫 정점으로)"""
+        nxt = np.arange(1, len(self.coords) + 1)
+        starts, ends = self.offsets[:-1], self.offsets[1:]
+        nonempty = ends > starts
+        nxt[ends[nonempty] - 1] = starts[nonempty]
+        return nxt
+
+    def _cross_terms(self):
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        nxt = self._next_index()
+        return x, y, nxt, x * y[nxt] - x[nxt] * y
+
+    def signed_areas(self) -> np.ndarray:
+        """신발끈 공식 (반시계 방향이 양수)"""
+        _, _, _, cross = self._cross_terms()
+        return 0.5 * np.bincount(self.ring_ids(), weights=cross, minlength=len(self))
+
+    def areas(self) -> np.ndarray:
+        return np.abs(self.signed_areas())
+
+    def centroids(self) -> np.ndarray:
+        """(R, 2) 면적 중심. 면적이 0인 링은 정점 평균으로 대체"""
+        x, y, nxt, cross = self._cross_terms()
+        ids = self.ring_ids()
+        n = len(self)
+        a6 = 3.0 * np.bincount(ids, weights=cross, minlength=n)
+        cx = np.bincount(ids, weights=(x + x[nxt]) * cross, minlength=n)
+        cy = np.bincount(ids, weights=(y + y[nxt]) * cross, minlength=n)
+
+        counts = np.maximum(np.diff(self.offsets), 1)
+        mean_x = np.bincount(ids, weights=x, minlength=n) / counts
+        mean_y = np.bincount(ids, weights=y, minlength=n) / counts
+        degenerate = np.abs(a6) < 1e-12
+        safe = np.where(degenerate, 1.0, a6)
+        return np.column_stack((
+            np.where(degenerate, mean_x, cx / safe),
+            np.where(degenerate, mean_y, cy / safe),
+        ))
+
+    def take(self, indices: Sequence[int]) -> "PackedRings":
+        return PackedRings.from_rings(self.ring(i) for i in indices)
+
+
+@dataclass
+class PackedPolygons:
+    """
+    GeoArrow 스타일 MultiPolygon 패킹
+
+    - coords:        (N, 2) float64 정점
+    - ring_offsets:  (R + 1,) 링 -> 정점 구간
+    - part_offsets:  (P + 1,) 폴리곤(part) -> 링 구간. 각 part의 첫 링이 외곽, 나머지는 hole
+    - geom_offsets:  (F + 1,) 피처 -> part 구간
+    """
+
+    coords: np.ndarray
+    ring_offsets: np.ndarray
+    part_offsets: np.ndarray
+    geom_offsets: np.ndarray
+
+    @classmethod
+    def from_geometries(cls, geometries: Iterable) -> "PackedPolygons":
+        """
+        피처별 [part][ring] 중첩 좌표 (GeoJSON MultiPolygon coordinates 형태) -> 패킹.
+        정점 단위 루프 없이 링 단위로 배열을 이어 붙인다.
+        """
+        rings, ring_counts, part_counts = [], [], []
+        for parts in geometries:
+            part_counts.append(len(parts))
+            for part in parts:
+                ring_counts.append(len(part))
+                rings.extend(part)
+        packed = PackedRings.from_rings(rings)
+        return cls(
+            packed.coords,
+            packed.offsets,
+            _counts_to_offsets(ring_counts),
+            _counts_to_offsets(part_counts),
+        )
+
+    @classmethod
+    def from_geojson(cls, geometries: Iterable[dict]) -> "PackedPolygons":
+        """GeoJSON Polygon/MultiPolygon geometry dict 목록 -> 패킹"""
+        nested = []
+        for geom in geometries:
+            if geom["type"] == "Polygon":
+                nested.append([geom["coordinates"]])
+            elif geom["type"] == "MultiPolygon":
+                nested.append(geom["coordinates"])
+            else:
+                raise ValueError(f"Unsupported geometry type: {geom['type']}")
+        return cls.from_geometries(nested)
+
+    def __len__(self) -> int:
+        return len(self.geom_offsets) - 1
+
+    @property
+    def rings(self) -> PackedRings:
+        return PackedRings(self.coords, self.ring_offsets)
+
+    def with_coords(self, coords: np.ndarray) -> "PackedPolygons":
+        """같은 오프셋에 좌표만 교체 (예: 투영 후)"""
+        return PackedPolygons(coords, self.ring_offsets, self.part_offsets, self.geom_offsets)
+
+    def ring_feature_ids(self) -> np.ndarray:
+        part_ids = np.repeat(np.arange(len(self)), np.diff(self.geom_offsets))
+        return np.repeat(part_ids, np.diff(self.part_offsets))
+
+    def exterior_mask(self) -> np.ndarray:
+        """링별 외곽 여부 (part의 첫 링)"""
+        mask = np.zeros(len(self.ring_offsets) - 1, dtype=bool)
+        starts = self.part_offsets[:-1][np.diff(self.part_offsets) > 0]
+        mask[starts] = True
+        return mask
+
+    def _ring_signed_weights(self) -> np.ndarray:
+        """외곽 +|A|, hole -|A| (링 방향과 무관)"""
+        areas = self.rings.areas()
+        return np.where(self.exterior_mask(), areas, -areas)
+
+    def areas(self) -> np.ndarray:
+        return np.bincount(
+            self.ring_feature_ids(), weights=self._ring_signed_weights(), minlength=len(self)
+        )
+
+    def centroids(self) -> np.ndarray:
+        """hole을 뺀 면적 가중 중심 (F, 2)"""
+        ids = self.ring_feature_ids()
+        w = self._ring_signed_weights()
+        c = self.rings.centroids()
+        total = np.bincount(ids, weights=w, minlength=len(self))
+        cx = np.bincount(ids, weights=w * c[:, 0], minlength=len(self))
+        cy = np.bincount(ids, weights=w * c[:, 1], minlength=len(self))
+        safe = np.where(total == 0, 1.0, total)
+        return np.column_stack((cx / safe, cy / safe))
+
+    def vertex_offsets(self) -> np.ndarray:
+        """피처 -> 정점 구간 (F + 1,)"""
+        return self.ring_offsets[self.part_offsets[self.geom_offsets]]
+
+    def bboxes(self) -> np.ndarray:
+        """(F, 4) [xmin, ymin, xmax, ymax]. 정점이 없는 피처는 NaN"""
+        offs = self.vertex_offsets()
+        out = np.full((len(self), 4), np.nan)
+        nonempty = np.diff(offs) > 0
+        if nonempty.any():
+            starts = offs[:-1][nonempty]
+            out[nonempty, :2] = np.minimum.reduceat(self.coords, starts, axis=0)
+            out[nonempty, 2:] = np.maximum.reduceat(self.coords, starts, axis=0)
+        return out
+
+    def feature(self, i: int) -> list:
+        """피처 i -> [part][ring] 좌표 배열 (view)"""
+        parts = []
+        for p in range(self.geom_offsets[i], self.geom_offsets[i + 1]):
+            parts.append([
+                self.coords[self.ring_offsets[r]:self.ring_offsets[r + 1]]
+                for r in range(self.part_offsets[p], self.part_offsets[p + 1])
+            ])
+        return parts
+
+    def features(self) -> list:
+        return [self.feature(i) for i in range(len(self))]
+
+    def take(self, indices: Sequence[int]) -> "PackedPolygons":
+        return PackedPolygons.from_geometries(self.feature(i) for i in indices)
+
+    def to_arrays(self, prefix: str = "") -> dict:
+        return {
+            f"{prefix}coords": self.coords,
+            f"{prefix}ring_offsets": self.ring_offsets,
+            f"{prefix}part_offsets": self.part_offsets,
+            f"{prefix}geom_offsets": self.geom_offsets,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict, prefix: str = "") -> "PackedPolygons":
+        return cls(
+            arrays[f"{prefix}coords"],
+            arrays[f"{prefix}ring_offsets"],
+            arrays[f"{prefix}part_offsets"],
+            arrays[f"{prefix}geom_offsets"],
+        )
+
+
+def _counts_to_offsets(counts: Sequence[int]) -> np.ndarray:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    if len(counts):
+        offsets[1:] = np.cumsum(counts)
+    return offsets
@@ -0,0 +1,285 @@
+"""
+GeoUnion.cs의 헤드리스 대체 — 패킹된 법정동 경계를 하나의 외곽선으로 합친다
+
+1. 정점을 tolerance 격자에 스냅하고 반올림 경계로 갈라진 같은 정점만 병합 (가까운 정점/미세 틈 제거)
+2. 링 방향 정규화 (외곽 반시계, hole 시계)
+3. 방향 간선 해시 상쇄: 이웃 폴리곤이 공유하는 간선은 (a→b), (b→a)로 한 번씩 나타나므로 서로 지운다
+4. 피처 묶음별 상쇄를 트리로 쌓아 올림 (cascaded union, workers>1이면 호출당 프로세스 풀 하나로 병렬)
+   남은 간선 중 T-junction(한쪽 경계에만 있는 정점이 이웃 간선 위에 놓인 경우)은 그 정점에서
+   나눠 양쪽 간선열을 맞춘 뒤 한 번 더 상쇄 (정확히 짝지어진 간선은 나눠도 똑같이 상쇄되므로
+   남은 간선만 보면 된다)
+5. 남은 간선을 이어 링으로 복원하고 부호 면적으로 외곽/hole 분류
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.utils.gis.packed_geometry import PackedPolygons, PackedRings, _counts_to_offsets
+from src.utils.gis.spatial_index import points_in_rings
+
+_PAIR_CHUNK = 1 << 22  # T-junction 판정 (간선, 정점) 쌍 한 번에 처리할 개수
+
+
+def snap_vertices(coords: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정점을 tolerance 격자에 스냅 (snap rounding). 반올림 경계에 걸쳐 인접 칸(8방향)으로 갈라진
+    같은 정점은 칸 대표점 사이 거리가 tolerance / 2 이하일 때만 한 단계로 합친다.
+    연쇄 병합이 없으므로 한 덩어리의 지름은 tolerance를 넘지 않는다
+    (촘촘한 정점열이 한 점으로 무너지지 않는다).
+
+    Returns: (정점별 vertex id (N,), vertex id별 격자 좌표 (V, 2) int64)
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    grid = np.round(coords / tolerance).astype(np.int64)
+    cells, cell_of = np.unique(grid, axis=0, return_inverse=True)
+    cell_of = cell_of.ravel()
+    if len(cells) == 0:
+        return cell_of, cells
+
+    # 칸 대표점: 칸에 속한 정점의 평균
+    counts = np.bincount(cell_of, minlength=len(cells))
+    rep = np.column_stack([
+        np.bincount(cell_of, weights=coords[:, k], minlength=len(cells)) / counts
+        for k in range(2)
+    ])
+
+    # 격자 칸을 정수 키로 (정렬 상태 유지)
+    span = cells[:, 1].max() - cells[:, 1].min() + 3
+    base_y = cells[:, 1].min() - 1
+    keys = cells[:, 0] * span + (cells[:, 1] - base_y)
+
+    pairs_a, pairs_b = [], []
+    for dx, dy in ((1, -1), (1, 0), (1, 1), (0, 1)):
+        target = keys + dx * span + dy
+        pos = np.minimum(np.searchsorted(keys, target), len(keys) - 1)
+        hit = keys[pos] == target
+        pairs_a.append(np.flatnonzero(hit))
+        pairs_b.append(pos[hit])
+    pa, pb = np.concatenate(pairs_a), np.concatenate(pairs_b)
+    close = np.hypot(*(rep[pa] - rep[pb]).T) <= 0.5 * tolerance
+    pa, pb = pa[close], pb[close]
+
+    # 각 칸은 가까운 이웃 중 번호가 가장 작은 칸으로 — 그 칸이 다시 다른 칸으로 가면 합치지 않는다
+    label = np.arange(len(cells))
+    np.minimum.at(label, pa, pb)
+    np.minimum.at(label, pb, pa)
+    chained = label[label] != label
+    label[chained] = np.flatnonzero(chained)
+
+    roots, vertex_of_cell = np.unique(label, return_inverse=True)
+    return vertex_of_cell.ravel()[cell_of], cells[roots]
+
+
+def _directed_edges(polygons: PackedPolygons, vid: np.ndarray, vxy: np.ndarray):
+    """
+    모든 링의 방향 간선 (a, b) vertex id 쌍과 소속 피처 — 외곽은 반시계, hole은 시계로 맞춘다.
+    스냅으로 길이가 0이 된 간선과 면적이 0이 된 링은 버린다.
+    """
+    rings = PackedRings(vxy[vid].astype(np.float64), polygons.ring_offsets)
+    signed = rings.signed_areas()
+    flip = (signed > 0) != polygons.exterior_mask()
+
+    nxt = rings._next_index()
+    ring_of_vertex = rings.ring_ids()
+    a, b = vid, vid[nxt]
+    flip_v = flip[ring_of_vertex]
+    a, b = np.where(flip_v, b, a), np.where(flip_v, a, b)
+    keep = (a != b) & (signed[ring_of_vertex] != 0)
+    feature = polygons.ring_feature_ids()[ring_of_vertex]
+    return a[keep], b[keep], feature[keep]
+
+
+def split_t_junctions(
+    a: np.ndarray, b: np.ndarray, vxy: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    간선 (a→b) 내부에서 격자 한 칸(= tolerance) 이내에 놓인 다른 정점이 있으면 그 정점들에서 나눈다.
+    이웃 경계 한쪽에만 정점이 있어도 양쪽 간선열이 같아져 상쇄된다.
+
+    Returns: (a, b) — 나뉜 간선은 a→v1→...→b 순서로 이어진다 (나뉘지 않은 간선이 먼저)
+    """
+    if len(a) == 0:
+        return a, b
+    verts = np.unique(np.concatenate((a, b)))
+    verts = verts[np.argsort(vxy[verts, 0], kind="stable")]
+    vx = vxy[verts, 0]
+    pa, pb = vxy[a].astype(np.float64), vxy[b].astype(np.float64)
+    lo = np.searchsorted(vx, np.minimum(pa[:, 0], pb[:, 0]) - 1, "left")
+    hi = np.searchsorted(vx, np.maximum(pa[:, 0], pb[:, 0]) + 1, "right")
+    counts = hi - lo
+    chunk_starts = _counts_to_offsets(counts)
+
+    hit_edge, hit_t, hit_vertex = [], [], []
+    start = 0
+    while start < len(a):
+        stop = int(np.searchsorted(chunk_starts, chunk_starts[start] + _PAIR_CHUNK, "right")) - 1
+        stop = min(max(stop, start + 1), len(a))
+        c_counts = counts[start:stop]
+        ei = np.repeat(np.arange(start, stop), c_counts)
+        v = verts[
+            np.repeat(lo[start:stop], c_counts)
+            + np.arange(c_counts.sum())
+            - np.repeat(_counts_to_offsets(c_counts)[:-1], c_counts)
+        ]
+        ab = pb[ei] - pa[ei]
+        ap = vxy[v] - pa[ei]
+        length2 = np.einsum("ij,ij->i", ab, ab)
+        t = np.einsum("ij,ij->i", ap, ab) / length2
+        cross = ab[:, 0] * ap[:, 1] - ab[:, 1] * ap[:, 0]
+        on = (v != a[ei]) & (v != b[ei]) & (t > 0) & (t < 1) & (cross * cross <= length2)
+        hit_edge.append(ei[on])
+        hit_t.append(t[on])
+        hit_vertex.append(v[on])
+        start = stop
+    hit_edge, hit_t, hit_vertex = map(np.concatenate, (hit_edge, hit_t, hit_vertex))
+    if len(hit_edge) == 0:
+        return a, b
+
+    order = np.lexsort((hit_t, hit_edge))
+    hit_edge, hit_vertex = hit_edge[order], hit_vertex[order]
+    split, n_hits = np.unique(hit_edge, return_counts=True)
+    # 나뉜 간선마다 정점열 [a, v1, ..., vk, b]
+    offsets = _counts_to_offsets(n_hits + 2)
+    nodes = np.empty(offsets[-1], dtype=a.dtype)
+    nodes[offsets[:-1]] = a[split]
+    nodes[offsets[1:] - 1] = b[split]
+    rank = np.arange(len(hit_edge)) - np.repeat(_counts_to_offsets(n_hits)[:-1], n_hits)
+    nodes[np.repeat(offsets[:-1], n_hits) + 1 + rank] = hit_vertex
+    link = np.ones(len(nodes) - 1, dtype=bool)
+    link[offsets[1:-1] - 1] = False  # 다음 간선의 정점열로 넘어가는 자리
+
+    whole = np.ones(len(a), dtype=bool)
+    whole[split] = False
+    return (
+        np.concatenate((a[whole], nodes[:-1][link])),
+        np.concatenate((b[whole], nodes[1:][link])),
+    )
+
+
+def cancel_edges(a: np.ndarray, b: np.ndarray, n_vertices: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (a→b)와 (b→a)를 짝지어 지운다 (다중 집합). 남는 것은 한쪽 방향으로만 초과된 간선
+    """
+    if len(a) == 0:
+        return a, b
+    fwd = a * n_vertices + b
+    rev = b * n_vertices + a
+    keys, inv, counts = np.unique(fwd, return_inverse=True, return_counts=True)
+    pos = np.minimum(np.searchsorted(keys, rev), len(keys) - 1)
+    rev_counts = np.where(keys[pos] == rev, counts[pos], 0)
+    excess = counts[inv] - rev_counts
+    # 같은 키의 간선 중 앞에서부터 excess개만 남긴다
+    order = np.argsort(inv, kind="stable")
+    starts = np.zeros(len(keys), dtype=np.int64)
+    starts[1:] = np.cumsum(counts)[:-1]
+    rank = np.empty(len(a), dtype=np.int64)
+    rank[order] = np.arange(len(a)) - starts[inv[order]]
+    keep = rank < excess
+    return a[keep], b[keep]
+
+
+def _cancel_group(args) -> Tuple[np.ndarray, np.ndarray]:
+    return cancel_edges(*args)
+
+
+def _stitch_rings(a: np.ndarray, b: np.ndarray, vxy: np.ndarray) -> List[np.ndarray]:
+    """
+    남은 방향 간선을 시작점 -> 간선으로 이어 닫힌 링(격자 좌표) 목록으로
+    상쇄 후 정점마다 들어오고 나가는 간선 수가 같으므로 걸음은 시작 정점에서만 멈춘다 —
+    시작 정점으로 돌아오지 못한 사슬은 임의로 닫지 않고 버린다
+    """
+    outgoing: Dict[int, List[int]] = {}
+    for i, start in enumerate(a.tolist()):
+        outgoing.setdefault(start, []).append(i)
+
+    b_list = b.tolist()
+    used = np.zeros(len(a), dtype=bool)
+    rings = []
+    for first in range(len(a)):
+        if used[first]:
+            continue
+        ring = []
+        i = first
+        while not used[i]:
+            used[i] = True
+            ring.append(i)
+            nxt = next((j for j in outgoing.get(b_list[i], ()) if not used[j]), None)
+            if nxt is None:
+                break
+            i = nxt
+        if len(ring) >= 3 and b_list[ring[-1]] == a[ring[0]]:
+            ids = a[ring]
+            rings.append(vxy[np.append(ids, ids[0])].astype(np.float64))
+    return rings
+
+
+def union_polygons(
+    polygons: PackedPolygons,
+    tolerance: float = 0.01,
+    group_size: int = 64,
+    workers: int = 1,
+) -> PackedPolygons:
+    """
+    모든 피처의 합집합 -> 피처 1개짜리 PackedPolygons (part마다 외곽 + hole)
+
+    tolerance: 스냅 격자 크기 (좌표 단위, UTM이면 m). 이보다 가까운 정점은 합쳐진다
+    group_size: cascaded union 잎 노드당 피처 수
+    workers: 2 이상이면 잎 노드 상쇄를 프로세스 풀에서 병렬 실행
+    """
+    vid, vxy = snap_vertices(polygons.coords, tolerance)
+    a, b, feature = _directed_edges(polygons, vid, vxy)
+    n = len(vxy)
+
+    # 피처 묶음별로 간선을 나눠 잎에서 먼저 상쇄 (공유 간선은 대부분 이웃끼리 같은 묶음)
+    group = feature // max(group_size, 1)
+    groups = [(a[group == g], b[group == g], n) for g in np.unique(group)]
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(groups) > 1 else None
+    try:
+        while len(groups) > 1:
+            if pool is not None:
+                reduced = list(pool.map(_cancel_group, groups))
+            else:
+                reduced = [cancel_edges(*g) for g in groups]
+            groups = [
+                (
+                    np.concatenate([r[0] for r in reduced[i:i + 2]]),
+                    np.concatenate([r[1] for r in reduced[i:i + 2]]),
+                    n,
+                )
+                for i in range(0, len(reduced), 2)
+            ]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if groups:
+        a, b = cancel_edges(*groups[0])
+        a, b = cancel_edges(*split_t_junctions(a, b, vxy), n)
+
+    ring_list = _stitch_rings(a, b, vxy)
+    packed = PackedRings.from_rings(ring_list)
+    signed = packed.signed_areas()
+    exteriors = [i for i in range(len(ring_list)) if signed[i] > 0]
+    holes = [i for i in range(len(ring_list)) if signed[i] < 0]
+
+    # hole은 자신을 포함하는 가장 작은 외곽에 배정
+    parts: List[List[np.ndarray]] = [[ring_list[i]] for i in exteriors]
+    ext_area = signed[exteriors] if exteriors else np.empty(0)
+    for h in holes:
+        probe = ring_list[h][:1]
+        best, best_area = None, np.inf
+        for k, e in enumerate(exteriors):
+            ring = ring_list[e]
+            if ext_area[k] < best_area and points_in_rings(
+                probe, ring, np.array([0, len(ring)])
+            )[0]:
+                best, best_area = k, ext_area[k]
+        if best is not None:
+            parts[best].append(ring_list[h])
+
+    order = np.argsort(-ext_area) if len(ext_area) else []
+    parts = [
+        [ring * tolerance for ring in parts[k]] for k in order
+    ]
+    return PackedPolygons.from_geometries([parts])
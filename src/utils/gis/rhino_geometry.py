@@ -0,0 +1,74 @@
+"""
+Rhino 지오메트리 변환 (Grasshopper 측에서 요청할 때만 지연 생성)
+
+Rhino.Geometry는 함수 안에서 import하므로 이 모듈 자체는
+Rhino가 없는 환경에서도 import할 수 있다.
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from src.utils.optional_deps import has_module
+
+
+def has_rhino() -> bool:
+    return has_module("Rhino")
+
+
+def ring_to_polyline_curve(ring: np.ndarray):
+    """(n, 2) 좌표 배열 -> 닫힌 rg.PolylineCurve"""
+    import Rhino.Geometry as rg
+
+    pl = rg.Polyline([rg.Point3d(x, y, 0) for x, y in np.asarray(ring).tolist()])
+    if not pl.IsClosed:
+        pl.Add(pl[0])
+    return rg.PolylineCurve(pl)
+
+
+def to_polyline_curves(rings: Iterable[np.ndarray]) -> List:
+    return [ring_to_polyline_curve(r) for r in rings]
+
+
+def feature_to_polyline_curves(parts: Iterable[Iterable[np.ndarray]]) -> List:
+    """[part][ring] 좌표 -> PolylineCurve 목록 (각 part의 외곽, hole 순)"""
+    return [ring_to_polyline_curve(r) for part in parts for r in part]
+
+
+def features_to_curve_tree(features: Iterable[Iterable[Iterable[np.ndarray]]]):
+    """
+    피처별 [part][ring] 좌표 -> DataTree[Curve] (피처 i = branch {i}, 각 part의 외곽, hole 순)
+    centroids/values와 branch 번호로 대응되고, GeoUnion.cs는 AllData()로 펼쳐 쓴다
+    """
+    import Rhino.Geometry as rg
+    from Grasshopper import DataTree
+    from Grasshopper.Kernel.Data import GH_Path
+
+    tree = DataTree[rg.Curve]()
+    for i, parts in enumerate(features):
+        path = GH_Path(i)
+        tree.EnsurePath(path)
+        for curve in feature_to_polyline_curves(parts):
+            tree.Add(curve, path)
+    return tree
+
+
+def to_point3d(points: Iterable) -> List:
+    import Rhino.Geometry as rg
+
+    return [rg.Point3d(float(p[0]), float(p[1]), 0) for p in points]
+
+
+def to_mesh(vertices: np.ndarray, faces: np.ndarray, z: Optional[np.ndarray] = None):
+    """(V, 2) 정점 + (T, 3) 면 -> rg.Mesh (z가 있으면 정점별 높이)"""
+    import Rhino.Geometry as rg
+
+    vertices = np.asarray(vertices, dtype=np.float64)
+    heights = np.zeros(len(vertices)) if z is None else np.asarray(z, dtype=np.float64)
+    mesh = rg.Mesh()
+    for (x, y), h in zip(vertices.tolist(), heights.tolist()):
+        mesh.Vertices.Add(x, y, h)
+    for a, b, c in np.asarray(faces).tolist():
+        mesh.Faces.AddFace(a, b, c)
+    mesh.Normals.ComputeNormals()
+    return mesh
@@ -0,0 +1,176 @@
+"""
+다해상도 폴리곤 단순화 (Douglas-Peucker / Visvalingam-Whyatt)
+
+정점마다 "이 허용오차부터 제거된다"는 중요도(significance)를 한 번만 계산해 두면
+임의의 tolerance 단계는 significance >= tolerance 마스크 하나로 바로 얻을 수 있다.
+
+- DP: 중요도 = 분할 시 선분까지의 거리 (부모보다 크지 않게 단조화), 단위 = 좌표 단위
+- VW: 중요도 = 유효 삼각형 면적, 비교 시 tolerance**2 를 사용
+
+링마다 따로 단순화하면 이웃이 공유하는 경계가 양쪽에서 다르게 줄어 틈/겹침이 생긴다.
+경계 LOD는 topology.Topology의 arc 단위로 단순화한다 (arc_significance / simplify_topology):
+arc 양 끝(junction)을 고정하므로 공유 경계는 한 번만, 양쪽 같게 줄어든다.
+"""
+
+import heapq
+from typing import List, Sequence
+
+import numpy as np
+
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.topology import Topology
+
+_MIN_RING_VERTICES = 4  # 닫힌 삼각형 (첫 정점 반복 포함)
+
+
+def _dp_significance(coords: np.ndarray, ring_offsets: np.ndarray) -> np.ndarray:
+    """모든 링을 동시에 분할: 반복 1회 = 재귀 트리의 한 층"""
+    n = len(coords)
+    sig = np.zeros(n)
+    resolved = np.zeros(n, dtype=bool)
+    starts, ends = ring_offsets[:-1], ring_offsets[1:] - 1
+    for s, e in zip(starts.tolist(), ends.tolist()):
+        resolved[s] = resolved[e] = True
+        if e - s + 1 <= _MIN_RING_VERTICES:
+            resolved[s:e + 1] = True
+        elif np.array_equal(coords[s], coords[e]):
+            # 닫힌 링은 첫 정점, 그로부터 가장 먼 정점, 그 현에서 가장 먼 정점을 고정점으로 둔다
+            # (어떤 tolerance에서도 면적이 있는 삼각형이 남는다)
+            ring = coords[s:e]
+            far = int(np.argmax(np.hypot(*(ring - ring[0]).T)))
+            chord = ring[far] - ring[0]
+            rel = ring - ring[0]
+            apex = int(np.argmax(np.abs(chord[0] * rel[:, 1] - chord[1] * rel[:, 0])))
+            resolved[s + far] = resolved[s + apex] = True
+    sig[resolved] = np.inf
+    idx = np.arange(n)
+    while not resolved.all():
+        left = np.maximum.accumulate(np.where(resolved, idx, 0))
+        right = np.minimum.accumulate(np.where(resolved, idx, n - 1)[::-1])[::-1]
+        v = np.flatnonzero(~resolved)
+        a, b = coords[left[v]], coords[right[v]]
+        ab = b - a
+        ap = coords[v] - a
+        denom = np.einsum("ij,ij->i", ab, ab)
+        t = np.clip(np.einsum("ij,ij->i", ap, ab) / np.where(denom == 0, 1.0, denom), 0.0, 1.0)
+        d = np.hypot(*(ap - t[:, None] * ab).T)
+        # 선분(= 왼쪽 고정점)별 최대 거리 정점 선택
+        order = np.lexsort((-d, left[v]))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = left[v][order][1:] != left[v][order][:-1]
+        pick = order[first]
+        k = v[pick]
+        parent = np.minimum(sig[left[k]], sig[right[k]])
+        sig[k] = np.minimum(d[pick], parent)
+        resolved[k] = True
+    return sig
+
+
+def _triangle_area(p, q, r) -> float:
+    return abs((q[0] - p[0]) * (r[1] - p[1]) - (r[0] - p[0]) * (q[1] - p[1])) * 0.5
+
+
+def _vw_ring(ring: np.ndarray, open_line: bool = False) -> np.ndarray:
+    """open_line이면 양 끝을 고정한 선 (arc) — 내부 정점 하나는 남긴다"""
+    n = len(ring)
+    sig = np.full(n, np.inf)
+    if n <= _MIN_RING_VERTICES:
+        return sig
+    pts = ring.tolist()
+    m = n - 1 if pts[0] == pts[-1] else n  # 닫힌 링은 마지막(=첫) 정점 제외하고 순환
+    first = 1 if m < n else 0  # 닫힌 링의 첫 정점은 닫는 정점과 함께 남긴다
+    last = m
+    if open_line and m == n:
+        first, last = 1, n - 1
+    prev = [(i - 1) % m for i in range(m)]
+    nxt = [(i + 1) % m for i in range(m)]
+    area = [_triangle_area(pts[prev[i]], pts[i], pts[nxt[i]]) for i in range(m)]
+    heap = [(area[i], i) for i in range(first, last)]
+    heapq.heapify(heap)
+    alive = m
+    removed = [False] * m
+    current = 0.0
+    while heap and alive > _MIN_RING_VERTICES - 1:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != area[i]:
+            continue
+        current = max(current, a)  # 단조화: 먼저 빠진 정점보다 작지 않게
+        sig[i] = current
+        removed[i] = True
+        alive -= 1
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        for v in (p, q):
+            if v < first or v >= last:
+                continue
+            area[v] = _triangle_area(pts[prev[v]], pts[v], pts[nxt[v]])
+            heapq.heappush(heap, (area[v], v))
+    if m < n:
+        sig[-1] = sig[0]
+    return sig
+
+
+def significance(polygons: PackedPolygons, method: str = "dp") -> np.ndarray:
+    """정점별 중요도 (N,). 링마다 최소 정점(닫힌 삼각형)은 inf로 보존"""
+    offs = polygons.ring_offsets
+    if method == "dp":
+        return _dp_significance(polygons.coords, offs)
+    if method != "vw":
+        raise ValueError(f"Unknown simplification method: {method}")
+    out = np.empty(len(polygons.coords))
+    for r in range(len(offs) - 1):
+        out[offs[r]:offs[r + 1]] = _vw_ring(polygons.coords[offs[r]:offs[r + 1]])
+    return out
+
+
+def simplify_with(
+    polygons: PackedPolygons, sig: np.ndarray, tolerance: float, method: str = "dp"
+) -> PackedPolygons:
+    """미리 계산한 중요도로 tolerance 단계 추출 (마스크 + 오프셋 재계산만)"""
+    threshold = tolerance * tolerance if method == "vw" else tolerance
+    keep = sig >= threshold
+    ring_ids = np.repeat(np.arange(len(polygons.ring_offsets) - 1), np.diff(polygons.ring_offsets))
+    counts = np.bincount(ring_ids[keep], minlength=len(polygons.ring_offsets) - 1)
+    ring_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    ring_offsets[1:] = np.cumsum(counts)
+    return PackedPolygons(
+        polygons.coords[keep], ring_offsets, polygons.part_offsets, polygons.geom_offsets
+    )
+
+
+def simplify_levels(
+    polygons: PackedPolygons, tolerances: Sequence[float], method: str = "dp"
+) -> List[PackedPolygons]:
+    """중요도 한 번 계산으로 여러 tolerance 단계를 한꺼번에"""
+    sig = significance(polygons, method)
+    return [simplify_with(polygons, sig, t, method) for t in tolerances]
+
+
+def arc_significance(topology: Topology, method: str = "dp") -> np.ndarray:
+    """
+    arc 정점별 중요도 (M,) — arc 양 끝(junction)은 inf.
+    열린 arc는 현에서 가장 먼 내부 정점 하나도 inf로 남겨, arc 두 개로 된 링이
+    어떤 tolerance에서도 선분으로 접히지 않게 한다
+    """
+    coords, offs = topology.arc_coords(), topology.arc_offsets
+    if method == "dp":
+        sig = _dp_significance(coords, offs)
+        for s, e in zip(offs[:-1].tolist(), (offs[1:] - 1).tolist()):
+            if e - s > 1 and not np.array_equal(coords[s], coords[e]):
+                interior = sig[s + 1:e]
+                interior[np.argmax(interior)] = np.inf  # DP의 첫 분할점 = 현에서 가장 먼 정점
+        return sig
+    if method != "vw":
+        raise ValueError(f"Unknown simplification method: {method}")
+    out = np.empty(len(coords))
+    for a in range(len(offs) - 1):
+        out[offs[a]:offs[a + 1]] = _vw_ring(coords[offs[a]:offs[a + 1]], open_line=True)
+    return out
+
+
+def simplify_topology(
+    topology: Topology, sig: np.ndarray, tolerance: float, method: str = "dp"
+) -> PackedPolygons:
+    """arc_significance로 tolerance 단계 추출 -> 링 복원 (공유 경계는 이웃 양쪽이 같다)"""
+    threshold = tolerance * tolerance if method == "vw" else tolerance
+    return topology.filter_arc_vertices(sig >= threshold).to_polygons()
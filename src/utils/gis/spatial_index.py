@@ -0,0 +1,238 @@
+"""
+법정동 경계 공간 인덱스
+
+STR(Sort-Tile-Recursive) 방식으로 패킹한 R-tree를 피처 bbox 위에 만들고,
+후보는 벡터화된 point-in-polygon(even-odd)으로 확정한다.
+트리는 레벨별 NumPy 배열로만 구성되어 npz로 저장/로드할 수 있다.
+"""
+
+import hashlib
+from math import ceil, sqrt
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.gis.packed_geometry import PackedPolygons
+
+
+def _str_pack(bboxes: np.ndarray, capacity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    bbox들을 STR 순서로 정렬해 capacity개씩 노드로 묶는다.
+    Returns: (정렬 순서, 노드별 자식 오프셋)
+    """
+    n = len(bboxes)
+    n_nodes = ceil(n / capacity)
+    n_slices = max(1, ceil(sqrt(n_nodes)))
+    cx = (bboxes[:, 0] + bboxes[:, 2]) * 0.5
+    cy = (bboxes[:, 1] + bboxes[:, 3]) * 0.5
+
+    by_x = np.argsort(cx, kind="stable")
+    slice_size = n_slices * capacity
+    order = np.concatenate([
+        s[np.argsort(cy[s], kind="stable")]
+        for s in (by_x[i:i + slice_size] for i in range(0, n, slice_size))
+    ])
+    # 슬라이스마다 마지막 노드가 덜 찰 수 있으므로 슬라이스 경계로 오프셋 계산
+    offsets = [0]
+    for start in range(0, n, slice_size):
+        end = min(start + slice_size, n)
+        offsets.extend(range(start + capacity, end, capacity))
+        offsets.append(end)
+    return order, np.asarray(offsets, dtype=np.int64)
+
+
+def _union_bboxes(bboxes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    starts = offsets[:-1]
+    return np.column_stack((
+        np.minimum.reduceat(bboxes[:, 0], starts),
+        np.minimum.reduceat(bboxes[:, 1], starts),
+        np.maximum.reduceat(bboxes[:, 2], starts),
+        np.maximum.reduceat(bboxes[:, 3], starts),
+    ))
+
+
+def points_in_rings(points: np.ndarray, coords: np.ndarray, ring_offsets: np.ndarray) -> np.ndarray:
+    """
+    even-odd 규칙 point-in-polygon (벡터화)
+    ring_offsets로 구분된 모든 링(외곽 + hole)을 한 폴리곤으로 취급
+    """
+    a = coords
+    b = np.empty_like(coords)
+    b[:-1] = coords[1:]
+    # 각 링의 마지막 정점은 첫 정점과 잇는다
+    starts, ends = ring_offsets[:-1], ring_offsets[1:]
+    nonempty = ends > starts
+    b[ends[nonempty] - 1] = coords[starts[nonempty]]
+
+    px = points[:, 0, None]
+    py = points[:, 1, None]
+    ay, by = a[None, :, 1], b[None, :, 1]
+    straddle = (ay > py) != (by > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = a[None, :, 0] + (py - ay) * (b[None, :, 0] - a[None, :, 0]) / (by - ay)
+    crossings = straddle & (px < x_cross)
+    return (crossings.sum(axis=1) & 1).astype(bool)
+
+
+class DistrictIndex:
+    """
+    STR-packed R-tree + point-in-polygon 정밀 판정
+
+    levels[0]이 리프(자식 = 피처), 마지막이 루트. 각 레벨은
+    (노드 bbox (M, 4), 자식 오프셋 (M + 1,), 자식 순서)로 구성된다.
+    """
+
+    def __init__(
+        self,
+        polygons: PackedPolygons,
+        codes: Sequence[str],
+        capacity: int = 8,
+        _levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ):
+        self.polygons = polygons
+        self.codes = np.asarray(codes, dtype=str)
+        self.bboxes = polygons.bboxes()
+        self.capacity = capacity
+        self.levels = _levels if _levels is not None else self._build()
+
+    def _build(self) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        levels = []
+        boxes = self.bboxes
+        if len(boxes) == 0:
+            return levels
+        while True:
+            order, offsets = _str_pack(boxes, self.capacity)
+            node_boxes = _union_bboxes(boxes[order], offsets)
+            levels.append((node_boxes, offsets, order))
+            if len(node_boxes) == 1:
+                return levels
+            boxes = node_boxes
+
+    def fingerprint(self) -> str:
+        return polygons_fingerprint(self.polygons, self.codes)
+
+    # ---------- queries ----------
+
+    def _candidates(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """루트부터 레벨별로 (점, 노드) 쌍을 펼치며 bbox 포함 여부로 거른다"""
+        pt = np.arange(len(points))
+        node = np.zeros(len(points), dtype=np.int64)
+        for depth, (boxes, offsets, order) in enumerate(reversed(self.levels)):
+            if depth == 0:
+                # 루트 노드 자체 bbox 검사
+                box = boxes[node]
+                keep = (
+                    (points[pt, 0] >= box[:, 0]) & (points[pt, 0] <= box[:, 2])
+                    & (points[pt, 1] >= box[:, 1]) & (points[pt, 1] <= box[:, 3])
+                )
+                pt, node = pt[keep], node[keep]
+            counts = offsets[node + 1] - offsets[node]
+            pt = np.repeat(pt, counts)
+            slot = np.repeat(offsets[node] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            child = order[slot]
+            if depth < len(self.levels) - 1:
+                child_boxes = self.levels[len(self.levels) - 2 - depth][0]
+            else:
+                child_boxes = self.bboxes
+            box = child_boxes[child]
+            keep = (
+                (points[pt, 0] >= box[:, 0]) & (points[pt, 0] <= box[:, 2])
+                & (points[pt, 1] >= box[:, 1]) & (points[pt, 1] <= box[:, 3])
+            )
+            pt, node = pt[keep], child[keep]
+        return pt, node
+
+    def locate_index(self, points, chunk_size: int = 4096) -> np.ndarray:
+        """점별 포함 피처 인덱스 (없으면 -1)"""
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(pts), -1, dtype=np.int64)
+        if not self.levels or len(pts) == 0:
+            return result
+        pt, feat = self._candidates(pts)
+
+        # 피처별로 묶어 해당 피처의 모든 링에 대해 한 번에 판정
+        order = np.argsort(feat, kind="stable")
+        pt, feat = pt[order], feat[order]
+        bounds = np.flatnonzero(np.diff(feat)) + 1
+        P = self.polygons
+        for group_pt, f in zip(np.split(pt, bounds), feat[np.r_[0, bounds]] if len(feat) else []):
+            group_pt = group_pt[result[group_pt] < 0]
+            if len(group_pt) == 0:
+                continue
+            r0 = P.part_offsets[P.geom_offsets[f]]
+            r1 = P.part_offsets[P.geom_offsets[f + 1]]
+            ring_offs = P.ring_offsets[r0:r1 + 1]
+            coords = P.coords[ring_offs[0]:ring_offs[-1]]
+            ring_offs = ring_offs - ring_offs[0]
+            for i in range(0, len(group_pt), chunk_size):
+                sub = group_pt[i:i + chunk_size]
+                inside = points_in_rings(pts[sub], coords, ring_offs)
+                result[sub[inside]] = f
+        return result
+
+    def locate(self, points) -> np.ndarray:
+        """점별 legald_cd (없으면 빈 문자열)"""
+        idx = self.locate_index(points)
+        out = np.full(len(idx), "", dtype=self.codes.dtype)
+        found = idx >= 0
+        out[found] = self.codes[idx[found]]
+        return out
+
+    def query_bbox(self, bbox: Sequence[float]) -> np.ndarray:
+        """bbox [xmin, ymin, xmax, ymax]와 겹치는 피처 인덱스"""
+        xmin, ymin, xmax, ymax = bbox
+        if not self.levels:
+            return np.empty(0, dtype=np.int64)
+
+        def overlaps(boxes):
+            return (
+                (boxes[:, 0] <= xmax) & (boxes[:, 2] >= xmin)
+                & (boxes[:, 1] <= ymax) & (boxes[:, 3] >= ymin)
+            )
+
+        root_boxes = self.levels[-1][0]
+        nodes = np.flatnonzero(overlaps(root_boxes))
+        for depth in range(len(self.levels) - 1, -1, -1):
+            _, offsets, order = self.levels[depth]
+            children = np.concatenate(
+                [order[offsets[n]:offsets[n + 1]] for n in nodes]
+            ) if len(nodes) else np.empty(0, dtype=np.int64)
+            child_boxes = self.levels[depth - 1][0] if depth > 0 else self.bboxes
+            nodes = children[overlaps(child_boxes[children])]
+        return np.sort(nodes)
+
+    # ---------- serialization ----------
+
+    def to_arrays(self) -> dict:
+        arrays = {"codes": self.codes, "capacity": np.array(self.capacity)}
+        arrays.update(self.polygons.to_arrays(prefix="poly_"))
+        for i, (boxes, offsets, order) in enumerate(self.levels):
+            arrays[f"level{i}_boxes"] = boxes
+            arrays[f"level{i}_offsets"] = offsets
+            arrays[f"level{i}_order"] = order
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict) -> "DistrictIndex":
+        levels = []
+        i = 0
+        while f"level{i}_boxes" in arrays:
+            levels.append((
+                arrays[f"level{i}_boxes"], arrays[f"level{i}_offsets"], arrays[f"level{i}_order"]
+            ))
+            i += 1
+        return cls(
+            PackedPolygons.from_arrays(arrays, prefix="poly_"),
+            arrays["codes"],
+            capacity=int(arrays["capacity"]),
+            _levels=levels,
+        )
+
+
+def polygons_fingerprint(polygons: PackedPolygons, codes: Sequence[str]) -> str:
+    """경계 데이터 내용 해시 (인덱스 캐시 키용)"""
+    h = hashlib.sha1()
+    for arr in polygons.to_arrays().values():
+        h.update(np.ascontiguousarray(arr).tobytes())
+    h.update("\n".join(map(str, codes)).encode("utf-8"))
+    return h.hexdigest()
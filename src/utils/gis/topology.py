@@ -0,0 +1,219 @@
+"""
+공유 arc 토폴로지 (TopoJSON 방식)
+
+이웃 법정동은 경계 간선을 거의 모두 공유하므로 링을 각각 저장하면 정점이 두 번씩 들어간다.
+
+1. 정점을 quantum 격자에 스냅 (polygon_union.snap_vertices) — 공유 정점이 하나의 id가 됨
+2. 이웃 정점이 2개가 아닌 정점(junction)에서 링을 잘라 arc로 분리
+3. arc 정점 id 열을 (방향 정규화 후) 해시해 한 번만 저장, 링은 arc 참조 목록으로
+   (역방향 참조는 TopoJSON처럼 ~index)
+4. arc 좌표는 arc별 첫 정점 절대값 + 이후 차분의 int32 배열
+
+링/피처 좌표는 필요할 때 arc를 이어 붙여 복원한다.
+LOD 단순화는 arc 단위로 한다 (simplify.simplify_topology) — 공유 경계가 이웃 양쪽에서 같게 줄어든다.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict
+
+import numpy as np
+
+from src.utils.gis.packed_geometry import PackedPolygons, PackedRings, _counts_to_offsets
+from src.utils.gis.polygon_union import snap_vertices
+
+
+@dataclass
+class Topology:
+    quantum: float            # 격자 간격 (좌표 단위)
+    origin: np.ndarray        # (2,) int64 격자 원점
+    arc_deltas: np.ndarray    # (M, 2) int32 arc별 첫 정점 절대값 + 차분
+    arc_offsets: np.ndarray   # (A + 1,) int64
+    ring_arcs: np.ndarray     # (K,) int64 arc 참조 (음수 ~i는 역방향)
+    ring_offsets: np.ndarray  # (R + 1,) int64 — ring_arcs 기준
+    part_offsets: np.ndarray  # (P + 1,) int64
+    geom_offsets: np.ndarray  # (F + 1,) int64
+
+    @classmethod
+    def from_polygons(cls, polygons: PackedPolygons, quantum: float = 1e-3) -> "Topology":
+        vid, vxy = snap_vertices(polygons.coords, quantum)
+        rings = PackedRings(polygons.coords, polygons.ring_offsets)
+        # 스냅으로 생긴 연속 중복 정점과 닫힘 정점(첫 정점 반복) 제거
+        keep = vid != vid[rings._next_index()]
+        seq = vid[keep]
+        open_offsets = _counts_to_offsets(
+            np.bincount(rings.ring_ids()[keep], minlength=len(rings))
+        )
+        nxt = PackedRings(seq, open_offsets)._next_index()
+
+        # 이웃 정점 수 (중복 없는 무향 간선 기준)
+        n_vertices = len(vxy)
+        lo, hi = np.minimum(seq, seq[nxt]), np.maximum(seq, seq[nxt])
+        edges = np.unique(lo * n_vertices + hi)
+        degree = np.bincount(edges // n_vertices, minlength=n_vertices) + np.bincount(
+            edges % n_vertices, minlength=n_vertices
+        )
+        junction = degree != 2
+
+        arc_index: Dict[bytes, int] = {}
+        arcs, refs, ring_counts = [], [], []
+        for s, e in zip(open_offsets[:-1].tolist(), open_offsets[1:].tolist()):
+            ring = seq[s:e]
+            if len(ring) == 0:
+                ring_counts.append(0)
+                continue
+            cuts = np.flatnonzero(junction[ring])
+            if len(cuts) == 0:
+                # junction 없는 링(섬/완전히 둘러싸인 hole)은 최소 id에서 시작하는 닫힌 arc 하나
+                ring = np.roll(ring, -int(np.argmin(ring)))
+                pieces = [np.append(ring, ring[0])]
+            else:
+                ring = np.roll(ring, -int(cuts[0]))
+                closed = np.append(ring, ring[0])
+                bounds = np.append(cuts - cuts[0], len(ring))
+                pieces = [closed[a:b + 1] for a, b in zip(bounds[:-1], bounds[1:])]
+            for piece in pieces:
+                first, last = piece[0], piece[-1]
+                backward = first > last or (first == last and piece[1] > piece[-2])
+                canonical = piece[::-1] if backward else piece
+                key = canonical.tobytes()
+                index = arc_index.get(key)
+                if index is None:
+                    index = arc_index[key] = len(arcs)
+                    arcs.append(canonical)
+                refs.append(~index if backward else index)
+            ring_counts.append(len(pieces))
+
+        arc_offsets = _counts_to_offsets([len(a) for a in arcs])
+        if arcs:
+            grid = vxy[np.concatenate(arcs)]
+            origin = grid.min(axis=0)
+            grid = grid - origin
+        else:
+            grid = np.empty((0, 2), dtype=np.int64)
+            origin = np.zeros(2, dtype=np.int64)
+        return cls(
+            float(quantum),
+            origin.astype(np.int64),
+            _grid_deltas(grid, arc_offsets),
+            arc_offsets,
+            np.asarray(refs, dtype=np.int64),
+            _counts_to_offsets(ring_counts),
+            polygons.part_offsets,
+            polygons.geom_offsets,
+        )
+
+    def __len__(self) -> int:
+        return len(self.geom_offsets) - 1
+
+    @property
+    def n_arcs(self) -> int:
+        return len(self.arc_offsets) - 1
+
+    def _arc_grid(self, arcs: np.ndarray) -> np.ndarray:
+        """arc 목록의 격자 좌표 (차분 복원, arc별로 이어 붙인 순서)"""
+        starts, ends = self.arc_offsets[arcs], self.arc_offsets[arcs + 1]
+        counts = ends - starts
+        idx = np.repeat(starts - _counts_to_offsets(counts)[:-1], counts) + np.arange(counts.sum())
+        deltas = self.arc_deltas[idx].astype(np.int64)
+        # arc 안에서만 누적합
+        total = np.cumsum(deltas, axis=0)
+        arc_start = _counts_to_offsets(counts)[:-1]
+        base = np.zeros((len(arcs), 2), dtype=np.int64)
+        nonfirst = arc_start > 0
+        base[nonfirst] = total[arc_start[nonfirst] - 1]
+        return total - np.repeat(base, counts, axis=0)
+
+    def arc_coords(self) -> np.ndarray:
+        """(M, 2) 전체 arc 정점 좌표 (arc_offsets 구간, 원래 좌표 단위)"""
+        grid = self._arc_grid(np.arange(self.n_arcs))
+        return (grid + self.origin).astype(np.float64) * self.quantum
+
+    def filter_arc_vertices(self, keep: np.ndarray) -> "Topology":
+        """
+        arc 정점 마스크 (M,) 적용 — 모든 링이 같은 arc를 참조하므로 공유 경계가 한 번에 줄어든다.
+        arc 양 끝(junction)은 keep이어야 링이 이어진다
+        """
+        arc_ids = np.repeat(np.arange(self.n_arcs), np.diff(self.arc_offsets))
+        arc_offsets = _counts_to_offsets(np.bincount(arc_ids[keep], minlength=self.n_arcs))
+        grid = self._arc_grid(np.arange(self.n_arcs))[keep]
+        return replace(self, arc_deltas=_grid_deltas(grid, arc_offsets), arc_offsets=arc_offsets)
+
+    def _assemble(self, refs: np.ndarray, ring_offsets: np.ndarray):
+        """
+        arc 참조 열 -> (닫힌 링 좌표, 링 오프셋)
+        arc마다 마지막 정점은 다음 arc의 첫 정점과 같으므로 생략하고 링 끝에 첫 정점을 다시 붙인다
+        """
+        arcs = np.where(refs < 0, ~refs, refs)
+        unique, inverse = np.unique(arcs, return_inverse=True)
+        grid = self._arc_grid(unique)
+        local = _counts_to_offsets(np.diff(self.arc_offsets)[unique])
+        starts, ends = local[:-1][inverse], local[1:][inverse]
+        counts = ends - starts - 1
+        forward = refs >= 0
+        first = np.where(forward, starts, ends - 1)
+        step = np.where(forward, 1, -1)
+        within = np.arange(counts.sum()) - np.repeat(_counts_to_offsets(counts)[:-1], counts)
+        points = grid[np.repeat(first, counts) + np.repeat(step, counts) * within]
+
+        n_rings = len(ring_offsets) - 1
+        ring_of_ref = np.repeat(np.arange(n_rings), np.diff(ring_offsets))
+        open_counts = np.bincount(ring_of_ref, weights=counts, minlength=n_rings).astype(np.int64)
+        open_offsets = _counts_to_offsets(open_counts)
+        nonempty = open_counts > 0
+        closed = np.insert(
+            points, open_offsets[1:][nonempty], points[open_offsets[:-1][nonempty]], axis=0
+        )
+        coords = (closed + self.origin).astype(np.float64) * self.quantum
+        return coords, _counts_to_offsets(open_counts + nonempty)
+
+    def ring(self, i: int) -> np.ndarray:
+        """링 i만 복원 (n, 2)"""
+        refs = self.ring_arcs[self.ring_offsets[i]:self.ring_offsets[i + 1]]
+        coords, _ = self._assemble(refs, np.array([0, len(refs)], dtype=np.int64))
+        return coords
+
+    def feature(self, i: int) -> list:
+        """피처 i만 복원 -> [part][ring] 좌표 배열"""
+        return [
+            [self.ring(r) for r in range(self.part_offsets[p], self.part_offsets[p + 1])]
+            for p in range(self.geom_offsets[i], self.geom_offsets[i + 1])
+        ]
+
+    def to_polygons(self) -> PackedPolygons:
+        """전체 복원 (한 번에 벡터화)"""
+        coords, ring_offsets = self._assemble(self.ring_arcs, self.ring_offsets)
+        return PackedPolygons(coords, ring_offsets, self.part_offsets, self.geom_offsets)
+
+    def to_arrays(self, prefix: str = "") -> dict:
+        return {
+            f"{prefix}quantum": np.array(self.quantum),
+            f"{prefix}origin": self.origin,
+            f"{prefix}arc_deltas": self.arc_deltas,
+            f"{prefix}arc_offsets": self.arc_offsets,
+            f"{prefix}ring_arcs": self.ring_arcs,
+            f"{prefix}ring_offsets": self.ring_offsets,
+            f"{prefix}part_offsets": self.part_offsets,
+            f"{prefix}geom_offsets": self.geom_offsets,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict, prefix: str = "") -> "Topology":
+        return cls(
+            float(arrays[f"{prefix}quantum"]),
+            arrays[f"{prefix}origin"],
+            arrays[f"{prefix}arc_deltas"],
+            arrays[f"{prefix}arc_offsets"],
+            arrays[f"{prefix}ring_arcs"],
+            arrays[f"{prefix}ring_offsets"],
+            arrays[f"{prefix}part_offsets"],
+            arrays[f"{prefix}geom_offsets"],
+        )
+
+
+def _grid_deltas(grid: np.ndarray, arc_offsets: np.ndarray) -> np.ndarray:
+    """arc별 첫 정점 절대값 + 이후 차분 (int32)"""
+    deltas = grid.copy()
+    deltas[1:] -= grid[:-1]
+    firsts = arc_offsets[:-1][np.diff(arc_offsets) > 0]
+    deltas[firsts] = grid[firsts]
+    return deltas.astype(np.int32)
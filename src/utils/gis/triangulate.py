@@ -0,0 +1,392 @@
+"""
+법정동 경계 삼각분할 (Brep.CreatePlanarBreps + Mesh.CreateFromBrep의 헤드리스 대체)
+
+1. 링 정리: 닫힘/연속 중복 정점 제거, 외곽 반시계·hole 시계로 방향 정규화
+2. hole 연결: hole의 최우측 정점에서 +x 방향 광선으로 보이는 외곽 정점을 찾아 다리(bridge)로 잇는다
+3. ear clipping: 모든 폴리곤을 한 번에 — 라운드마다 모든 정점의 볼록/ear 여부를 벡터화 판정하고
+   서로 이웃하지 않는 ear(와 일직선 정점)를 동시에 잘라낸다
+4. 변 길이 세분: 최대 변이 max_edge보다 긴 삼각형의 최장변을 이등분하고,
+   그 변을 공유하는 이웃도 같은 중점으로 나눠 (T-junction 없이) 반복
+
+결과는 하나로 합친 인덱스 메시 (정점/면 버퍼 + 법정동별 면/정점 범위)
+정점 버퍼는 (V, 2) float64라 idw(queries=mesh.vertices)에 그대로 넣을 수 있다.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from src.utils.gis.packed_geometry import PackedPolygons, PackedRings, _counts_to_offsets
+
+_PAIR_CHUNK = 1 << 22  # ear 판정 (후보, 방해 정점) 쌍 한 번에 처리할 개수
+
+
+@dataclass
+class TriangleMesh:
+    vertices: np.ndarray        # (V, 2) float64
+    faces: np.ndarray           # (T, 3) int32 — 반시계
+    face_offsets: np.ndarray    # (F + 1,) 법정동 i의 면 = faces[face_offsets[i]:face_offsets[i + 1]]
+    vertex_offsets: np.ndarray  # (F + 1,) 법정동 i의 정점 범위
+
+    def __len__(self) -> int:
+        return len(self.face_offsets) - 1
+
+    def face_feature_ids(self) -> np.ndarray:
+        return np.repeat(np.arange(len(self)), np.diff(self.face_offsets))
+
+    def feature(self, i: int):
+        """법정동 i -> (정점 (n, 2), 지역 인덱스 면 (t, 3))"""
+        v0, v1 = self.vertex_offsets[i], self.vertex_offsets[i + 1]
+        return (
+            self.vertices[v0:v1],
+            self.faces[self.face_offsets[i]:self.face_offsets[i + 1]] - v0,
+        )
+
+    def face_areas(self) -> np.ndarray:
+        a, b, c = (self.vertices[self.faces[:, k]] for k in range(3))
+        return 0.5 * _cross(a, b, c)
+
+    def areas(self) -> np.ndarray:
+        """법정동별 메시 면적"""
+        return np.bincount(self.face_feature_ids(), weights=self.face_areas(), minlength=len(self))
+
+    def to_arrays(self, prefix: str = "") -> dict:
+        return {
+            f"{prefix}vertices": self.vertices,
+            f"{prefix}faces": self.faces,
+            f"{prefix}face_offsets": self.face_offsets,
+            f"{prefix}vertex_offsets": self.vertex_offsets,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict, prefix: str = "") -> "TriangleMesh":
+        return cls(
+            arrays[f"{prefix}vertices"],
+            arrays[f"{prefix}faces"],
+            arrays[f"{prefix}face_offsets"],
+            arrays[f"{prefix}vertex_offsets"],
+        )
+
+
+def _cross(o: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (a[..., 1] - o[..., 1]) * (b[..., 0] - o[..., 0])
+
+
+def _bridge_hole(outer: np.ndarray, hole: np.ndarray, xy: np.ndarray) -> np.ndarray:
+    """
+    hole(시계)을 외곽(반시계) 정점 열에 잇기 — 외곽 ... P, M, hole ..., M, P, ... 외곽
+    M: hole 최우측 정점, P: M에서 +x 방향으로 보이는 외곽 정점
+    """
+    m = int(np.argmax(xy[hole, 0]))
+    mx, my = xy[hole[m]]
+    a, b = xy[outer], xy[np.roll(outer, -1)]
+    straddle = ((a[:, 1] <= my) & (b[:, 1] >= my) | (b[:, 1] <= my) & (a[:, 1] >= my)) & (a[:, 1] != b[:, 1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ix = a[:, 0] + (my - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+    hit = straddle & (ix >= mx)
+    if hit.any():
+        e = int(np.flatnonzero(hit)[np.argmin(ix[hit])])
+        p = e if a[e, 0] >= b[e, 0] else (e + 1) % len(outer)
+        tri = np.array([[mx, my], [ix[e], my], xy[outer[p]]])
+        if _cross(tri[0], tri[1], tri[2]) < 0:
+            tri = tri[[0, 2, 1]]
+        # 삼각형 (M, I, P) 안의 외곽 정점이 있으면 광선과의 각이 가장 작은 정점으로
+        pts = xy[outer]
+        inside = (
+            (_cross(tri[0], tri[1], pts) >= 0)
+            & (_cross(tri[1], tri[2], pts) >= 0)
+            & (_cross(tri[2], tri[0], pts) >= 0)
+            & (pts[:, 0] > mx)
+        )
+        inside[p] = False
+        if inside.any():
+            cand = np.flatnonzero(inside)
+            d = pts[cand] - (mx, my)
+            p = int(cand[np.lexsort((np.hypot(d[:, 0], d[:, 1]), np.abs(d[:, 1]) / d[:, 0]))[0]])
+    else:
+        d = xy[outer] - (mx, my)
+        p = int(np.argmin(np.hypot(d[:, 0], d[:, 1])))
+    h = np.roll(hole, -m)
+    return np.concatenate((outer[:p + 1], h, h[:1], outer[p:]))
+
+
+def _prepare(polygons: PackedPolygons):
+    """-> (정점 (V, 2), part별 정점 인덱스 열 목록, part별 피처 id)"""
+    rings = PackedRings(polygons.coords, polygons.ring_offsets)
+    nxt = rings._next_index()
+    keep = np.any(polygons.coords != polygons.coords[nxt], axis=1)
+    xy = polygons.coords[keep]
+    offsets = _counts_to_offsets(np.bincount(rings.ring_ids()[keep], minlength=len(rings)))
+    signed = PackedRings(xy, offsets).signed_areas()
+    exterior = polygons.exterior_mask()
+    part_feature = np.repeat(np.arange(len(polygons)), np.diff(polygons.geom_offsets))
+
+    sequences: List[np.ndarray] = []
+    features: List[int] = []
+    for part in range(len(polygons.part_offsets) - 1):
+        outer, holes = None, []
+        for r in range(polygons.part_offsets[part], polygons.part_offsets[part + 1]):
+            seq = np.arange(offsets[r], offsets[r + 1])
+            if len(seq) < 3 or signed[r] == 0:
+                continue
+            if (signed[r] > 0) != exterior[r]:
+                seq = seq[::-1]
+            if exterior[r]:
+                outer = seq
+            else:
+                holes.append(seq)
+        if outer is None:
+            continue
+        for hole in sorted(holes, key=lambda h: -xy[h, 0].max()):
+            outer = _bridge_hole(outer, hole, xy)
+        sequences.append(outer)
+        features.append(int(part_feature[part]))
+    return xy, sequences, np.asarray(features, dtype=np.int64)
+
+
+def _blocked(cand, blockers, poly, node_xy, prev, nxt) -> np.ndarray:
+    """후보 ear 삼각형 안(경계 포함)에 같은 폴리곤의 비볼록 정점이 있으면 True"""
+    blocked = np.zeros(len(cand), dtype=bool)
+    if len(cand) == 0 or len(blockers) == 0:
+        return blocked
+    # (폴리곤, x) 순으로 정렬해 두고 후보 삼각형의 x 범위에 드는 방해 정점만 짝짓는다
+    x0 = node_xy[:, 0].min()
+    span = node_xy[:, 0].max() - x0 + 1.0
+    bkey = poly[blockers] * span + (node_xy[blockers, 0] - x0)
+    order = np.argsort(bkey)
+    blockers, bkey = blockers[order], bkey[order]
+    tri_x = np.column_stack((node_xy[prev[cand], 0], node_xy[cand, 0], node_xy[nxt[cand], 0]))
+    base = poly[cand] * span - x0
+    lo = np.searchsorted(bkey, base + tri_x.min(axis=1) - 1e-6, "left")
+    hi = np.searchsorted(bkey, base + tri_x.max(axis=1) + 1e-6, "right")
+    counts = hi - lo
+    chunk_starts = _counts_to_offsets(counts)
+    start = 0
+    while start < len(cand):
+        stop = int(np.searchsorted(chunk_starts, chunk_starts[start] + _PAIR_CHUNK, "right")) - 1
+        stop = min(max(stop, start + 1), len(cand))
+        c_counts = counts[start:stop]
+        ci = np.repeat(np.arange(start, stop), c_counts)
+        bi = blockers[
+            np.repeat(lo[start:stop], c_counts)
+            + np.arange(c_counts.sum())
+            - np.repeat(_counts_to_offsets(c_counts)[:-1], c_counts)
+        ]
+        v = cand[ci]
+        a, b, c, r = node_xy[prev[v]], node_xy[v], node_xy[nxt[v]], node_xy[bi]
+        coincident = (
+            np.all(r == a, axis=1) | np.all(r == b, axis=1) | np.all(r == c, axis=1)
+        )
+        inside = (
+            (_cross(a, b, r) >= 0) & (_cross(b, c, r) >= 0) & (_cross(c, a, r) >= 0) & ~coincident
+        )
+        blocked |= np.bincount(ci[inside], minlength=len(cand)).astype(bool)
+        start = stop
+    return blocked
+
+
+def _earcut(xy: np.ndarray, sequences: List[np.ndarray]):
+    """모든 폴리곤을 동시에 ear clipping -> (면 (T, 3) 정점 인덱스, 면별 폴리곤 id)"""
+    lengths = np.array([len(s) for s in sequences], dtype=np.int64)
+    node_vertex = np.concatenate(sequences) if sequences else np.empty(0, dtype=np.int64)
+    poly = np.repeat(np.arange(len(sequences)), lengths)
+    offsets = _counts_to_offsets(lengths)
+    idx = np.arange(len(node_vertex))
+    nxt = idx + 1
+    prev = idx - 1
+    nxt[offsets[1:] - 1] = offsets[:-1]
+    prev[offsets[:-1]] = offsets[1:] - 1
+    node_xy = xy[node_vertex]
+    alive = np.ones(len(node_vertex), dtype=bool)
+    # 동시에 자를 ear를 고르는 결정적 우선순위
+    priority = (idx * 2654435761) % (1 << 32)
+
+    faces, face_poly = [], []
+    while True:
+        live = np.flatnonzero(alive)
+        if len(live) == 0:
+            break
+        count = np.bincount(poly[live], minlength=len(sequences))
+        small = count[poly[live]] <= 3
+        if small.any():
+            # 남은 삼각형은 그대로 면이 되고 (2개 이하는 버림) 폴리곤 종료
+            last = live[small]
+            first = last[np.unique(poly[last], return_index=True)[1]]
+            first = first[count[poly[first]] == 3]
+            tri = np.column_stack((prev[first], first, nxt[first]))
+            ok = _cross(node_xy[tri[:, 0]], node_xy[tri[:, 1]], node_xy[tri[:, 2]]) > 0
+            faces.append(node_vertex[tri[ok]])
+            face_poly.append(poly[first[ok]])
+            alive[last] = False
+            live = live[~small]
+            if len(live) == 0:
+                break
+
+        p, n = prev[live], nxt[live]
+        a, b, c = node_xy[p], node_xy[live], node_xy[n]
+        cross = _cross(a, b, c)
+        scale = np.hypot(*(b - a).T) * np.hypot(*(c - b).T)
+        collinear = np.abs(cross) <= 1e-12 * scale
+        convex = ~collinear & (cross > 0)
+
+        cand = live[convex]
+        ear = np.zeros(len(live), dtype=bool)
+        ear[convex] = ~_blocked(cand, live[~convex], poly, node_xy, prev, nxt)
+
+        removable = np.zeros(len(node_vertex), dtype=bool)
+        removable[live] = ear | collinear
+        pr = priority
+        chosen = removable[live] & (
+            (~removable[p] | (pr[live] < pr[p])) & (~removable[n] | (pr[live] < pr[n]))
+        )
+        # ear가 하나도 없는 폴리곤(수치 오차)은 볼록 정점 하나를 강제로 자른다
+        stuck = np.ones(len(sequences), dtype=bool)
+        stuck[poly[live[chosen]]] = False
+        stuck_live = stuck[poly[live]]
+        if stuck_live.any():
+            forced_pool = np.flatnonzero(stuck_live & convex)
+            forced_pool = np.concatenate((forced_pool, np.flatnonzero(stuck_live & ~convex)))
+            forced = forced_pool[np.unique(poly[live[forced_pool]], return_index=True)[1]]
+            chosen[forced] = True
+
+        v = live[chosen]
+        tri_ok = convex[chosen]
+        tri = np.column_stack((p[chosen], v, n[chosen]))[tri_ok]
+        faces.append(node_vertex[tri])
+        face_poly.append(poly[v[tri_ok]])
+        nxt[p[chosen]] = n[chosen]
+        prev[n[chosen]] = p[chosen]
+        alive[v] = False
+
+    if not faces:
+        return np.empty((0, 3), dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(faces), np.concatenate(face_poly)
+
+
+def _incircle(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """d가 반시계 삼각형 (a, b, c)의 외접원 안이면 양수"""
+    ad, bd, cd = a - d, b - d, c - d
+    return (
+        (ad[:, 0] ** 2 + ad[:, 1] ** 2) * (bd[:, 0] * cd[:, 1] - cd[:, 0] * bd[:, 1])
+        - (bd[:, 0] ** 2 + bd[:, 1] ** 2) * (ad[:, 0] * cd[:, 1] - cd[:, 0] * ad[:, 1])
+        + (cd[:, 0] ** 2 + cd[:, 1] ** 2) * (ad[:, 0] * bd[:, 1] - bd[:, 0] * ad[:, 1])
+    )
+
+
+def _flip_to_delaunay(xy: np.ndarray, faces: np.ndarray, max_rounds: int = 256) -> np.ndarray:
+    """
+    Lawson 간선 뒤집기 — ear clipping이 남긴 가는 삼각형을 정리 (경계 간선은 그대로)
+    라운드마다 Delaunay 조건을 어기는 내부 간선 중 면을 공유하지 않는 것들을 한꺼번에 뒤집는다
+    """
+    faces = faces.copy()
+    n_vertices = len(xy)
+    for _ in range(max_rounds):
+        a = faces.ravel()
+        b = np.roll(faces, -1, axis=1).ravel()
+        key = np.minimum(a, b) * n_vertices + np.maximum(a, b)
+        order = np.argsort(key, kind="stable")
+        pair = np.flatnonzero(key[order[1:]] == key[order[:-1]])
+        e1, e2 = order[pair], order[pair + 1]  # 같은 간선을 가진 두 (면*3 + 변) 슬롯
+        f1, k1, f2, k2 = e1 // 3, e1 % 3, e2 // 3, e2 % 3
+        c1 = faces[f1, (k1 + 2) % 3]
+        c2 = faces[f2, (k2 + 2) % 3]
+        pa, pb = faces[f1, k1], faces[f1, (k1 + 1) % 3]
+        scale = np.abs(_cross(xy[pa], xy[pb], xy[c1])) + np.abs(_cross(xy[pb], xy[pa], xy[c2]))
+        bad = _incircle(xy[pa], xy[pb], xy[c1], xy[c2]) > 1e-9 * scale ** 2 / np.maximum(
+            np.einsum("ij,ij->i", xy[pb] - xy[pa], xy[pb] - xy[pa]), 1e-300
+        )
+        # 뒤집은 뒤에도 두 삼각형이 반시계인지 (오목 사각형 방지)
+        bad &= (_cross(xy[pa], xy[c2], xy[c1]) > 0) & (_cross(xy[c2], xy[pb], xy[c1]) > 0)
+        if not bad.any():
+            break
+        edge = np.flatnonzero(bad)
+        face_min = np.full(len(faces), len(pair), dtype=np.int64)
+        np.minimum.at(face_min, f1[edge], edge)
+        np.minimum.at(face_min, f2[edge], edge)
+        edge = edge[(face_min[f1[edge]] == edge) & (face_min[f2[edge]] == edge)]
+        faces[f1[edge]] = np.column_stack((pa[edge], c2[edge], c1[edge]))
+        faces[f2[edge]] = np.column_stack((c2[edge], pb[edge], c1[edge]))
+    return faces
+
+
+def _refine(xy: np.ndarray, faces: np.ndarray, face_feature: np.ndarray, max_edge: float):
+    """
+    최장변 이등분 (이웃도 같은 변을 나눠 conforming 유지) — 모든 변이 max_edge 이하가 될 때까지
+    나뉘는 변은 항상 max_edge보다 길기 때문에 모든 변이 짧아진 면은 다시 건드릴 일이 없어 따로 빼 둔다
+    """
+    done_faces, done_feature = [], []
+    while len(faces):
+        a = faces
+        b = np.roll(faces, -1, axis=1)
+        length = np.hypot(*(xy[b] - xy[a]).transpose(2, 0, 1))
+        longest = np.argmax(length, axis=1)
+        need = length[np.arange(len(faces)), longest] > max_edge
+        if not need.any():
+            break
+        settled = ~(length > max_edge).any(axis=1)
+        done_faces.append(faces[settled])
+        done_feature.append(face_feature[settled])
+        faces, face_feature = faces[~settled], face_feature[~settled]
+        a, b, longest, need = a[~settled], b[~settled], longest[~settled], need[~settled]
+        n_vertices = len(xy)
+        key = np.minimum(a, b) * n_vertices + np.maximum(a, b)
+        split = np.unique(key[need, longest[need]])
+        pos = np.minimum(np.searchsorted(split, key), len(split) - 1)
+        marked = split[pos] == key
+        mid = np.where(marked, n_vertices + pos, -1)
+        xy = np.vstack((xy, 0.5 * (xy[split // n_vertices] + xy[split % n_vertices])))
+
+        cnt = marked.sum(axis=1)
+        new_faces, new_feature = [faces[cnt == 0]], [face_feature[cnt == 0]]
+        # 표시된 변 배치가 (0), (0, 1), (0, 1, 2)가 되도록 회전
+        rot = np.where(cnt == 1, np.argmax(marked, axis=1), (np.argmin(marked, axis=1) + 1) % 3)
+        order = (rot[:, None] + np.arange(3)) % 3
+        v = np.take_along_axis(faces, order, axis=1)
+        m = np.take_along_axis(mid, order, axis=1)
+        for k, pattern in (
+            (1, ((0, 3, 2), (3, 1, 2))),
+            (2, ((3, 1, 4), (0, 3, 4), (0, 4, 2))),
+            (3, ((0, 3, 5), (3, 1, 4), (5, 4, 2), (3, 4, 5))),
+        ):
+            sel = cnt == k
+            if not sel.any():
+                continue
+            corners = np.hstack((v[sel], m[sel]))
+            for tri in pattern:
+                new_faces.append(corners[:, tri])
+                new_feature.append(face_feature[sel])
+        faces = np.concatenate(new_faces)
+        face_feature = np.concatenate(new_feature)
+    return xy, np.concatenate(done_faces + [faces]), np.concatenate(done_feature + [face_feature])
+
+
+def triangulate(polygons: PackedPolygons, max_edge: Optional[float] = None) -> TriangleMesh:
+    """
+    모든 법정동 -> 하나의 TriangleMesh
+
+    max_edge: 최대 변 길이 (좌표 단위, UTM이면 m). None이면 세분 없이 ear clipping 결과만
+    """
+    xy, sequences, part_feature = _prepare(polygons)
+    faces, face_part = _earcut(xy, sequences)
+    face_feature = part_feature[face_part] if len(faces) else face_part
+    faces = _flip_to_delaunay(xy, faces)
+    if max_edge is not None and max_edge > 0:
+        xy, faces, face_feature = _refine(xy, faces, face_feature, max_edge)
+
+    # 피처별로 면/정점을 연속 배치 (면에 쓰이지 않는 일직선 정점은 제외)
+    order = np.argsort(face_feature, kind="stable")
+    faces, face_feature = faces[order], face_feature[order]
+    vertex_feature = np.full(len(xy), -1, dtype=np.int64)
+    vertex_feature[faces.ravel()] = np.repeat(face_feature, 3)
+    used = np.flatnonzero(vertex_feature >= 0)
+    used = used[np.argsort(vertex_feature[used], kind="stable")]
+    remap = np.empty(len(xy), dtype=np.int64)
+    remap[used] = np.arange(len(used))
+    n_features = len(polygons)
+    return TriangleMesh(
+        xy[used],
+        remap[faces].astype(np.int32),
+        _counts_to_offsets(np.bincount(face_feature, minlength=n_features)),
+        _counts_to_offsets(np.bincount(vertex_feature[used], minlength=n_features)),
+    )
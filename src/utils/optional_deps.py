@@ -0,0 +1,33 @@
+"""
+선택 의존성 확인 (Rhino, openpyxl, pyarrow, scipy)
+
+find_spec만 보므로 확인 자체는 모듈을 import하지 않는다.
+무거운 필수 의존성(pandas, requests, dotenv)은 각 모듈이 쓰는 함수 안에서 import한다.
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+
+_INSTALL_HINTS = {
+    "Rhino": "run inside Rhino 8 / Grasshopper",
+    "openpyxl": "pip install openpyxl",
+    "pyarrow": "pip install pyarrow",
+    "scipy": "pip install scipy",
+}
+
+
+@lru_cache(maxsize=None)
+def has_module(name: str) -> bool:
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def require(name: str, feature: str):
+    """name 모듈 import — 없으면 어떤 기능에 필요한지 알려 주는 ImportError"""
+    if not has_module(name):
+        hint = _INSTALL_HINTS.get(name, f"pip install {name}")
+        raise ImportError(f"{feature} requires {name} ({hint})")
+    return import_module(name)
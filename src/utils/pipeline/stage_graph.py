@@ -0,0 +1,298 @@
+import hashlib
+import json
+import pickle
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.cache.cache_store import CacheStore
+
+# report()용 실행 기록 상한 (시간 초과 후 뒤에서 끝난 단계도 기록되므로)
+_MAX_RECORDS = 256
+
+
+class StageError(RuntimeError):
+    """run_concurrent()에서 한 단계가 실패 — 원래 예외는 __cause__"""
+
+    def __init__(self, stage: str, message: str):
+        super().__init__(f"Stage '{stage}' failed: {message}")
+        self.stage = stage
+
+
+class StageTimeout(StageError, TimeoutError):
+    """run_concurrent()에서 단계별 제한 시간 초과"""
+
+    def __init__(self, stage: str, timeout: float):
+        super().__init__(stage, f"no result within {timeout}s")
+        self.timeout = timeout
+
+
+@dataclass
+class Stage:
+    """
+    파이프라인 단계
+
+    func는 deps 단계의 출력과 params로 지정한 실행 인자를 키워드 인자로 받는다.
+    persist=False면 메모리에만 memoize (pickle 불가 객체, 자체 캐시가 있는 단계 등)
+    refresh는 invalidate() 때 호출 — 자체 캐시가 있는 원천 단계가 다음 실행에서 그 캐시를
+    건너뛰고 다시 받도록 표시한다 (없으면 memo만 버린다)
+    """
+
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    params: Tuple[str, ...] = ()
+    persist: bool = True
+    version: int = 1
+    refresh: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class StageRecord:
+    name: str
+    fingerprint: str
+    status: str  # "memory" | "disk" | "computed"
+    seconds: float
+
+
+@dataclass
+class StageGraph:
+    """
+    이름 붙은 단계들의 의존 그래프
+
+    단계 fingerprint = hash(이름, 버전, 사용하는 인자 값, 의존 단계 fingerprint)
+    같은 fingerprint의 출력은 메모리에서 재사용하므로
+    인자 하나가 바뀌면 그 인자에 의존하는 하위 단계만 다시 계산된다.
+    디스크(CacheStore) 키는 fingerprint + 의존 단계 출력의 내용 digest이므로
+    원천 데이터가 바뀌면 프로세스를 새로 띄워도 이전 출력을 쓰지 않는다.
+    메모리 memo는 단계마다 최근 memo_size개 fingerprint만 남긴다 (LRU, 데몬처럼 오래 사는
+    프로세스에서 인자 조합마다 출력이 쌓이지 않도록).
+    """
+
+    store: Optional[CacheStore] = None
+    stages: Dict[str, Stage] = field(default_factory=dict)
+    memo_size: int = 4
+    _memo: "OrderedDict[str, Any]" = field(default_factory=OrderedDict, repr=False)
+    _owners: Dict[str, str] = field(default_factory=dict, repr=False)
+    _digests: Dict[str, str] = field(default_factory=dict, repr=False)
+    _epochs: Dict[str, int] = field(default_factory=dict, repr=False)
+    _records: Deque[StageRecord] = field(
+        default_factory=lambda: deque(maxlen=_MAX_RECORDS), repr=False
+    )
+    _pending: Dict[str, Future] = field(default_factory=dict, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        deps: Tuple[str, ...] = (),
+        params: Tuple[str, ...] = (),
+        persist: bool = True,
+        version: int = 1,
+        refresh: Optional[Callable[[], None]] = None,
+    ) -> None:
+        for dep in deps:
+            if dep not in self.stages:
+                raise ValueError(f"Unknown dependency '{dep}' for stage '{name}'")
+        self.stages[name] = Stage(
+            name, func, tuple(deps), tuple(params), persist, version, refresh
+        )
+
+    def fingerprint(self, name: str, params: Dict[str, Any]) -> str:
+        stage = self.stages[name]
+        payload = json.dumps(
+            {
+                "stage": name,
+                "version": stage.version,
+                "epoch": self._epochs.get(name, 0),
+                "params": {p: params.get(p) for p in stage.params},
+                "deps": [self.fingerprint(d, params) for d in stage.deps],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def run(self, target: str, **params) -> Any:
+        """target 단계까지 필요한 단계만 실행하고 target 출력을 반환"""
+        with self._lock:
+            self._records.clear()
+        return self._run(target, params)
+
+    def run_concurrent(
+        self,
+        targets: Sequence[str],
+        timeouts: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None,
+        **params,
+    ) -> Dict[str, Any]:
+        """
+        서로 독립인 targets 단계를 스레드 풀에서 동시에 실행 -> {단계: 출력}
+
+        모두 끝나는 즉시 반환한다. 한 단계가 실패하면 나머지를 기다리지 않고 StageError,
+        timeouts[단계](초, 호출 시점 기준)를 넘기면 StageTimeout.
+        시간 초과한 단계는 스레드를 멈출 수 없으므로 뒤에서 계속 돌고, 끝나면 memo에 남는다
+        (다음 run이 같은 단계를 요청하면 그 계산을 기다린다).
+        """
+        timeouts = timeouts or {}
+        with self._lock:
+            self._records.clear()
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(targets), thread_name_prefix="stage"
+        )
+        try:
+            futures = {executor.submit(self._run, name, params): name for name in targets}
+            pending = set(futures)
+            while pending:
+                deadlines = [
+                    start + timeouts[futures[f]] for f in pending if timeouts.get(futures[f]) is not None
+                ]
+                wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        raise StageError(futures[future], f"{type(error).__name__}: {error}") from error
+                now = time.monotonic()
+                for future in pending:
+                    limit = timeouts.get(futures[future])
+                    if limit is not None and now >= start + limit:
+                        raise StageTimeout(futures[future], limit)
+            return {name: future.result() for future, name in futures.items()}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, name: str, params: Dict[str, Any]) -> Any:
+        """
+        name 단계 출력 — 같은 fingerprint를 다른 스레드가 계산 중이면 그 결과를 기다린다
+        (계산 자체는 lock 밖에서 하므로 run_concurrent의 단계들이 겹쳐 실행된다)
+        """
+        stage = self.stages[name]
+        fp = self.fingerprint(name, params)
+        t0 = time.perf_counter()
+
+        with self._lock:
+            if fp in self._memo:
+                self._memo.move_to_end(fp)
+                self._records.append(StageRecord(name, fp, "memory", time.perf_counter() - t0))
+                return self._memo[fp]
+            pending = self._pending.get(fp)
+            owner = pending is None
+            if owner:
+                pending = self._pending[fp] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            output, status, elapsed = self._compute(stage, fp, params)
+            with self._lock:
+                self._memo[fp] = output
+                self._owners[fp] = name
+                self._evict(name)
+                self._records.append(StageRecord(name, fp, status, elapsed))
+            pending.set_result(output)
+            return output
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(fp, None)
+
+    def _compute(self, stage: Stage, fp: str, params: Dict[str, Any]) -> Tuple[Any, str, float]:
+        """
+        디스크 캐시 또는 실제 계산 -> (출력, 상태, 초)
+
+        디스크 키에는 의존 단계 출력의 내용 digest가 들어가므로, 자체 캐시가 있는 원천 단계
+        (경계/소득/매핑)가 새 데이터를 돌려주면 새 프로세스에서도 하위 단계가 다시 계산된다
+        """
+        inputs = {dep: self._run(dep, params) for dep in stage.deps}
+        t0 = time.perf_counter()
+        key = None
+        if stage.persist and self.store is not None:
+            digests = {
+                dep: self._digest(self.fingerprint(dep, params), output)
+                for dep, output in inputs.items()
+            }
+            key = self._key(stage.name, fp, digests)
+            with self._lock:
+                self._digests[fp] = key  # 영속 단계 출력은 키(입력 내용)로 결정된다
+            data = self.store.get_bytes(key)
+            if data is not None:
+                return pickle.loads(data), "disk", time.perf_counter() - t0
+
+        output = stage.func(**inputs, **{p: params.get(p) for p in stage.params})
+        elapsed = time.perf_counter() - t0
+        if key is not None:
+            self.store.put_bytes(key, pickle.dumps(output, protocol=pickle.HIGHEST_PROTOCOL))
+        return output, "computed", elapsed
+
+    def _forget(self, fp: str) -> None:
+        self._memo.pop(fp, None)
+        self._digests.pop(fp, None)
+        self._owners.pop(fp, None)
+
+    def _evict(self, name: str) -> None:
+        """name 단계의 memo가 memo_size개를 넘으면 가장 오래 안 쓴 것부터 버린다 (lock 안에서 호출)"""
+        fps = [fp for fp in self._memo if self._owners.get(fp) == name]
+        for fp in fps[:max(0, len(fps) - self.memo_size)]:
+            self._forget(fp)
+
+    def _digest(self, fp: str, output: Any) -> str:
+        """단계 출력의 내용 digest (fingerprint별로 한 번만 계산)"""
+        with self._lock:
+            digest = self._digests.get(fp)
+        if digest is None:
+            data = pickle.dumps(output, protocol=pickle.HIGHEST_PROTOCOL)
+            digest = hashlib.sha256(data).hexdigest()
+            with self._lock:
+                if fp in self._owners:  # 그 사이 memo에서 밀려난 출력은 기록하지 않는다
+                    self._digests[fp] = digest
+        return digest
+
+    def _key(self, name: str, fp: str, digests: Dict[str, str]) -> str:
+        return CacheStore.make_key(
+            f"stage/{name}", {"fingerprint": fp, "inputs": digests}, self.stages[name].version
+        )
+
+    def _downstream(self, name: str) -> set:
+        """name과 name에 (간접) 의존하는 모든 단계"""
+        names = {name}
+        changed = True
+        while changed:
+            changed = False
+            for stage in self.stages.values():
+                if stage.name not in names and names.intersection(stage.deps):
+                    names.add(stage.name)
+                    changed = True
+        return names
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        name 단계(None이면 전체)의 epoch를 올려 그 단계와 하위 단계의 fingerprint를 바꾼다.
+        이전 출력은 메모리에서 버리고, 디스크 항목은 더 이상 참조되지 않아 LRU로 정리된다.
+        대상 단계에 refresh가 있으면 호출해 원천의 자체 캐시(경계/소득 등)도 다시 받게 한다.
+        """
+        with self._lock:
+            targets = list(self.stages) if name is None else [name]
+            for target in targets:
+                self._epochs[target] = self._epochs.get(target, 0) + 1
+                if self.stages[target].refresh is not None:
+                    self.stages[target].refresh()
+            names = set(self.stages) if name is None else self._downstream(name)
+            for fp, owner in list(self._owners.items()):
+                if owner in names:
+                    self._forget(fp)
+
+    def report(self) -> List[dict]:
+        """마지막 run()의 단계별 상태/시간 (실행 순서)"""
+        return [
+            {"stage": r.name, "status": r.status, "seconds": r.seconds}
+            for r in self._records
+        ]
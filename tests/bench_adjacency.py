@@ -0,0 +1,65 @@
+"""
+법정동 인접 가중치 + Moran's I 벤치마크 — 서울 크기(약 36 x 30 km)의 합성 법정동 분할
+
+- contiguity: queen / rook 가중치 생성 (공유 정점/간선 키 정렬)
+- morans_i: 전역 Moran's I, 순열 B회 (workers 1 vs N, 같은 시드면 같은 p값)
+- local_morans_i: 피처별 LISA, 조건부 순열 B회
+
+사용:
+    python -m tests.bench_adjacency                  # 법정동 ~470개, 순열 999회
+    python -m tests.bench_adjacency --permutations 9999 --workers 8
+"""
+
+import os
+import time
+
+import numpy as np
+
+from src.utils.gis.adjacency import contiguity, local_morans_i, morans_i
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _timed(func):
+    t0 = time.perf_counter()
+    out = func()
+    return time.perf_counter() - t0, out
+
+
+def run(nx: int, ny: int, permutations: int, workers: int) -> None:
+    polygons, _ = synthetic_districts(nx, ny)
+    centroids = polygons.centroids()
+    # 동서 경사 + 잡음 — 양의 공간 자기상관
+    values = centroids[:, 0] / 1000 + np.random.default_rng(1).normal(0, 5, len(polygons))
+    print(f"districts {len(polygons)}, vertices {len(polygons.coords)}, permutations {permutations}")
+
+    for mode in ("queen", "rook"):
+        t, w = _timed(lambda: contiguity(polygons, mode))
+        print(f"contiguity {mode:5s} {t * 1e3:9.2f} ms  links {len(w.indices)}, "
+              f"mean {w.cardinalities.mean():.2f}, islands {len(w.islands)}")
+    w = w.row_standardized()
+
+    t1, serial = _timed(lambda: morans_i(w, values, permutations, seed=0))
+    print(f"morans_i  workers=1 {t1 * 1e3:9.2f} ms  I {serial.I:.4f}, p {serial.p_sim:.4f}")
+    if workers > 1:
+        tn, parallel = _timed(lambda: morans_i(w, values, permutations, seed=0, workers=workers))
+        print(f"morans_i  workers={workers} {tn * 1e3:9.2f} ms  x{t1 / tn:.1f}, "
+              f"same p {parallel.p_sim == serial.p_sim}")
+
+    t1, local = _timed(lambda: local_morans_i(w, values, permutations, seed=0))
+    significant = int((local.p_sim < 0.05).sum())
+    print(f"local     workers=1 {t1 * 1e3:9.2f} ms  p<0.05 {significant}/{len(polygons)}")
+    if workers > 1:
+        tn, _ = _timed(lambda: local_morans_i(w, values, permutations, seed=0, workers=workers))
+        print(f"local     workers={workers} {tn * 1e3:9.2f} ms  x{t1 / tn:.1f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Contiguity weights / Moran's I benchmark")
+    parser.add_argument("--nx", type=int, default=26)
+    parser.add_argument("--ny", type=int, default=18)
+    parser.add_argument("--permutations", type=int, default=999)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+    run(args.nx, args.ny, args.permutations, args.workers)
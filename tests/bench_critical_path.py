@@ -0,0 +1,66 @@
+"""
+원천 단계 (경계 / 소득 / 매핑) 순차 vs 동시 실행 — 콜드 캐시, stub 서버 응답 지연
+
+- serial: run()         경계 -> 소득 -> 매핑 차례로
+- concurrent: run(concurrent=True)  prefetch()로 세 원천을 동시에 받은 뒤 합침
+
+반복마다 새 캐시 디렉터리를 쓰므로 매번 콜드. 단계별 시간은 순차 실행의 graph.report() 기준,
+임계 경로 = 가장 느린 원천 + 이후 단계
+
+사용:
+    python -m tests.bench_critical_path                         # vworld 0.15s, 서울 API 0.08s, 5회
+    python -m tests.bench_critical_path --seoul-delay 0.3 --repeat 3
+"""
+
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from tests.stubs import SolverFixture
+
+
+def run(vworld_delay: float, seoul_delay: float, seoul_total: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = SolverFixture(Path(tmp), vworld_delay=vworld_delay, seoul_delay=seoul_delay,
+                                seoul_total=seoul_total)
+        try:
+            samples = {"serial": [], "concurrent": []}
+            stages = []
+            for i in range(repeat):
+                for label in samples:
+                    fixture.use_cache(f"{label}{i}")
+                    s = fixture.make()
+                    t0 = time.perf_counter()
+                    s.run(concurrent=label == "concurrent")
+                    samples[label].append(time.perf_counter() - t0)
+                    if label == "serial":
+                        stages.append({r["stage"]: r["seconds"] for r in s.graph.report()
+                                       if r["status"] == "computed"})
+            sources = fixture.module._SOURCE_STAGES
+        finally:
+            fixture.close()
+
+    print(f"vworld delay {vworld_delay}s, seoul delay {seoul_delay}s, {seoul_total} income rows, "
+          f"{repeat} cold runs each")
+    for name in sources:
+        print(f"  {name:11s} {statistics.median(s[name] for s in stages) * 1e3:8.1f} ms")
+    rest = statistics.median(sum(v for k, v in s.items() if k not in sources) for s in stages)
+    critical = statistics.median(max(s[n] for n in sources) for s in stages) + rest
+    print(f"  critical path (slowest source + rest) {critical * 1e3:8.1f} ms")
+    for label, values in samples.items():
+        print(f"{label:10s} p50 {statistics.median(values) * 1e3:8.1f} ms  "
+              f"min {min(values) * 1e3:8.1f}  max {max(values) * 1e3:8.1f}")
+    print(f"speedup x{statistics.median(samples['serial']) / statistics.median(samples['concurrent']):.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="solver source stage critical path benchmark")
+    parser.add_argument("--vworld-delay", type=float, default=0.15, help="vworld stub 응답 지연 (초)")
+    parser.add_argument("--seoul-delay", type=float, default=0.08, help="서울 API stub 응답 지연 (초)")
+    parser.add_argument("--seoul-total", type=int, default=12000, help="소득 행 수 (페이지 수 결정)")
+    parser.add_argument("--repeat", type=int, default=5)
+    cli = parser.parse_args()
+    run(cli.vworld_delay, cli.seoul_delay, cli.seoul_total, cli.repeat)
@@ -0,0 +1,83 @@
+"""
+행정동 -> 법정동 지표 재배분 — 서울 크기 합성 매핑 (법정동 ~470, 행정동 ~430), 지표 k개
+
+- pandas loop: 지표마다 merge + groupby mean (크로스워크 이전 방식)
+- pandas once: 지표 k개를 한 번의 merge + groupby mean
+- crosswalk: Crosswalk.from_frame 한 번 + align/reallocate (build는 따로 표시)
+
+사용:
+    python -m tests.bench_crosswalk                 # 지표 50개
+    python -m tests.bench_crosswalk --indicators 200
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.utils.gis.crosswalk import Crosswalk
+
+
+def synthetic_mapping(n_legald: int = 467, n_adstrd: int = 426, seed: int = 0) -> pd.DataFrame:
+    """법정동마다 이웃한 행정동 1~4개 (실제 KIKmix 서울 쌍 수와 비슷한 ~1200쌍)"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for legald in range(n_legald):
+        center = legald * n_adstrd // n_legald
+        for offset in rng.choice(7, rng.integers(1, 5), replace=False) - 3:
+            rows.append((f"11{legald:06d}", f"11{(center + offset) % n_adstrd:06d}"))
+    return pd.DataFrame(rows, columns=["legald_cd", "adstrd_cd"])
+
+
+def _timed(func, repeat: int):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = func()
+    return (time.perf_counter() - t0) / repeat, out
+
+
+def run(n_indicators: int, repeat: int) -> None:
+    mapping = synthetic_mapping()
+    codes = np.unique(mapping["adstrd_cd"])
+    columns = [f"v{i}" for i in range(n_indicators)]
+    values = pd.DataFrame(
+        np.random.default_rng(1).uniform(0, 1e6, (len(codes), n_indicators)), columns=columns
+    )
+    values.insert(0, "adstrd_cd", codes)
+    print(f"pairs {len(mapping)}, legald {mapping['legald_cd'].nunique()}, "
+          f"adstrd {len(codes)}, indicators {n_indicators}")
+
+    def pandas_loop():
+        frames = [
+            mapping.merge(values[["adstrd_cd", col]], on="adstrd_cd").groupby("legald_cd")[col].mean()
+            for col in columns
+        ]
+        return pd.concat(frames, axis=1)
+
+    def pandas_once():
+        return mapping.merge(values, on="adstrd_cd").groupby("legald_cd")[columns].mean()
+
+    t_build, crosswalk = _timed(lambda: Crosswalk.from_frame(mapping), repeat)
+
+    def reallocate():
+        aligned = crosswalk.align(values["adstrd_cd"], values[columns].to_numpy())
+        return crosswalk.to_frame(aligned, columns)
+
+    t_loop, expected = _timed(pandas_loop, repeat)
+    t_once, _ = _timed(pandas_once, repeat)
+    t_cross, got = _timed(reallocate, repeat)
+    error = np.abs(got[columns].to_numpy() - expected.loc[got["legald_cd"]].to_numpy()).max()
+    print(f"pandas loop {t_loop * 1e3:9.2f} ms")
+    print(f"pandas once {t_once * 1e3:9.2f} ms")
+    print(f"crosswalk   {t_cross * 1e3:9.2f} ms  (+ build {t_build * 1e3:.2f} ms once)  "
+          f"x{t_loop / t_cross:.0f} vs loop, max abs diff {error:.1e}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Crosswalk reallocation benchmark")
+    parser.add_argument("--indicators", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    cli = parser.parse_args()
+    run(cli.indicators, cli.repeat)
@@ -0,0 +1,97 @@
+"""
+solver 데몬 cold / warm 지연 비교 (stub 서버, 연속 호출 N번)
+
+- cold: 호출마다 새 인터프리터에서 solver import + URSUSSolver 생성 + run() (Grasshopper 컴포넌트 재실행과 같음)
+        디스크 캐시는 공유하므로 첫 호출 뒤에는 네트워크 없이 캐시만 읽는다
+- warm: 데몬 하나에 SolverClient로 run() N번
+
+사용:
+    python -m tests.bench_daemon               # 100회씩
+    python -m tests.bench_daemon --calls 20
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+from tests.stubs import SolverFixture, _project_root
+
+
+def _summary(label: str, samples: List[float]) -> str:
+    ms = sorted(s * 1e3 for s in samples)
+    p95 = ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))]
+    return (
+        f"{label:5s} n={len(ms):4d}  first {samples[0] * 1e3:9.1f} ms  "
+        f"mean {statistics.mean(ms):9.1f}  p50 {statistics.median(ms):9.1f}  p95 {p95:9.1f}"
+    )
+
+
+def _child(root: Path) -> None:
+    fixture = SolverFixture(root)
+    try:
+        fixture.make().run()
+    finally:
+        fixture.close()
+
+
+def cold(root: Path, calls: int) -> List[float]:
+    samples = []
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "tests.bench_daemon", "--child", str(root)],
+            cwd=str(_project_root), check=True, stdout=subprocess.DEVNULL,
+        )
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def warm(root: Path, calls: int) -> List[float]:
+    import solver_daemon as sd
+
+    sd._KEY_PATH = root / "daemon.key"
+    fixture = SolverFixture(root)
+    daemon = sd.SolverDaemon(address=("127.0.0.1", 0), solver=fixture.make())
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    while daemon.listener is None:
+        time.sleep(0.01)
+    client = sd.SolverClient(daemon.listener.address)
+    samples = []
+    try:
+        for _ in range(calls):
+            t0 = time.perf_counter()
+            client.run()
+            samples.append(time.perf_counter() - t0)
+    finally:
+        client.shutdown()
+        thread.join(5)
+        fixture.close()
+    return samples
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="URSUS solver daemon cold/warm benchmark")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    cli = parser.parse_args()
+    if cli.child:
+        _child(cli.child)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cold_dir, warm_dir = Path(tmp) / "cold", Path(tmp) / "warm"
+        cold_dir.mkdir()
+        warm_dir.mkdir()
+        cold_samples = cold(cold_dir, cli.calls)
+        warm_samples = warm(warm_dir, cli.calls)
+    print(_summary("cold", cold_samples))
+    print(_summary("warm", warm_samples))
+    print(f"speedup (mean) x{statistics.mean(cold_samples) / statistics.mean(warm_samples):.0f}")
@@ -0,0 +1,84 @@
+"""
+서울 API 파서: dict 목록 경로(to_dataframe_full) vs 스트리밍(iter_dataframes) — 최대 RSS, 행/초
+
+경로마다 새 인터프리터에서 stub 서버(같은 프로세스 스레드)를 띄워 측정하고,
+수집 전 RSS 대비 최대 RSS 증가분을 보고한다 (resource 모듈이 없는 Windows에서는 n/a).
+
+사용:
+    python -m tests.bench_data_seoul_stream               # 200,000행
+    python -m tests.bench_data_seoul_stream --rows 50000
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+from tests.stubs import _project_root
+
+SERVICE = "VwsmAdstrdNcmCnsmpW"
+MODES = ("dict-list", "stream-concat", "stream-reduce")
+
+
+def _max_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return kb / 1024 if sys.platform != "darwin" else kb / 1024 / 1024
+
+
+def _child(mode: str, rows: int) -> dict:
+    import pandas as pd  # import 비용은 기준 RSS에 포함
+
+    from src.utils.api.data_seoul_api_parser import DataSeoulOpenAPIParser
+    from src.utils.api.http_transport import HttpTransport
+    from tests.stubs import StubServer, seoul_handler
+
+    server = StubServer(seoul_handler(total=rows))
+    parser = DataSeoulOpenAPIParser("stub", base_url=server.url, transport=HttpTransport())
+    parser.to_dataframe(SERVICE, 1, 10)  # 연결/워밍업
+    base = _max_rss_mb()
+    t0 = time.perf_counter()
+    if mode == "dict-list":
+        n = len(parser.to_dataframe_full(SERVICE, page_size=1000))
+    elif mode == "stream-concat":
+        n = len(pd.concat(list(parser.iter_dataframes(SERVICE, page_size=1000)), ignore_index=True))
+    else:
+        # 청크마다 집계만 하고 버림 (상수 메모리)
+        n = 0
+        for chunk in parser.iter_dataframes(SERVICE, page_size=1000,
+                                            dtypes={"MT_AVRG_INCOME_AMT": "float64"}):
+            n += len(chunk)
+    elapsed = time.perf_counter() - t0
+    peak = _max_rss_mb()
+    server.close()
+    return {
+        "rows": n, "seconds": elapsed,
+        "peak_delta_mb": None if base is None else peak - base,
+    }
+
+
+def run(rows: int) -> None:
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, "-m", "tests.bench_data_seoul_stream", "--child", mode, "--rows", str(rows)],
+            cwd=str(_project_root), check=True, capture_output=True, text=True,
+        ).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        rss = "n/a" if r["peak_delta_mb"] is None else f"{r['peak_delta_mb']:7.1f} MB"
+        print(f"{mode:14s} rows {r['rows']:8d}  {r['rows'] / r['seconds']:10,.0f} rows/s  peak RSS +{rss}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Seoul parser streaming benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    cli = parser.parse_args()
+    if cli.child:
+        print(json.dumps(_child(cli.child, cli.rows)))
+    else:
+        run(cli.rows)
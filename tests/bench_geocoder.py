@@ -0,0 +1,70 @@
+"""
+지오코더 처리량 (stub 지오코더, 요청마다 지연)
+
+- serial: 캐시 없이 한 주소씩 (기존 _address_to_coord 방식)
+- batch cold: geocode_many, 빈 SQLite 캐시
+- batch warm: 같은 목록 다시 (전부 캐시 적중)
+
+사용:
+    python -m tests.bench_geocoder                       # 10000개, 지연 20ms
+    python -m tests.bench_geocoder --n 2000 --delay 0.05
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from src.utils.api.http_transport import HttpTransport
+from src.utils.api.vworld_geocoder import VworldGeocoder
+from tests.stubs import StubServer, vworld_handler
+
+
+def _addresses(n: int):
+    # 10%는 중복, 5%는 NOT_FOUND
+    unique = [f"서울특별시 중구 세종대로 {i}" for i in range(int(n * 0.85))]
+    unique += [f"없는 주소 {i}" for i in range(int(n * 0.05))]
+    return (unique + unique[: n - len(unique)])[:n]
+
+
+def run(n: int, delay: float, concurrency: int, serial_sample: int) -> None:
+    server = StubServer(vworld_handler(), delay)
+    addresses = _addresses(n)
+    url = server.url + "/req/address"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            serial = VworldGeocoder("stub", transport=HttpTransport(), rate_limit=None, url=url)
+            sample = addresses[:serial_sample]
+            t0 = time.perf_counter()
+            for address in sample:
+                serial.geocode_many([address])
+            per_address = (time.perf_counter() - t0) / len(sample)
+            print(f"serial      {len(sample):6d} addr  {per_address * 1e3:7.2f} ms/addr  "
+                  f"(~{per_address * n:.1f} s for {n})")
+
+            batch = VworldGeocoder(
+                "stub", transport=HttpTransport(), cache_path=Path(tmp) / "geocode.sqlite",
+                concurrency=concurrency, rate_limit=None, url=url,
+            )
+            for label in ("batch cold", "batch warm"):
+                before = server.calls("/address")
+                t0 = time.perf_counter()
+                coords = batch.geocode_many(addresses)
+                elapsed = time.perf_counter() - t0
+                print(f"{label:11s} {n:6d} addr  {n / elapsed:9.0f} addr/s  {elapsed:7.2f} s  "
+                      f"requests {server.calls('/address') - before}, "
+                      f"not found {sum(c is None for c in coords)}")
+            batch.close()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="VworldGeocoder throughput benchmark")
+    parser.add_argument("--n", type=int, default=10000)
+    parser.add_argument("--delay", type=float, default=0.02, help="stub 응답 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--serial-sample", type=int, default=200, help="serial 측정 주소 수")
+    cli = parser.parse_args()
+    run(cli.n, cli.delay, cli.concurrency, cli.serial_sample)
@@ -0,0 +1,52 @@
+"""
+GPStoUTM 스칼라 vs 벡터화 투영 (서울 전체 경계 규모 정점 수)
+
+사용:
+    python -m tests.bench_gps_to_upm                  # 정점 300,000개
+    python -m tests.bench_gps_to_upm --vertices 50000
+"""
+
+import time
+
+import numpy as np
+
+from src.utils.gis.gps_to_upm import GPStoUTM
+
+
+def run(n: int) -> None:
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(37.41, 37.72, n)
+    lon = rng.uniform(126.76, 127.19, n)
+    conv = GPStoUTM()
+
+    t0 = time.perf_counter()
+    scalar = [conv.LLtoUTM(a, o) for a, o in zip(lat.tolist(), lon.tolist())]
+    t_scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    easting, northing = conv.LLtoUTMArray(lat, lon)
+    t_array = time.perf_counter() - t0
+
+    err = np.abs(np.column_stack((easting, northing)) - np.asarray(scalar)).max()
+    print(f"LLtoUTM       {n:8d} vertices  scalar {t_scalar:7.3f} s  array {t_array * 1e3:7.1f} ms  "
+          f"x{t_scalar / t_array:.0f}  max diff {err * 1e3:.2e} mm")
+
+    zone = int((lon[0] + 180) // 6) + 1  # 서울은 52
+    t0 = time.perf_counter()
+    for e, nn in zip(easting.tolist(), northing.tolist()):
+        conv.UTMtoLL(nn, e, zone, "S")
+    t_scalar = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    conv.UTMtoLLArray(northing, easting, zone, "S")
+    t_array = time.perf_counter() - t0
+    print(f"UTMtoLL       {n:8d} vertices  scalar {t_scalar:7.3f} s  array {t_array * 1e3:7.1f} ms  "
+          f"x{t_scalar / t_array:.0f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GPStoUTM scalar vs vectorized benchmark")
+    parser.add_argument("--vertices", type=int, default=300_000)
+    cli = parser.parse_args()
+    run(cli.vertices)
@@ -0,0 +1,56 @@
+"""
+IDW 벤치마크 — 메시 정점 수 10k ~ 1M, 표본 ~470개 (서울 법정동 중심점 규모)
+
+exact(전체 표본) 대비 kNN(k개)의 시간과 정확도(최대/RMS 상대 오차)를 비교한다.
+scipy가 있으면 kNN은 KD-tree, 없으면 청크 단위 전수 탐색(argpartition)이다.
+
+사용:
+    python -m tests.bench_idw
+    python -m tests.bench_idw --sizes 10000 100000 --k 8 16 --workers 4
+"""
+
+import time
+
+import numpy as np
+
+from src.utils.gis.idw import idw
+from src.utils.optional_deps import has_module
+
+
+def _timed(func):
+    t0 = time.perf_counter()
+    out = func()
+    return out, time.perf_counter() - t0
+
+
+def run(sizes, ks, n_sources: int, workers: int) -> None:
+    rng = np.random.default_rng(0)
+    sources = rng.uniform([0, 0], [36000, 30000], (n_sources, 2))
+    # 공간 상관이 있는 소득 분포 (매끄러운 추세 + 잡음)
+    values = 3e6 + 1e6 * np.sin(sources[:, 0] / 9000) * np.cos(sources[:, 1] / 7000)
+    values += rng.normal(0, 2e5, n_sources)
+    print(f"sources {n_sources}, kNN backend {'cKDTree' if has_module('scipy') else 'numpy'}, "
+          f"workers {workers}")
+
+    for m in sizes:
+        queries = rng.uniform([0, 0], [36000, 30000], (m, 2))
+        exact, t_exact = _timed(lambda: idw(sources, values, queries, workers=workers))
+        line = f"vertices {m:8d}  exact {t_exact:7.2f} s"
+        for k in ks:
+            approx, t_knn = _timed(lambda: idw(sources, values, queries, k=k, workers=workers))
+            rel = np.abs(approx - exact) / np.abs(exact)
+            line += (f" | k={k:<3d} {t_knn:6.2f} s x{t_exact / t_knn:4.1f} "
+                     f"max {rel.max():.1%} rms {np.sqrt((rel ** 2).mean()):.2%}")
+        print(line)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="IDW exact vs kNN benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--k", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--sources", type=int, default=470)
+    parser.add_argument("--workers", type=int, default=1)
+    cli = parser.parse_args()
+    run(cli.sizes, cli.k, cli.sources, cli.workers)
@@ -0,0 +1,91 @@
+"""
+solver 결과 전달 비용 — 합성 법정동 분할 (bench_spatial_index 와 같은 분할)
+
+- pickle: run()처럼 중첩 리스트로 만들어 pickle (SolverClient/데몬 IPC 경로)
+- json:   같은 리스트를 json 문자열로 (파일/파이프로 넘기는 경우)
+- shm / mmap: SharedResult.create (생산자) + SharedResult.open 후 전체 합계 (소비자)
+
+생산자 = 결과를 넘길 형태로 만드는 시간, 소비자 = 받은 쪽이 좌표 배열을 손에 쥐기까지의 시간
+
+사용:
+    python -m tests.bench_shared_result                    # 법정동 ~470개, 변마다 정점 12개
+    python -m tests.bench_shared_result --edge-points 200
+"""
+
+import json
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.io_format.shared_result import SharedResult
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _timed(func, repeat: int):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = func()
+    return (time.perf_counter() - t0) / repeat, out
+
+
+def _report(label: str, produce: float, consume: float, size: int) -> None:
+    print(f"{label:6s} produce {produce * 1e3:8.2f} ms  consume {consume * 1e3:8.2f} ms  "
+          f"total {(produce + consume) * 1e3:8.2f} ms  {size / 2**20:7.2f} MiB")
+
+
+def run(edge_points: int, repeat: int) -> None:
+    polygons, ids = synthetic_districts(edge_points=edge_points)
+    centroids = polygons.centroids()
+    values = {"mt_avrg_income_amt": np.random.default_rng(0).normal(3e6, 5e5, len(polygons))}
+    print(f"districts {len(polygons)}, vertices {len(polygons.coords)}")
+
+    def as_lists():
+        geometries = [[[ring.tolist() for ring in part] for part in feature] for feature in polygons.features()]
+        return geometries, centroids.tolist(), values["mt_avrg_income_amt"].tolist()
+
+    def coords_from_lists(result):
+        return np.array([xy for feature in result[0] for part in feature for ring in part for xy in ring])
+
+    for label, dumps, loads in (
+        ("pickle", lambda obj: pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("json", json.dumps, json.loads),
+    ):
+        produce, payload = _timed(lambda: dumps(as_lists()), repeat)
+        consume, coords = _timed(lambda: coords_from_lists(loads(payload)), repeat)
+        assert len(coords) == len(polygons.coords)
+        _report(label, produce, consume, len(payload))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, path in (("shm", None), ("mmap", Path(tmp) / "result.bin")):
+            created = []
+
+            def produce_shared():
+                for old in created:
+                    old.close()
+                    old.unlink()
+                created[:] = [SharedResult.create(polygons, centroids, values, ids, path=path)]
+                return created[0].name
+
+            def consume_shared():
+                with SharedResult.open(name) as result:
+                    return float(result.polygons().coords.sum())
+
+            produce, name = _timed(produce_shared, repeat)
+            consume, total = _timed(consume_shared, repeat)
+            assert np.isclose(total, polygons.coords.sum())
+            _report(label, produce, consume, created[0].nbytes)
+            created[0].close()
+            created[0].unlink()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="solver result handoff benchmark")
+    parser.add_argument("--edge-points", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=10)
+    cli = parser.parse_args()
+    run(cli.edge_points, cli.repeat)
@@ -0,0 +1,76 @@
+"""
+LOD 단순화 단계별 크기/지연 — 합성 법정동 분할 (bench_spatial_index 와 같은 분할)
+
+- significance: Topology 생성 + arc 정점별 중요도 (경계가 바뀔 때 한 번)
+- LOD별: simplify_topology (마스크 + 링 복원) 지연, 남은 정점 수,
+  웹 페이로드 크기 (GeoJSON / 바이너리 레이어 float32)
+
+사용:
+    python -m tests.bench_simplify                         # 법정동 ~470개, 변마다 정점 60개
+    python -m tests.bench_simplify --lods 2 10 50 --method vw
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.io_format.web_layer import write_binary_layer
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.simplify import arc_significance, simplify_topology
+from src.utils.gis.topology import Topology
+from tests.bench_spatial_index import synthetic_districts
+from tests.bench_web_layer import ORIGIN, _geojson
+
+
+def _timed(func, repeat: int):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = func()
+    return (time.perf_counter() - t0) / repeat, out
+
+
+def run(edge_points: int, lods, method: str, repeat: int) -> None:
+    base, ids = synthetic_districts(edge_points=edge_points)
+    polygons = PackedPolygons(base.coords + ORIGIN, base.ring_offsets, base.part_offsets, base.geom_offsets)
+    values = {"income": np.random.default_rng(0).normal(3e6, 5e5, len(polygons))}
+    areas = polygons.areas()
+
+    t0 = time.perf_counter()
+    topology = Topology.from_polygons(polygons)
+    sig = arc_significance(topology, method)
+    print(f"districts {len(polygons)}, vertices {len(polygons.coords)}, method {method}, "
+          f"significance {(time.perf_counter() - t0) * 1e3:.1f} ms once")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for lod in [None, *lods]:
+            if lod is None:
+                latency, simplified = 0.0, polygons
+            else:
+                latency, simplified = _timed(
+                    lambda: simplify_topology(topology, sig, lod, method), repeat
+                )
+            geojson = len(json.dumps(_geojson(simplified, values, ids)).encode("utf-8"))
+            binary = write_binary_layer(
+                tmp / "layer.bin", simplified, values, ids, simplified.centroids()
+            ).stat().st_size
+            error = np.abs(simplified.areas() / areas - 1).max()
+            label = "original" if lod is None else f"lod {lod:g} m"
+            print(f"{label:12s} vertices {len(simplified.coords):8d}  "
+                  f"geojson {geojson / 1024:8.1f} KiB  bin {binary / 1024:7.1f} KiB  "
+                  f"latency {latency * 1e3:7.2f} ms  max area err {error:.1%}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="LOD simplification size/latency benchmark")
+    parser.add_argument("--edge-points", type=int, default=60)
+    parser.add_argument("--lods", type=float, nargs="+", default=[1.0, 5.0, 20.0, 50.0, 100.0])
+    parser.add_argument("--method", choices=("dp", "vw"), default="dp")
+    parser.add_argument("--repeat", type=int, default=10)
+    cli = parser.parse_args()
+    run(cli.edge_points, cli.lods, cli.method, cli.repeat)
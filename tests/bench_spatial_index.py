@@ -0,0 +1,113 @@
+"""
+DistrictIndex 벤치마크 — 서울 크기(약 36 x 30 km)의 합성 법정동 분할, 무작위 점 N개
+
+- build: STR R-tree 생성, save/load: CacheStore npz 왕복
+- locate: 전체 점 일괄 조회
+- brute: 모든 폴리곤에 point-in-polygon (표본으로 측정해 N개로 환산), 결과 일치 확인
+
+사용:
+    python -m tests.bench_spatial_index                 # 1,000,000점, 법정동 ~470개
+    python -m tests.bench_spatial_index --points 200000
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.utils.cache.cache_store import CacheStore
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.spatial_index import DistrictIndex, points_in_rings
+
+
+def synthetic_districts(nx: int = 26, ny: int = 18, edge_points: int = 12, seed: int = 0):
+    """흔든 격자 꼭짓점 + 변마다 흔든 중간 정점으로 빈틈없는 사각 분할 (변을 이웃과 공유)"""
+    rng = np.random.default_rng(seed)
+    w, h = 36000.0 / nx, 30000.0 / ny
+    gx, gy = np.meshgrid(np.arange(nx + 1) * w, np.arange(ny + 1) * h, indexing="ij")
+    gx[1:-1, 1:-1] += rng.uniform(-0.25, 0.25, (nx - 1, ny - 1)) * w
+    gy[1:-1, 1:-1] += rng.uniform(-0.25, 0.25, (nx - 1, ny - 1)) * h
+    corners = np.stack([gx, gy], axis=-1)
+
+    edges = {}
+
+    def edge(p, q):
+        key = (p, q) if p < q else (q, p)
+        if key not in edges:
+            a, b = corners[key[0]], corners[key[1]]
+            t = np.linspace(0, 1, edge_points + 2)[1:-1, None]
+            normal = np.array([a[1] - b[1], b[0] - a[0]]) / np.hypot(*(b - a))
+            wobble = rng.uniform(-0.03, 0.03, (edge_points, 1)) * min(w, h) * np.sin(np.pi * t)
+            edges[key] = a + (b - a) * t + wobble * normal
+        mid = edges[key]
+        return mid if key == (p, q) else mid[::-1]
+
+    geometries = []
+    for i in range(nx):
+        for j in range(ny):
+            loop = [(i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1)]
+            ring = []
+            for p, q in zip(loop, loop[1:] + loop[:1]):
+                ring.append(corners[p][None])
+                ring.append(edge(p, q))
+            ring = np.concatenate(ring)
+            geometries.append([[np.vstack([ring, ring[:1]]).tolist()]])
+    codes = [f"11{i:06d}" for i in range(len(geometries))]
+    return PackedPolygons.from_geometries(geometries), codes
+
+
+def _brute(points: np.ndarray, polygons: PackedPolygons) -> np.ndarray:
+    result = np.full(len(points), -1, dtype=np.int64)
+    for f in range(len(polygons)):
+        r0 = polygons.part_offsets[polygons.geom_offsets[f]]
+        r1 = polygons.part_offsets[polygons.geom_offsets[f + 1]]
+        offs = polygons.ring_offsets[r0:r1 + 1]
+        coords = polygons.coords[offs[0]:offs[-1]]
+        inside = points_in_rings(points, coords, offs - offs[0])
+        result[inside & (result < 0)] = f
+    return result
+
+
+def run(n_points: int, brute_sample: int) -> None:
+    polygons, codes = synthetic_districts()
+    rng = np.random.default_rng(1)
+    points = rng.uniform([-500, -500], [36500, 30500], (n_points, 2))
+    print(f"districts {len(polygons)}, vertices {len(polygons.coords)}, points {n_points}")
+
+    t0 = time.perf_counter()
+    index = DistrictIndex(polygons, codes)
+    print(f"build      {(time.perf_counter() - t0) * 1e3:9.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CacheStore(Path(tmp))
+        t0 = time.perf_counter()
+        cache.put_arrays("index", index.to_arrays())
+        t_save = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        loaded = DistrictIndex.from_arrays(cache.get_arrays("index"))
+        print(f"save/load  {t_save * 1e3:9.1f} / {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    t0 = time.perf_counter()
+    idx = loaded.locate_index(points)
+    t_locate = time.perf_counter() - t0
+    print(f"locate     {t_locate:9.2f} s  ({n_points / t_locate:,.0f} pts/s, "
+          f"{(idx >= 0).mean():.1%} inside)")
+
+    sample = points[:brute_sample]
+    t0 = time.perf_counter()
+    expected = _brute(sample, polygons)
+    t_brute = (time.perf_counter() - t0) * n_points / len(sample)
+    mismatch = int((expected != idx[:brute_sample]).sum())
+    print(f"brute      {t_brute:9.2f} s  (estimated from {len(sample)} pts)  "
+          f"speedup x{t_brute / t_locate:.0f}, mismatches {mismatch}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DistrictIndex benchmark")
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--brute-sample", type=int, default=5000)
+    cli = parser.parse_args()
+    run(cli.points, cli.brute_sample)
@@ -0,0 +1,63 @@
+"""
+공유 arc 토폴로지 저장 크기 / 로드 시간 — 합성 법정동 분할 (bench_spatial_index 와 같은 분할)
+
+- rings: PackedPolygons 배열 그대로 (float64 좌표, 내부 경계가 양쪽 링에 한 번씩)
+- topology: Topology.to_arrays (arc 한 번씩, int32 차분), 로드 = from_arrays + to_polygons
+
+둘 다 CacheStore npz로 저장/로드한다.
+
+사용:
+    python -m tests.bench_topology                  # 법정동 ~470개, 변마다 정점 60개
+    python -m tests.bench_topology --edge-points 200
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.utils.cache.cache_store import CacheStore
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.topology import Topology
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _timed(func, repeat: int):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = func()
+    return (time.perf_counter() - t0) / repeat, out
+
+
+def run(edge_points: int, repeat: int) -> None:
+    polygons, _ = synthetic_districts(edge_points=edge_points)
+    t_build, topology = _timed(lambda: Topology.from_polygons(polygons), 1)
+    print(f"districts {len(polygons)}, ring vertices {len(polygons.coords)}, "
+          f"arcs {topology.n_arcs}, arc vertices {len(topology.arc_deltas)} "
+          f"(build {t_build * 1e3:.1f} ms)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CacheStore(Path(tmp))
+        cache.put_arrays("rings", polygons.to_arrays())
+        cache.put_arrays("topology", topology.to_arrays())
+        sizes = {key: (Path(tmp) / f"{key}.npz").stat().st_size for key in ("rings", "topology")}
+        t_rings, _ = _timed(lambda: PackedPolygons.from_arrays(cache.get_arrays("rings")), repeat)
+        t_topo, restored = _timed(
+            lambda: Topology.from_arrays(cache.get_arrays("topology")).to_polygons(), repeat
+        )
+
+    error = np.abs(restored.areas() - polygons.areas()).max()
+    print(f"rings    {sizes['rings'] / 1024:9.1f} KiB  load {t_rings * 1e3:7.2f} ms")
+    print(f"topology {sizes['topology'] / 1024:9.1f} KiB  load {t_topo * 1e3:7.2f} ms  "
+          f"x{sizes['rings'] / sizes['topology']:.1f} smaller, max area error {error:.2e} m²")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shared-arc topology size/load benchmark")
+    parser.add_argument("--edge-points", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=10)
+    cli = parser.parse_args()
+    run(cli.edge_points, cli.repeat)
@@ -0,0 +1,51 @@
+"""
+법정동 삼각분할 벤치마크 — 서울 크기(약 36 x 30 km)의 합성 법정동 분할
+
+- earcut: 세분 없이 ear clipping + Delaunay 뒤집기
+- refine: max_edge별 최장변 이등분 (면/정점 수, 최대 변, 면적 오차)
+
+사용:
+    python -m tests.bench_triangulate                       # 법정동 ~470개, max_edge 500 / 200 / 100 m
+    python -m tests.bench_triangulate --max-edge 300 50
+"""
+
+import time
+
+import numpy as np
+
+from src.utils.gis.triangulate import triangulate
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _max_edge(mesh) -> float:
+    faces = mesh.faces.astype(np.int64)
+    a, b = mesh.vertices[faces], mesh.vertices[np.roll(faces, -1, axis=1)]
+    return float(np.hypot(*(b - a).transpose(2, 0, 1)).max())
+
+
+def run(nx: int, ny: int, max_edges, repeat: int) -> None:
+    polygons, _ = synthetic_districts(nx, ny)
+    areas = polygons.areas()
+    print(f"districts {len(polygons)}, vertices {len(polygons.coords)}")
+    for max_edge in [None, *max_edges]:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            mesh = triangulate(polygons, max_edge)
+        elapsed = (time.perf_counter() - t0) / repeat
+        error = np.abs(mesh.areas() - areas).max() / areas.min()
+        label = "earcut" if max_edge is None else f"max_edge {max_edge:g}"
+        print(f"{label:15s} {elapsed * 1e3:9.1f} ms  faces {len(mesh.faces):8d}, "
+              f"vertices {len(mesh.vertices):8d}, longest {_max_edge(mesh):8.1f}, "
+              f"area rel err {error:.1e}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Polygon triangulation benchmark")
+    parser.add_argument("--nx", type=int, default=26)
+    parser.add_argument("--ny", type=int, default=18)
+    parser.add_argument("--max-edge", type=float, nargs="+", default=[500.0, 200.0, 100.0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.nx, args.ny, args.max_edge, args.repeat)
@@ -0,0 +1,87 @@
+"""
+웹 레이어 크기/파싱 비교 — 서울 크기 합성 법정동 분할 (bench_spatial_index 와 같은 분할)
+
+- geojson: FeatureCollection (MultiPolygon, lnglat), json.loads 파싱 시간
+- bin: write_binary_layer (float32 오프셋), read_binary_layer(mmap=False) + layer_to_polygons
+- bin q16: 16비트 양자화
+
+사용:
+    python -m tests.bench_web_layer                     # 법정동 ~470개, 변마다 정점 12개
+    python -m tests.bench_web_layer --edge-points 60
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.io_format.web_layer import _to_lnglat, layer_to_polygons, read_binary_layer, write_binary_layer
+from src.utils.gis.packed_geometry import PackedPolygons
+from tests.bench_spatial_index import synthetic_districts
+
+# 분할을 서울 부근 UTM 52S 로 옮김
+ORIGIN = np.array([300_000.0, 4_140_000.0])
+
+
+def _geojson(polygons: PackedPolygons, values: dict, ids: list) -> dict:
+    lnglat = _to_lnglat(polygons.coords)
+    ring, part, geom = polygons.ring_offsets, polygons.part_offsets, polygons.geom_offsets
+    features = []
+    for k in range(len(polygons)):
+        coordinates = [
+            [lnglat[ring[r]:ring[r + 1]].tolist() for r in range(part[p], part[p + 1])]
+            for p in range(geom[k], geom[k + 1])
+        ]
+        properties = {"id": ids[k], **{name: float(v[k]) for name, v in values.items()}}
+        features.append({"type": "Feature", "properties": properties,
+                         "geometry": {"type": "MultiPolygon", "coordinates": coordinates}})
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _timed(func, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - t0) / repeat
+
+
+def run(edge_points: int, repeat: int) -> None:
+    base, ids = synthetic_districts(edge_points=edge_points)
+    polygons = PackedPolygons(base.coords + ORIGIN, base.ring_offsets, base.part_offsets, base.geom_offsets)
+    rng = np.random.default_rng(0)
+    values = {"income": rng.normal(3e6, 5e5, len(polygons)), "pop": rng.integers(0, 40000, len(polygons)) * 1.0}
+    lnglat = _to_lnglat(polygons.coords)
+    print(f"districts {len(polygons)}, vertices {len(polygons.coords)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        path = tmp / "layer.geojson"
+        path.write_text(json.dumps(_geojson(polygons, values, ids)))
+        elapsed = _timed(lambda: json.loads(path.read_text()), repeat)
+        geojson_size = path.stat().st_size
+        print(f"geojson  {geojson_size / 1024:9.1f} KiB  parse {elapsed * 1e3:8.2f} ms")
+
+        for label, bits in (("bin", None), ("bin q16", 16)):
+            path = write_binary_layer(tmp / f"layer{bits}.bin", polygons, values, ids,
+                                      polygons.centroids(), quantize_bits=bits)
+
+            def parse():
+                return layer_to_polygons(*read_binary_layer(path, mmap=False))
+
+            elapsed = _timed(parse, repeat)
+            error = np.abs(parse().coords - lnglat).max()
+            size = path.stat().st_size
+            print(f"{label:8s} {size / 1024:9.1f} KiB  parse {elapsed * 1e3:8.2f} ms  "
+                  f"x{geojson_size / size:.1f} smaller, max error {error:.1e} deg (~{error * 111e3:.2f} m)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Binary web layer vs GeoJSON benchmark")
+    parser.add_argument("--edge-points", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=10)
+    cli = parser.parse_args()
+    run(cli.edge_points, cli.repeat)
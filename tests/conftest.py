@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# works/URSUS 스크립트(solver, solver_daemon)를 모듈로 import
+_works = str(Path(__file__).resolve().parent.parent / "works" / "URSUS")
+if _works not in sys.path:
+    sys.path.insert(0, _works)
+
+
+@pytest.fixture
+def ursus(tmp_path):
+    """stub 서버에 연결된 URSUSSolver 팩토리 (tests.stubs.SolverFixture)"""
+    from tests.stubs import SolverFixture
+
+    fixture = SolverFixture(tmp_path)
+    yield fixture
+    fixture.close()
@@ -0,0 +1,225 @@
+"""
+테스트/벤치마크용 로컬 stub 서버와 URSUSSolver 구성
+
+- vworld: WFS(lt_c_ademd_info) + 주소 지오코더, 격자 모양 법정동 nx * ny개
+- 서울 열린데이터: VwsmAdstrdNcmCnsmpW XML 페이지
+- delay(초)로 요청마다 지연, fail_next로 다음 요청 N개를 오류 상태로 응답
+"""
+
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_project_root = Path(__file__).resolve().parent.parent
+for _p in (str(_project_root), str(_project_root / "works" / "URSUS")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+Handler = Callable[[str, Dict[str, str]], Tuple[int, bytes]]
+
+# 격자 법정동의 원점/간격 (경위도)
+X0, Y0, STEP = 126.8, 37.45, 0.01
+
+
+class StubServer:
+    """127.0.0.1 임의 포트의 스레드 HTTP 서버 — handler(path, query) -> (status, body)"""
+
+    def __init__(self, handler: Handler, delay: float = 0.0):
+        self.handler = handler
+        self.delay = delay
+        self.fail_next: List[Optional[int]] = []  # 다음 요청들에 돌려줄 오류 상태 코드 (None은 정상 응답)
+        self.paths: List[str] = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class _Request(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                time.sleep(stub.delay)
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with stub._lock:
+                    stub.paths.append(url.path)
+                    failure = stub.fail_next.pop(0) if stub.fail_next else None
+                status, body = (failure, b"") if failure else stub.handler(url.path, query)
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Request)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def calls(self, suffix: str) -> int:
+        with self._lock:
+            return sum(p.endswith(suffix) for p in self.paths)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _square(i: int, j: int) -> dict:
+    x, y = X0 + i * STEP, Y0 + j * STEP
+    ring = [[x, y], [x + STEP, y], [x + STEP, y + STEP], [x, y + STEP], [x, y]]
+    return {
+        "type": "Feature",
+        "geometry": {"type": "MultiPolygon", "coordinates": [[ring]]},
+        "properties": {"emd_cd": f"11{i:03d}{j:03d}", "full_nm": f"서울특별시 동{i}-{j}"},
+    }
+
+
+def vworld_handler(nx: int = 8, ny: int = 6) -> Handler:
+    """WFS bbox/페이지 조회 + 지오코더 ("MIN"/"MAX"는 격자 bbox 모서리, "없는"은 NOT_FOUND, "ERROR"는 오류)"""
+    features = [_square(i, j) for i in range(nx) for j in range(ny)]
+
+    def handle(path: str, query: Dict[str, str]) -> Tuple[int, bytes]:
+        if path.endswith("/wfs"):
+            xmin, ymin, xmax, ymax = map(float, query["BBOX"].split(","))
+            hit = [
+                f for f in features
+                if not (f["geometry"]["coordinates"][0][0][2][0] < xmin
+                        or f["geometry"]["coordinates"][0][0][0][0] > xmax
+                        or f["geometry"]["coordinates"][0][0][2][1] < ymin
+                        or f["geometry"]["coordinates"][0][0][0][1] > ymax)
+            ]
+            start = int(query.get("STARTINDEX", 0))
+            count = min(int(query.get("COUNT", 1000)), 1000)
+            page = hit[start:start + count]
+            body = {
+                "type": "FeatureCollection",
+                "numberMatched": len(hit),
+                "numberReturned": len(page),
+                "features": page,
+            }
+        else:
+            address = query.get("address", "")
+            if "ERROR" in address:
+                body = {"response": {"status": "ERROR", "error": {"code": "INVALID_KEY"}}}
+            elif "없는" in address:
+                body = {"response": {"status": "NOT_FOUND"}}
+            else:
+                if address.startswith("MIN"):
+                    x, y = X0 - 0.001, Y0 - 0.001
+                elif address.startswith("MAX"):
+                    x, y = X0 + nx * STEP + 0.001, Y0 + ny * STEP + 0.001
+                else:
+                    h = int(hashlib.md5(address.encode()).hexdigest(), 16)
+                    x = X0 + (h % 1000) / 1000 * nx * STEP
+                    y = Y0 + (h // 1000 % 1000) / 1000 * ny * STEP
+                body = {"response": {"status": "OK", "result": {"point": {"x": str(x), "y": str(y)}}}}
+        return 200, json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    return handle
+
+
+def seoul_rows_handler(rows: List[Tuple[str, int, int]]) -> Handler:
+    """rows[(분기, 행정동, 소득)]를 응답 (호출마다 rows를 다시 읽으므로 테스트 중 바꿔도 된다)"""
+
+    def handle(path: str, query: Dict[str, str]) -> Tuple[int, bytes]:
+        m = re.search(r"/xml/(\w+)/(\d+)/(\d+)/", path)
+        start, end = int(m.group(2)), int(m.group(3))
+        body = (
+            "<?xml version='1.0' encoding='UTF-8'?><Svc>"
+            f"<list_total_count>{len(rows)}</list_total_count>"
+            "<RESULT><CODE>INFO-000</CODE><MESSAGE>정상 처리되었습니다</MESSAGE></RESULT>"
+            + "".join(
+                f"<row><STDR_YYQU_CD>{q}</STDR_YYQU_CD><ADSTRD_CD>{a}</ADSTRD_CD>"
+                f"<MT_AVRG_INCOME_AMT>{v}</MT_AVRG_INCOME_AMT></row>"
+                for q, a, v in rows[start - 1:end]
+            )
+            + "</Svc>"
+        )
+        return 200, body.encode("utf-8")
+
+    return handle
+
+
+def seoul_handler(total: int = 1200, districts: int = 40, quarters=("20234", "20241")) -> Handler:
+    """행 i: 분기 quarters[i % len], 행정동 11110000 + i % districts, 소득 i * 10"""
+    rows = [
+        (quarters[i % len(quarters)], 11110000 + i % districts, i * 10) for i in range(1, total + 1)
+    ]
+    return seoul_rows_handler(rows)
+
+
+def write_mapping_xlsx(path: Path, nx: int = 8, ny: int = 6, districts: int = 40) -> Path:
+    """격자 법정동 <-> stub 행정동 매핑 엑셀 (KIKmix 열 구성)"""
+    import pandas as pd
+
+    rows = []
+    for i in range(nx):
+        for j in range(ny):
+            k = (i * ny + j) % districts
+            legald = int(f"11{i:03d}{j:03d}") * 100
+            rows.append(("서울특별시", (11110000 + k) * 100, legald))
+            if j % 3 == 0:
+                rows.append(("서울특별시", (11110000 + (k + 1) % districts) * 100, legald))
+    pd.DataFrame(rows, columns=["시도명", "행정동코드", "법정동코드"]).to_excel(path, index=False)
+    return path
+
+
+class SolverFixture:
+    """
+    stub 서버 두 개 + 임시 캐시 디렉터리 + 합성 매핑 엑셀로 URSUSSolver를 만든다
+    (solver 모듈 전역 _CACHE_DIR / _BBOX_ADDRESSES / get_mapping_df를 바꾸므로 close()로 되돌린다)
+    """
+
+    def __init__(self, root: Path, nx: int = 8, ny: int = 6, vworld_delay: float = 0.0,
+                 seoul_delay: float = 0.0, seoul_total: int = 1200):
+        import os
+
+        import solver
+
+        self.module = solver
+        self.root = Path(root)
+        self.vworld = StubServer(vworld_handler(nx, ny), vworld_delay)
+        self.seoul = StubServer(seoul_handler(seoul_total), seoul_delay)
+        self.xlsx = write_mapping_xlsx(self.root / "KIKmix.xlsx", nx, ny)
+        os.environ.setdefault("VWORLD_API_KEY", "stub")
+        os.environ.setdefault("DATA_SEOUL_API_KEY", "stub")
+
+        real = solver.get_mapping_df
+        self._saved = {
+            "_CACHE_DIR": solver._CACHE_DIR,
+            "_BBOX_ADDRESSES": solver._BBOX_ADDRESSES,
+            "get_mapping_df": real,
+        }
+        solver._BBOX_ADDRESSES = ("MIN", "MAX")
+        solver.get_mapping_df = lambda _path, **kwargs: real(self.xlsx, **kwargs)
+        self.use_cache("cache")
+
+    def use_cache(self, name: str) -> Path:
+        """새 (또는 기존) 캐시 디렉터리로 전환 — 콜드 캐시 측정용"""
+        self.module._CACHE_DIR = self.root / name
+        return self.module._CACHE_DIR
+
+    def make(self, **kwargs):
+        kwargs.setdefault("geometry_backend", "numpy")
+        s = self.module.URSUSSolver(**kwargs)
+        s.vworld_parser.wfs_url = self.vworld.url + "/req/wfs"
+        s.vworld_parser.geocoder.url = self.vworld.url + "/req/address"
+        s.data_seoul_parser.base_url = self.seoul.url
+        return s
+
+    def close(self) -> None:
+        for name, value in self._saved.items():
+            setattr(self.module, name, value)
+        self.vworld.close()
+        self.seoul.close()
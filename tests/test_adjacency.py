@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from src.utils.gis.adjacency import SpatialWeights, contiguity, local_morans_i, morans_i
+from src.utils.gis.packed_geometry import PackedPolygons
+
+
+def _grid(nx=3, ny=3, size=100.0):
+    """nx x ny 정사각 격자, 피처 순서 = i * ny + j"""
+    features = []
+    for i in range(nx):
+        for j in range(ny):
+            x, y = i * size, j * size
+            features.append([[[[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]]])
+    return PackedPolygons.from_geometries(features)
+
+
+def _neighbors(w):
+    return [sorted(w.neighbors(i).tolist()) for i in range(w.n)]
+
+
+def test_queen_and_rook_on_3x3_grid():
+    polygons = _grid()
+    queen, rook = contiguity(polygons, "queen"), contiguity(polygons, "rook")
+    # 가운데 4: queen 8, rook 4 / 모서리 0: queen 3, rook 2 / 변 1: queen 5, rook 3
+    assert _neighbors(queen)[4] == [0, 1, 2, 3, 5, 6, 7, 8]
+    assert _neighbors(rook)[4] == [1, 3, 5, 7]
+    assert _neighbors(queen)[0] == [1, 3, 4] and _neighbors(rook)[0] == [1, 3]
+    assert _neighbors(queen)[1] == [0, 2, 3, 4, 5] and _neighbors(rook)[1] == [0, 2, 4]
+    assert queen.s0 == 40 and rook.s0 == 24
+    np.testing.assert_allclose(queen.row_standardized().lag(np.ones(9)), 1.0)
+    partial = SpatialWeights.from_pairs(3, np.array([0]), np.array([1])).row_standardized()
+    np.testing.assert_array_equal(partial.lag(np.ones(3)), [1.0, 1.0, 0.0])  # 섬은 0
+    with pytest.raises(ValueError):
+        contiguity(polygons, "bishop")
+
+
+def test_checkerboard_is_perfectly_dispersed():
+    polygons = _grid(6, 6)
+    values = np.indices((6, 6)).sum(axis=0).ravel() % 2
+    w = contiguity(polygons, "rook").row_standardized()
+    result = morans_i(w, values, permutations=199, seed=0)
+    assert result.I == pytest.approx(-1.0)
+    assert result.expected == pytest.approx(-1 / 35)
+    assert result.p_sim == pytest.approx(1 / 200)  # 어떤 순열도 -1 이하가 되지 않는다
+    assert result.z_sim < -5
+
+    local = local_morans_i(w, values, permutations=0)
+    assert (local.Is < 0).all()
+    assert set(local.quadrant.tolist()) == {2, 4}  # LH / HL만
+
+
+def test_permutation_p_values_are_reproducible():
+    polygons = _grid(5, 5)
+    w = contiguity(polygons, "queen").row_standardized()
+    values = np.random.default_rng(3).normal(size=25) + np.repeat(np.arange(5), 5)  # 서쪽->동쪽 경사
+    a = morans_i(w, values, permutations=499, seed=42)
+    b = morans_i(w, values, permutations=499, seed=42)
+    assert (a.I, a.p_sim, a.z_sim) == (b.I, b.p_sim, b.z_sim)
+    assert a.I > 0.3 and a.p_sim < 0.01
+    # 배치를 프로세스에 나눠도 같은 시드는 같은 결과
+    c = morans_i(w, values, permutations=499, seed=42, workers=2)
+    assert c.p_sim == a.p_sim
+
+    la = local_morans_i(w, values, permutations=199, seed=7)
+    lb = local_morans_i(w, values, permutations=199, seed=7)
+    np.testing.assert_array_equal(la.p_sim, lb.p_sim)
+    assert ((la.p_sim > 0) & (la.p_sim <= 0.5)).all()
+
+
+def test_degenerate_inputs_raise():
+    polygons = _grid()
+    w = contiguity(polygons, "rook").row_standardized()
+    with pytest.raises(ValueError, match="variance"):
+        morans_i(w, np.full(9, 3.0))
+    with pytest.raises(ValueError, match="variance"):
+        local_morans_i(w, np.full(9, 3.0))
+    with pytest.raises(ValueError, match="Expected 9"):
+        morans_i(w, np.arange(8.0))
+
+    islands = SpatialWeights.from_pairs(4, np.array([], dtype=int), np.array([], dtype=int))
+    assert islands.islands.tolist() == [0, 1, 2, 3]
+    assert islands.row_standardized().s0 == 0
+    with pytest.raises(ValueError, match="island"):
+        morans_i(islands, np.arange(4.0), permutations=0)
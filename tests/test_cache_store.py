@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.utils.cache.cache_store import CacheStore
+from tests.stubs import _project_root
+
+
+def test_frame_and_bytes_round_trip(tmp_path):
+    cache = CacheStore(tmp_path)
+    df = pd.DataFrame({"code": ["1111", "2222"], "value": [1.5, 2.5], "n": [1, 2]})
+    cache.put_frame("f", df)
+    cache.put_bytes("b", b"\x00payload")
+    pd.testing.assert_frame_equal(cache.get_frame("f"), df)
+    assert cache.get_bytes("b") == b"\x00payload"
+    assert cache.get_bytes("missing") is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_ttl_expires_by_creation_time(tmp_path):
+    cache = CacheStore(tmp_path, ttl_days=1)
+    cache.put_bytes("k", b"x")
+    old = time.time() - 2 * 86400
+    os.utime(str(tmp_path / "k.npz"), (old, old))
+    assert cache.remaining_days("k") < 0
+    assert cache.get_bytes("k") is None
+    assert cache.stats()["expired"] == 1
+    assert not (tmp_path / "k.npz").exists()
+
+
+def test_lru_eviction_uses_last_access(tmp_path):
+    cache = CacheStore(tmp_path, max_bytes=10**9)
+    for i, key in enumerate("abc"):
+        cache.put_arrays(key, {"v": np.random.default_rng(i).random(1000)})
+        t = time.time() - 100 + i
+        os.utime(str(tmp_path / f"{key}.npz"), (t, t))
+    assert cache.get_arrays("a") is not None  # a가 가장 최근 접근
+    cache.max_bytes = cache.stats()["bytes"] - 1
+    cache.put_bytes("d", b"y")
+    assert cache.get_arrays("b") is None
+    assert cache.get_arrays("a") is not None and cache.get_arrays("c") is not None
+
+
+def test_other_process_entries_are_visible_and_kept(tmp_path):
+    cache = CacheStore(tmp_path)
+    cache.put_bytes("mine", b"1")
+    code = (
+        "import sys; from src.utils.cache.cache_store import CacheStore; "
+        f"c = CacheStore({str(tmp_path)!r}); c.put_bytes('theirs', b'2'); "
+        "assert c.get_bytes('mine') == b'1'"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=str(_project_root), check=True)
+    # 이 프로세스의 적중 기록이 다른 프로세스의 항목을 지우지 않는다
+    assert cache.get_bytes("mine") == b"1"
+    assert CacheStore(tmp_path).get_bytes("theirs") == b"2"
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.gis.crosswalk import Crosswalk
+
+
+def _mapping(seed=0, n_legald=40, n_adstrd=30):
+    """법정동마다 행정동 1~3개, 중복 쌍 포함, 쌍별 겹침 면적"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for legald in range(n_legald):
+        for adstrd in rng.choice(n_adstrd, rng.integers(1, 4), replace=False):
+            rows.append((f"L{legald:03d}", f"A{adstrd:03d}", rng.uniform(1, 100)))
+    rows.append(rows[0])  # 중복 쌍
+    return pd.DataFrame(rows, columns=["legald_cd", "adstrd_cd", "overlap"])
+
+
+def _values(mapping, k=5, seed=1):
+    codes = np.unique(mapping["adstrd_cd"])
+    values = np.random.default_rng(seed).uniform(0, 1000, (len(codes), k))
+    values[3, 1] = np.nan
+    return pd.DataFrame(values, columns=[f"v{i}" for i in range(k)]).assign(adstrd_cd=codes)
+
+
+def test_uniform_weights_match_dense_pandas_join():
+    mapping = _mapping()
+    values = _values(mapping)
+    columns = [c for c in values if c != "adstrd_cd"]
+    expected = (
+        mapping.merge(values, on="adstrd_cd").groupby("legald_cd")[columns].mean().reset_index()
+    )
+    crosswalk = Crosswalk.from_frame(mapping)
+    shuffled = values.sample(frac=1, random_state=0)  # 입력 순서와 무관
+    aligned = crosswalk.align(shuffled["adstrd_cd"], shuffled[columns].to_numpy())
+    got = crosswalk.to_frame(aligned, columns)
+    pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-12)
+
+
+def test_overlap_weights_match_weighted_pandas_mean():
+    mapping = _mapping()
+    values = _values(mapping)
+    dense = mapping.merge(values, on="adstrd_cd").assign(weighted=lambda d: d["v0"] * d["overlap"])
+    sums = dense.groupby("legald_cd")[["weighted", "overlap"]].sum()
+    expected = sums["weighted"] / sums["overlap"]
+    crosswalk = Crosswalk.from_frame(mapping, overlap_col="overlap")
+    got = crosswalk.reallocate(crosswalk.align(values["adstrd_cd"], values["v0"].to_numpy()))[:, 0]
+    np.testing.assert_allclose(got, expected.loc[crosswalk.legald_codes].to_numpy(), rtol=1e-12)
+    # 행 정규화 가중치
+    np.testing.assert_allclose(np.add.reduceat(crosswalk.weights, crosswalk.indptr[:-1]), 1.0)
+
+
+def test_extensive_reallocation_conserves_totals():
+    mapping = _mapping()
+    values = _values(mapping)
+    columns = [c for c in values if c != "adstrd_cd"]
+    for overlap_col in (None, "overlap"):
+        crosswalk = Crosswalk.from_frame(mapping, overlap_col)
+        aligned = crosswalk.align(values["adstrd_cd"], values[columns].to_numpy())
+        got = crosswalk.reallocate(aligned, extensive=True)
+        np.testing.assert_allclose(got.sum(axis=0), np.nansum(aligned, axis=0), rtol=1e-12)
+        np.testing.assert_allclose(
+            np.bincount(crosswalk.indices, weights=crosswalk.shares()), 1.0
+        )
+
+    # 한 행정동이 면적 3:1로 두 법정동에 걸치면 총량도 3:1
+    crosswalk = Crosswalk.from_pairs(["L1", "L2"], ["A1", "A1"], overlap=[3.0, 1.0])
+    np.testing.assert_allclose(crosswalk.reallocate(np.array([100.0]), extensive=True), [75.0, 25.0])
+    np.testing.assert_allclose(crosswalk.reallocate(np.array([100.0])), [100.0, 100.0])
+
+
+def test_unmapped_and_missing_values():
+    crosswalk = Crosswalk.from_pairs(["L1", "L1", "L2"], ["A1", "A2", "A3"])
+    aligned = crosswalk.align(["A1", "A2", "A9"], [1.0, 3.0, 5.0])  # A3 값 없음, A9 매핑 없음
+    assert np.isnan(aligned[2, 0])
+    np.testing.assert_allclose(crosswalk.reallocate(aligned)[:, 0], [2.0, np.nan])
+    np.testing.assert_allclose(crosswalk.reallocate(aligned, extensive=True)[:, 0], [4.0, 0.0])
@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.utils.gis.gps_to_upm import GPStoUTM
+
+
+def _seoul_points(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(37.3, 37.8, n), rng.uniform(126.7, 127.3, n)
+
+
+def test_array_matches_scalar_sub_millimetre():
+    conv = GPStoUTM()
+    lat, lon = _seoul_points()
+    # 남반구 / 다른 zone 점도 섞는다
+    lat = np.r_[lat, -33.9, 51.5, 0.0]
+    lon = np.r_[lon, 151.2, -0.1, 3.0]
+    easting, northing = conv.LLtoUTMArray(lat, lon)
+    expected = np.array([conv.LLtoUTM(a, o) for a, o in zip(lat, lon)])
+    np.testing.assert_allclose(easting, expected[:, 0], rtol=0, atol=1e-3)
+    np.testing.assert_allclose(northing, expected[:, 1], rtol=0, atol=1e-3)
+
+
+def test_inverse_matches_scalar_and_round_trips():
+    conv = GPStoUTM()
+    lat, lon = _seoul_points()
+    easting, northing = conv.LLtoUTMArray(lat, lon, ZoneNumber=52)
+    back_lat, back_lon = conv.UTMtoLLArray(northing, easting, 52, "S")
+    expected = np.array([conv.UTMtoLL(n, e, 52, "S") for n, e in zip(northing, easting)])
+    np.testing.assert_allclose(back_lat, expected[:, 0], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(back_lon, expected[:, 1], rtol=0, atol=1e-9)
+    # 왕복 오차는 급수 절단 오차(스칼라 구현과 같음) — 중앙 자오선에서 2도 떨어진 서울에서 수십 cm
+    np.testing.assert_allclose(back_lat, lat, rtol=0, atol=1e-5)
+    np.testing.assert_allclose(back_lon, lon, rtol=0, atol=1e-5)
+
+
+def test_rings_offsets():
+    conv = GPStoUTM()
+    rings = [[[127.0, 37.5], [127.01, 37.5], [127.0, 37.51]], [[126.9, 37.6], [126.91, 37.61]]]
+    xy, offsets = conv.LLtoUTMRings(rings)
+    assert offsets.tolist() == [0, 3, 5]
+    np.testing.assert_allclose(xy[3:5], conv.LLtoUTMRing(rings[1]))
+    empty, offsets = conv.LLtoUTMRings([])
+    assert empty.shape == (0, 2) and offsets.tolist() == [0]
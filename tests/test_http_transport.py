@@ -0,0 +1,90 @@
+import socket
+
+import pytest
+import requests
+
+from src.utils.api.data_seoul_api_parser import DataSeoulOpenAPIParser
+from src.utils.api.http_transport import HttpTransport
+from tests.stubs import StubServer, seoul_handler
+
+
+@pytest.fixture
+def server():
+    server = StubServer(lambda path, query: (200, b"ok"))
+    yield server
+    server.close()
+
+
+def _host_stats(transport, server):
+    return transport.stats()[server.url.split("//")[1]]
+
+
+def test_retries_transient_errors_then_succeeds(server):
+    transport = HttpTransport(backoff_base=0.01)
+    server.fail_next = [503, 502]
+    resp = transport.get(server.url + "/x")
+    assert resp.status_code == 200 and resp.content == b"ok"
+    st = _host_stats(transport, server)
+    assert (st["requests"], st["retries"], st["failures"]) == (3, 2, 2)
+    assert st["bytes"] == 2
+
+
+def test_gives_up_after_max_retries_and_returns_last_response(server):
+    transport = HttpTransport(max_retries=2, backoff_base=0.01)
+    server.fail_next = [500] * 5
+    assert transport.get(server.url + "/x").status_code == 500
+    assert server.calls("/x") == 3
+
+
+def test_non_retryable_status_is_returned_immediately(server):
+    transport = HttpTransport(backoff_base=0.01)
+    server.fail_next = [404]
+    assert transport.get(server.url + "/x").status_code == 404
+    assert server.calls("/x") == 1
+
+
+def test_retry_budget_is_per_host(server):
+    transport = HttpTransport(max_retries=5, backoff_base=0.01, retry_budget=1, budget_refill=0)
+    server.fail_next = [503] * 5
+    assert transport.get(server.url + "/x").status_code == 503
+    assert server.calls("/x") == 2  # 예산 1개 소진 후 바로 포기
+
+
+def test_read_timeout_is_retried_then_raised(server):
+    server.delay = 0.3
+    transport = HttpTransport(timeout=(1.0, 0.05), max_retries=1, backoff_base=0.01)
+    with pytest.raises(requests.Timeout):
+        transport.get(server.url + "/slow")
+    st = _host_stats(transport, server)
+    assert (st["requests"], st["retries"], st["failures"]) == (2, 1, 2)
+
+
+def test_connection_refused_raises():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    transport = HttpTransport(max_retries=1, backoff_base=0.01)
+    with pytest.raises(requests.ConnectionError):
+        transport.get(f"http://127.0.0.1:{port}/")
+
+
+def test_backoff_is_bounded_full_jitter():
+    transport = HttpTransport(backoff_base=0.5, backoff_max=4.0)
+    for attempt in range(8):
+        waits = [transport._backoff(attempt) for _ in range(200)]
+        cap = min(4.0, 0.5 * 2**attempt)
+        assert 0 <= min(waits) and max(waits) <= cap
+        assert max(waits) > cap / 2
+
+
+def test_parser_recovers_from_flaky_page():
+    server = StubServer(seoul_handler(total=250))
+    try:
+        parser = DataSeoulOpenAPIParser(
+            "stub", base_url=server.url, transport=HttpTransport(backoff_base=0.01)
+        )
+        server.fail_next = [None, 503, None, 500]
+        df = parser.to_dataframe_full("VwsmAdstrdNcmCnsmpW", page_size=100)
+        assert df["MT_AVRG_INCOME_AMT"].astype(int).tolist() == [i * 10 for i in range(1, 251)]
+    finally:
+        server.close()
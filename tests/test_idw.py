@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from src.utils.gis.idw import idw
+
+
+def _reference(sources, values, queries, power):
+    out = []
+    for q in queries:
+        d = np.hypot(*(sources - q).T)
+        if (d == 0).any():
+            out.append(values[d == 0].mean())
+            continue
+        w = d ** -power
+        out.append((w * values).sum() / w.sum())
+    return np.array(out)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    sources = rng.uniform(0, 1000, (60, 2))
+    values = rng.uniform(100, 500, 60)
+    queries = rng.uniform(-100, 1100, (700, 2))
+    return sources, values, queries
+
+
+@pytest.mark.parametrize("power", [1.0, 2.0, 3.5])
+def test_matches_scalar_reference(data, power):
+    sources, values, queries = data
+    np.testing.assert_allclose(
+        idw(sources, values, queries, power=power, chunk_size=128),
+        _reference(sources, values, queries, power),
+        rtol=1e-12,
+    )
+
+
+def test_exact_hit_returns_sample_value(data):
+    sources, values, _ = data
+    np.testing.assert_allclose(idw(sources, values, sources[:5]), values[:5])
+
+
+def test_knn_and_radius(data):
+    sources, values, queries = data
+    exact = idw(sources, values, queries)
+    np.testing.assert_allclose(idw(sources, values, queries, k=len(sources)), exact)
+    knn = idw(sources, values, queries, k=5)
+    nearest5 = np.argsort(np.hypot(*(sources[None] - queries[:, None]).transpose(2, 0, 1)), axis=1)[:, :5]
+    for i in range(0, len(queries), 97):
+        np.testing.assert_allclose(
+            knn[i], _reference(sources[nearest5[i]], values[nearest5[i]], queries[i:i + 1], 2)[0]
+        )
+    far = idw(sources, values, [[10_000.0, 10_000.0]], radius=50.0)
+    assert np.isnan(far).all()
+
+
+def test_process_pool_matches_serial(data):
+    sources, values, queries = data
+    np.testing.assert_array_equal(
+        idw(sources, values, queries, chunk_size=100, workers=2),
+        idw(sources, values, queries, chunk_size=100),
+    )
+
+
+def test_accepts_point3d_like_input_and_validates_lengths(data):
+    sources, values, queries = data
+    xyz = np.column_stack([queries, np.zeros(len(queries))])
+    np.testing.assert_array_equal(idw(sources, values, xyz), idw(sources, values, queries))
+    with pytest.raises(ValueError):
+        idw(sources, values[:-1], queries)
+    assert np.isnan(idw([], [], queries[:3])).all()
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.utils.gis import adstrd_cd_to_legald_cd as mapping_module
+from src.utils.gis.adstrd_cd_to_legald_cd import get_mapping_df, load_mapping
+from tests.stubs import write_mapping_xlsx
+
+
+@pytest.fixture
+def xlsx(tmp_path):
+    return write_mapping_xlsx(tmp_path / "KIKmix.xlsx", nx=4, ny=3, districts=5)
+
+
+def test_compiled_cache_matches_xlsx(xlsx, tmp_path):
+    cache = tmp_path / "cache"
+    parsed = load_mapping(xlsx)
+    compiled = load_mapping(xlsx, cache)
+    cached = load_mapping(xlsx, cache)
+    assert isinstance(cached.table, np.memmap)
+    np.testing.assert_array_equal(np.asarray(cached.table), parsed.table)
+    assert sorted(p.suffix for p in cache.iterdir()) == [".json", ".npy"]
+
+    assert set(compiled.legald_for(11110000)) == {11000000, 11001002, 11003000, 11003001}
+    for legald in compiled.legald_for(11110001):
+        assert 11110001 in compiled.adstrd_for(legald)
+    df = get_mapping_df(xlsx, sido="서울", cache_dir=cache)
+    assert len(df) == len(parsed) and df["adstrd_cd"].str.len().eq(8).all()
+
+
+def test_changed_xlsx_replaces_artifacts(xlsx, tmp_path):
+    cache = tmp_path / "cache"
+    load_mapping(xlsx, cache)
+    before = sorted(p.name for p in cache.iterdir())
+    write_mapping_xlsx(xlsx, nx=5, ny=3, districts=5)
+    mapping = load_mapping(xlsx, cache)
+    after = sorted(p.name for p in cache.iterdir())
+    assert len(after) == 2 and not set(before) & set(after)
+    assert len(load_mapping(xlsx, cache)) == len(mapping)
+
+
+def test_interrupted_write_leaves_no_partial_artifact(xlsx, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    real = mapping_module.atomic_write
+    calls = []
+
+    def fail_on_meta(path, data):
+        calls.append(path)
+        if path.suffix == ".json":
+            raise OSError("disk full")
+        real(path, data)
+
+    monkeypatch.setattr(mapping_module, "atomic_write", fail_on_meta)
+    with pytest.raises(OSError):
+        load_mapping(xlsx, cache)
+    assert [p.suffix for p in cache.iterdir()] == [".npy"]  # 임시 파일 없음, meta 없음
+
+    monkeypatch.setattr(mapping_module, "atomic_write", real)
+    assert len(load_mapping(xlsx, cache)) == len(load_mapping(xlsx))
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src.utils.gis.packed_geometry import PackedPolygons, PackedRings
+
+
+def _rect(x0, y0, x1, y1):
+    """반시계 방향, 닫힌 링"""
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+
+
+def test_hole_subtracts_area_and_moves_centroid():
+    # 100 - 4 = 96, 중심 (100 * 5 - 4 * 2) / 96 = 5.125
+    polygons = PackedPolygons.from_geometries([[[_rect(0, 0, 10, 10), _rect(1, 1, 3, 3)]]])
+    np.testing.assert_allclose(polygons.areas(), [96.0])
+    np.testing.assert_allclose(polygons.centroids(), [[5.125, 5.125]])
+    np.testing.assert_array_equal(polygons.exterior_mask(), [True, False])
+    np.testing.assert_allclose(polygons.bboxes(), [[0, 0, 10, 10]])
+
+
+def test_multipart_feature():
+    # 2x2 (중심 1, 1) + 4x1 (중심 12, 0.5) -> 면적 8, 중심 (6.5, 0.75)
+    polygons = PackedPolygons.from_geometries([
+        [[_rect(0, 0, 2, 2)], [_rect(10, 0, 14, 1)]],
+        [[_rect(0, 0, 1, 1)]],
+    ])
+    assert len(polygons) == 2
+    np.testing.assert_array_equal(polygons.ring_feature_ids(), [0, 0, 1])
+    np.testing.assert_allclose(polygons.areas(), [8.0, 1.0])
+    np.testing.assert_allclose(polygons.centroids(), [[6.5, 0.75], [0.5, 0.5]])
+    np.testing.assert_allclose(polygons.bboxes(), [[0, 0, 14, 2], [0, 0, 1, 1]])
+    np.testing.assert_array_equal(polygons.vertex_offsets(), [0, 10, 15])
+
+
+def test_ring_orientation_only_changes_sign():
+    ccw = _rect(0, 0, 4, 2)
+    cw = ccw[::-1]
+    rings = PackedRings.from_rings([ccw, cw, ccw[:-1]])  # 마지막은 닫는 정점 없음
+    np.testing.assert_allclose(rings.signed_areas(), [8.0, -8.0, 8.0])
+    np.testing.assert_allclose(rings.centroids(), [[2, 1]] * 3)
+
+    # 외곽/hole 판정은 방향이 아니라 part 안의 순서로
+    polygons = PackedPolygons.from_geometries([
+        [[_rect(0, 0, 10, 10), _rect(1, 1, 3, 3)]],
+        [[_rect(0, 0, 10, 10)[::-1], _rect(1, 1, 3, 3)[::-1]]],
+    ])
+    np.testing.assert_allclose(polygons.areas(), [96.0, 96.0])
+    np.testing.assert_allclose(polygons.centroids(), [[5.125, 5.125]] * 2)
+
+
+def test_degenerate_and_empty_features():
+    polygons = PackedPolygons.from_geometries([[[[[0, 0], [1, 1], [2, 2]]]], []])
+    np.testing.assert_allclose(polygons.areas(), [0.0, 0.0])
+    np.testing.assert_allclose(polygons.rings.centroids(), [[1.0, 1.0]])  # 정점 평균
+    assert np.isnan(polygons.bboxes()[1]).all()
+
+
+def test_geojson_and_array_round_trip():
+    polygons = PackedPolygons.from_geojson([
+        {"type": "Polygon", "coordinates": [_rect(0, 0, 10, 10), _rect(1, 1, 3, 3)]},
+        {"type": "MultiPolygon", "coordinates": [[_rect(0, 0, 2, 2)], [_rect(10, 0, 14, 1)]]},
+    ])
+    np.testing.assert_allclose(polygons.areas(), [96.0, 8.0])
+    restored = PackedPolygons.from_arrays(polygons.to_arrays("b_"), "b_")
+    np.testing.assert_array_equal(restored.coords, polygons.coords)
+    taken = polygons.take([1])
+    np.testing.assert_allclose(taken.areas(), [8.0])
+    assert [len(part) for part in taken.feature(0)] == [1, 1]
+    with pytest.raises(ValueError):
+        PackedPolygons.from_geojson([{"type": "Point", "coordinates": [0, 0]}])
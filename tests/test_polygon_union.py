@@ -0,0 +1,96 @@
+import numpy as np
+
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.polygon_union import snap_vertices, split_t_junctions, union_polygons
+
+
+def _dense_square(x0, size=100.0, step=0.4):
+    t = np.arange(0, size, step)
+    ring = np.vstack([
+        np.column_stack([x0 + t, np.zeros_like(t)]),
+        np.column_stack([np.full_like(t, x0 + size), t]),
+        np.column_stack([x0 + size - t, np.full_like(t, size)]),
+        np.column_stack([np.full_like(t, x0), size - t]),
+    ])
+    return [[ring]]
+
+
+def test_snap_merges_only_rounding_splits():
+    e = 1e-9
+    coords = np.array([[0.25 - e, 0.25 - e], [0.25 + e, 0.25 - e], [0.25 - e, 0.25 + e],
+                       [0.25 + e, 0.25 + e], [3.0, 3.0]])
+    vid, _ = snap_vertices(coords, 0.5)
+    assert len(set(vid[:4])) == 1 and vid[4] != vid[0]
+
+
+def test_snap_does_not_chain_dense_vertices():
+    # 0.4 m 간격 정점열이 tolerance 0.5에서 한 점으로 무너지면 안 된다
+    coords = np.column_stack([np.arange(0, 100, 0.4), np.zeros(250)])
+    vid, vxy = snap_vertices(coords, 0.5)
+    spans = [np.ptp(coords[vid == v, 0]) for v in np.unique(vid)]
+    assert len(vxy) > 150
+    assert max(spans) <= 0.5
+
+
+def test_union_of_adjacent_dense_squares_keeps_area():
+    polygons = PackedPolygons.from_geometries([_dense_square(0), _dense_square(100)])
+    merged = union_polygons(polygons, 0.5)
+    assert len(merged) == 1
+    assert np.isclose(merged.areas()[0], 20000.0, rtol=1e-3)
+
+
+def test_union_with_hole_and_disjoint_part():
+    outer = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=float)
+    hole = np.array([[4, 4], [4, 6], [6, 6], [6, 4]], dtype=float)
+    far = outer + 100
+    polygons = PackedPolygons.from_geometries([[[outer, hole]], [[far]]])
+    merged = union_polygons(polygons, 0.01)
+    assert np.isclose(merged.areas()[0], 100 - 4 + 100)
+
+
+def _t_junction_polygons(offset=0.0):
+    """왼쪽 정사각형 A의 오른쪽 변 한 개 = 오른쪽 B, C 두 변 (A에는 (10, 5) 정점이 없다)"""
+    a = [[0, 0], [10, 0], [10, 10], [0, 10]]
+    b = [[10 + offset, 0], [20, 0], [20, 5], [10 + offset, 5]]
+    c = [[10 + offset, 5], [20, 5], [20, 10], [10 + offset, 10]]
+    return PackedPolygons.from_geometries([[[a]], [[b]], [[c]]])
+
+
+def test_t_junction_edges_cancel():
+    for offset in (0.0, 0.004):  # 정확히 / tolerance 이내로 간선 위에 놓인 정점
+        merged = union_polygons(_t_junction_polygons(offset), 0.01)
+        assert len(merged.ring_offsets) == 2  # 외곽 하나, hole/조각 없음
+        ring = merged.coords
+        assert np.isclose(merged.areas()[0], 200.0, rtol=1e-3)
+        # 내부 공유 경계 x=10의 정점은 남지 않는다 (y=0, 10의 일직선 정점만)
+        inner = np.isclose(ring[:, 0], 10, atol=0.02)
+        assert set(ring[inner, 1].round(6)) <= {0.0, 10.0}
+
+
+def test_split_t_junctions_orders_inserted_vertices():
+    vxy = np.array([[0, 0], [10, 0], [3, 0], [7, 0], [5, 4]], dtype=np.int64)
+    # 이웃 간선 (3→2)의 끝점 2, 3이 간선 (0→1) 위에 있다
+    a, b = split_t_junctions(np.array([0, 1, 3]), np.array([1, 4, 2]), vxy)
+    assert list(zip(a.tolist(), b.tolist())) == [(1, 4), (3, 2), (0, 2), (2, 3), (3, 1)]
+
+
+def test_parallel_union_uses_one_pool(monkeypatch):
+    import src.utils.gis.polygon_union as polygon_union
+
+    created = []
+    real = polygon_union.ProcessPoolExecutor
+
+    def counting_pool(*args, **kwargs):
+        created.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(polygon_union, "ProcessPoolExecutor", counting_pool)
+    squares = [
+        [[np.array([[i, j], [i + 1, j], [i + 1, j + 1], [i, j + 1]], dtype=float)]]
+        for i in range(4) for j in range(4)
+    ]
+    polygons = PackedPolygons.from_geometries(squares)
+    serial = union_polygons(polygons, 0.01, group_size=1)
+    parallel = union_polygons(polygons, 0.01, group_size=1, workers=2)  # 16 -> 8 -> 4 -> 2 -> 1
+    assert len(created) == 1
+    assert np.isclose(parallel.areas()[0], 16.0) and np.isclose(serial.areas()[0], 16.0)
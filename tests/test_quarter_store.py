@@ -0,0 +1,114 @@
+import pytest
+import requests
+
+from src.utils.api.data_seoul_api_parser import DataSeoulOpenAPIParser
+from src.utils.api.http_transport import HttpTransport
+from src.utils.cache.quarter_store import QuarterPartitionStore
+from tests.stubs import StubServer, seoul_rows_handler
+
+SERVICE = "VwsmAdstrdNcmCnsmpW"
+
+
+def _quarter(q, n=30):
+    return [(q, 11110000 + i, i * 10 + int(q)) for i in range(n)]
+
+
+@pytest.fixture
+def api():
+    rows = _quarter("20241") + _quarter("20234")  # 최신순
+    server = StubServer(seoul_rows_handler(rows))
+    parser = DataSeoulOpenAPIParser("stub", base_url=server.url, transport=HttpTransport(max_retries=0))
+    yield rows, server, parser
+    server.close()
+
+
+def _incomes(store):
+    return sorted(store.load()["MT_AVRG_INCOME_AMT"].astype(int))
+
+
+def test_failed_full_refresh_keeps_previous_partitions(api, tmp_path):
+    rows, server, parser = api
+    store = QuarterPartitionStore(tmp_path)
+    assert store.refresh(parser, SERVICE, page_size=20)["mode"] == "full"
+    before = _incomes(store)
+    files = sorted(p.name for p in tmp_path.iterdir())
+
+    rows[:] = _quarter("20241", 10)  # 총량 감소 -> 전체 재수집
+    server.fail_next = [None, 500]  # 총량 조회는 통과, 첫 페이지에서 실패
+    with pytest.raises(requests.HTTPError):
+        store.refresh(parser, SERVICE, page_size=20)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == files
+    assert _incomes(QuarterPartitionStore(tmp_path)) == before
+    assert _incomes(store) == before
+
+
+def test_incremental_prepend_then_verify_unchanged(api, tmp_path):
+    rows, server, parser = api
+    store = QuarterPartitionStore(tmp_path)
+    store.refresh(parser, SERVICE, page_size=20)
+
+    rows[:0] = _quarter("20242", 5)
+    summary = store.refresh(parser, SERVICE, page_size=20)
+    assert summary == {"mode": "incremental", "fetched_rows": 5, "quarters": ["20242"]}
+    assert store.quarters == ["20234", "20241", "20242"]
+
+    summary = store.refresh(parser, SERVICE, page_size=20)
+    assert summary["mode"] == "noop"
+    assert summary["fetched_rows"] == 5  # 최신 분기만 다시 받음
+
+
+def test_same_total_count_detects_revised_partition(api, tmp_path):
+    rows, server, parser = api
+    store = QuarterPartitionStore(tmp_path)
+    store.refresh(parser, SERVICE, page_size=20)
+    old_file = store.manifest["files"]["20241"]
+
+    rows[3] = ("20241", rows[3][1], 999999)  # 행 수는 그대로, 값만 수정
+    summary = store.refresh(parser, SERVICE, page_size=20)
+    assert summary["mode"] == "revised"
+    assert summary["quarters"] == ["20241"]
+    assert 999999 in _incomes(store)
+    assert not (tmp_path / old_file).exists()
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+
+def test_verify_falls_back_to_full_when_rows_move(api, tmp_path):
+    rows, server, parser = api
+    store = QuarterPartitionStore(tmp_path)
+    store.refresh(parser, SERVICE, page_size=20)
+
+    rows.reverse()  # 총량 같음, 순서 바뀜 -> 최신 분기 구간에 다른 분기가 섞임
+    assert store.refresh(parser, SERVICE, page_size=20)["mode"] == "full"
+    assert store.manifest["order"] == "asc"
+    assert len(store.load()) == 60
+
+
+def test_ascending_api_appends_to_partitions(tmp_path):
+    rows = _quarter("20234") + _quarter("20241")
+    server = StubServer(seoul_rows_handler(rows))
+    parser = DataSeoulOpenAPIParser("stub", base_url=server.url, transport=HttpTransport(max_retries=0))
+    try:
+        store = QuarterPartitionStore(tmp_path)
+        store.refresh(parser, SERVICE, page_size=20)
+        rows.extend(("20241", 11119000 + i, 7) for i in range(4))
+        summary = store.refresh(parser, SERVICE, page_size=20)
+        assert summary["mode"] == "incremental"
+        assert store.manifest["quarters"] == {"20234": 30, "20241": 34}
+        assert store.refresh(parser, SERVICE, page_size=20)["mode"] == "noop"
+    finally:
+        server.close()
+
+
+def test_load_window_and_unknown_quarters(api, tmp_path):
+    rows, server, parser = api
+    store = QuarterPartitionStore(tmp_path)
+    store.refresh(parser, SERVICE, page_size=20)
+
+    assert set(store.load(window=1)["STDR_YYQU_CD"]) == {"20241"}
+    assert len(store.load(window=5)) == 60
+    for window in (0, -1):
+        with pytest.raises(ValueError, match="window"):
+            store.load(window=window)
+    assert store.load(quarters=["19991"]).empty
+    assert set(store.load(quarters=["19991", "20234"])["STDR_YYQU_CD"]) == {"20234"}
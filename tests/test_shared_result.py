@@ -0,0 +1,93 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.io_format.shared_result import SharedResult
+from src.io_format.web_layer import write_binary_layer
+from src.utils.gis.packed_geometry import PackedPolygons
+from tests.stubs import _project_root
+
+
+def _square(x, y, size):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+@pytest.fixture
+def result_args():
+    geometries = [[[_square(310_000.0 + 900 * i, 4_150_000.0, 600)]] for i in range(12)]
+    geometries[0] = [[_square(310_000.0, 4_150_000.0, 600), _square(310_200.0, 4_150_200.0, 100)[::-1]]]
+    polygons = PackedPolygons.from_geometries(geometries)
+    values = {"income": np.random.default_rng(0).normal(3e6, 5e5, len(polygons))}
+    ids = [f"11{i:06d}" for i in range(len(polygons))]
+    return polygons, polygons.centroids(), values, ids
+
+
+def _assert_same(result, polygons, centroids, values, ids):
+    restored = result.polygons()
+    for attr in ("coords", "ring_offsets", "part_offsets", "geom_offsets"):
+        np.testing.assert_array_equal(getattr(restored, attr), getattr(polygons, attr))
+    np.testing.assert_array_equal(result.centroids(), centroids)
+    for name, column in values.items():
+        np.testing.assert_array_equal(result.values(name), column)  # float64 그대로
+    assert result.header["ids"] == ids and result.columns == list(values)
+
+
+def test_mmap_file_round_trip_without_copy(result_args, tmp_path):
+    path = tmp_path / "result.bin"
+    created = SharedResult.create(*result_args, path=path)
+    created.close()
+    with SharedResult.open(path) as result:
+        _assert_same(result, *result_args)
+        coords = result.buffers["coords"]
+        assert np.shares_memory(coords, result._raw) and not coords.flags.writeable
+    created.unlink()
+    assert not path.exists()
+
+
+def test_shared_memory_survives_consumer_process(result_args):
+    created = SharedResult.create(*result_args)
+    try:
+        code = (
+            "from src.io_format.shared_result import SharedResult; "
+            f"r = SharedResult.open({created.name!r}); "
+            "print(r.header['feature_count'], float(r.values('income').sum())); r.close()"
+        )
+        for _ in range(2):  # 소비자가 끝나도 세그먼트가 지워지지 않는다
+            out = subprocess.run(
+                [sys.executable, "-c", code], cwd=str(_project_root),
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            assert int(out[0]) == len(result_args[0])
+            assert float(out[1]) == pytest.approx(result_args[2]["income"].sum())
+        with SharedResult.open(created.name) as result:
+            _assert_same(result, *result_args)
+    finally:
+        created.close()
+        created.unlink()
+    with pytest.raises(FileNotFoundError):
+        SharedResult.open(created.name)
+
+
+def test_open_rejects_other_containers(result_args, tmp_path):
+    polygons, centroids, values, _ = result_args
+    path = write_binary_layer(tmp_path / "layer.bin", polygons, values)
+    with pytest.raises(ValueError):
+        SharedResult.open(path)
+
+
+def test_solver_run_shared_matches_run(ursus, tmp_path):
+    s = ursus.make()
+    geometries, centroids, incomes = s.run()
+    name = s.run_shared(path=tmp_path / "result.bin")
+    with SharedResult.open(name) as result:
+        assert result.header["feature_count"] == len(geometries)
+        np.testing.assert_allclose(result.values("mt_avrg_income_amt"), incomes)
+        np.testing.assert_allclose(result.centroids(), np.asarray(centroids, dtype=float))
+        np.testing.assert_allclose(result.polygons().feature(0)[0][0], np.asarray(geometries[0][0][0]))
+
+    assert s.run_shared(path=tmp_path / "result.bin") == name  # 같은 경로는 교체
+    assert len(s._shared) == 1
+    s.release_shared()
+    assert not (tmp_path / "result.bin").exists() and not s._shared
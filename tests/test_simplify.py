@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.utils.gis.packed_geometry import PackedPolygons, PackedRings
+from src.utils.gis.simplify import (
+    arc_significance, significance, simplify_levels, simplify_topology, simplify_with,
+)
+from src.utils.gis.topology import Topology
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _blobs(n=30, vertices=200, seed=0):
+    rng = np.random.default_rng(seed)
+    features = []
+    for k in range(n):
+        theta = np.linspace(0, 2 * np.pi, vertices, endpoint=False) + rng.uniform(0, 2 * np.pi)
+        radius = 500 * (1 + 0.3 * rng.standard_normal(vertices).cumsum() / np.sqrt(vertices))
+        radius = np.clip(radius, 100, None)
+        ring = np.column_stack([radius * np.cos(theta), radius * np.sin(theta)]) + [k * 3000, 0]
+        features.append([[np.vstack([ring, ring[:1]])]])
+    return PackedPolygons.from_geometries(features)
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_coarse_levels_keep_positive_ring_area(method):
+    polygons = _blobs()
+    for level in simplify_levels(polygons, [50, 1000, 1e6], method):
+        areas = np.abs(PackedRings(level.coords, level.ring_offsets).signed_areas())
+        assert (areas > 0).all()
+        assert (np.diff(level.ring_offsets) >= 4).all()
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_levels_are_nested_and_shrink(method):
+    polygons = _blobs(n=5)
+    sig = significance(polygons, method)
+    counts = [len(simplify_with(polygons, sig, t, method).coords) for t in (0, 1, 10, 100)]
+    assert counts[0] == len(polygons.coords)
+    assert counts == sorted(counts, reverse=True)
+    fine = simplify_with(polygons, sig, 1, method)
+    assert np.isclose(fine.areas().sum(), polygons.areas().sum(), rtol=0.01)
+
+
+def _single_edges(polygons):
+    """한 링만 쓰는 무향 간선 (k, 4) — 틈 없는 분할이면 바깥 경계뿐"""
+    coords = np.round(polygons.coords, 6)
+    ring_ids = np.repeat(np.arange(len(polygons.ring_offsets) - 1), np.diff(polygons.ring_offsets))
+    same_ring = ring_ids[1:] == ring_ids[:-1]
+    a, b = coords[:-1][same_ring], coords[1:][same_ring]
+    swap = (a[:, 0] > b[:, 0]) | ((a[:, 0] == b[:, 0]) & (a[:, 1] > b[:, 1]))
+    edges = np.where(swap[:, None], np.hstack([b, a]), np.hstack([a, b]))
+    unique, counts = np.unique(edges, axis=0, return_counts=True)
+    return unique[counts == 1]
+
+
+def _t_junction_districts():
+    """
+    왼쪽 A (0..2 x 0..4) 와 오른쪽 B (아래), C (위) — 공유 경계 x≈2 가 살짝 흔들리고
+    (2, 2)는 B/C 모서리이면서 A에게는 거의 일직선 위의 정점
+    """
+    ys = np.arange(0, 4.01, 0.5)
+    shared = np.column_stack([2 + 0.02 * (-1) ** np.arange(len(ys)) * (ys % 2 != 0), ys])
+    up = shared.tolist()
+    a = [[0, 0]] + up + [[0, 4], [0, 0]]
+    b = [[2, 0], [4, 0], [4, 2]] + up[4::-1]
+    c = [[2, 2], [4, 2], [4, 4]] + up[:3:-1]
+    return PackedPolygons.from_geometries([[[a]], [[b]], [[c]]])
+
+
+def _on_frame(edges):
+    """간선이 바깥 틀 (x 또는 y가 0/4) 위에 있는지"""
+    return (edges[:, [0, 2]] % 4 == 0).all(1) | (edges[:, [1, 3]] % 4 == 0).all(1)
+
+
+@pytest.mark.parametrize("method, tolerance", [("dp", 0.1), ("vw", 0.3)])
+def test_arc_simplification_keeps_shared_edges_identical(method, tolerance):
+    polygons = _t_junction_districts()
+    assert _on_frame(_single_edges(polygons)).all()
+
+    # 링마다 따로 줄이면 A는 (2, 2)를 버리고 B/C는 모서리로 남긴다 -> 내부에 틈
+    per_ring = simplify_with(polygons, significance(polygons, method), tolerance, method)
+    assert not _on_frame(_single_edges(per_ring)).all()
+
+    topology = Topology.from_polygons(polygons)
+    sig = arc_significance(topology, method)
+    level = simplify_topology(topology, sig, tolerance, method)
+    assert _on_frame(_single_edges(level)).all()
+    assert len(level.coords) < len(polygons.coords)
+    np.testing.assert_allclose(level.areas().sum(), 16.0, rtol=1e-6)
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_arc_levels_on_tessellation(method):
+    polygons, _ = synthetic_districts(nx=6, ny=5, edge_points=30)
+    topology = Topology.from_polygons(polygons)
+    sig = arc_significance(topology, method)
+    counts = []
+    for tolerance in (0, 5, 50, 500, 1e6):
+        level = simplify_topology(topology, sig, tolerance, method)
+        counts.append(len(level.coords))
+        assert (level.areas() > 0).all()
+        assert (np.diff(level.ring_offsets) >= 4).all()
+    assert counts == sorted(counts, reverse=True) and counts[-1] < 0.3 * counts[0]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import solver as solver_module
+from src.utils.gis.packed_geometry import PackedPolygons
+
+
+def test_locate_districts_memoizes_index(ursus, monkeypatch):
+    s = ursus.make()
+    legald = s.graph.run("boundaries", **s._params())
+    centroids = [tuple(c) for c in legald["centroid"]]
+    codes = legald["legald_cd"].astype(str).tolist()
+
+    calls = []
+    real = solver_module.polygons_fingerprint
+    monkeypatch.setattr(
+        solver_module, "polygons_fingerprint", lambda *args: calls.append(1) or real(*args)
+    )
+    assert s.locate_districts(centroids) == codes
+    assert s.locate_districts(centroids[:3]) == codes[:3]
+    assert len(calls) == 1  # 두 번째 호출은 경계를 다시 해시하지 않음
+
+    s.graph.invalidate("boundaries")
+    assert s.locate_districts(centroids[-1:]) == codes[-1:]
+    assert len(calls) == 2
+
+
+def test_invalidate_refetches_sources(ursus):
+    s = ursus.make()
+    s.run()
+    wfs, income = ursus.vworld.calls("/wfs"), ursus.seoul.calls("")
+    s.run()
+    assert (ursus.vworld.calls("/wfs"), ursus.seoul.calls("")) == (wfs, income)
+
+    s.graph.invalidate("boundaries")
+    s.run()
+    assert ursus.vworld.calls("/wfs") > wfs and ursus.seoul.calls("") == income
+
+    # 새 solver도 디스크 캐시를 건너뛰지 않는다 — 표시는 invalidate한 인스턴스에만
+    wfs = ursus.vworld.calls("/wfs")
+    ursus.make().run()
+    assert ursus.vworld.calls("/wfs") == wfs
+
+    s.graph.invalidate("income")
+    s.run()
+    assert ursus.seoul.calls("") > income and ursus.vworld.calls("/wfs") == wfs
+
+
+def test_lod_geometries_come_from_shared_arcs(ursus):
+    s = ursus.make()
+    full, _, _ = s.run()
+    coarse, _, _ = s.run(lod=1e6)
+    assert len(coarse) == len(full)
+    polygons = PackedPolygons.from_geometries(coarse)
+    assert (polygons.areas() > 0).all()
+    # 격자 분할이므로 공유 경계가 같게 남아 면적 합이 그대로
+    np.testing.assert_allclose(
+        polygons.areas().sum(), PackedPolygons.from_geometries(full).areas().sum(), rtol=1e-6
+    )
+    entries = s.cache.stats()["entries"]
+    s.run(lod=10)  # 다른 lod는 캐시된 토폴로지/중요도에 마스크만
+    assert s.cache.stats()["entries"] == entries
+
+
+def test_income_for_unknown_quarters_is_an_error(ursus):
+    s = ursus.make()
+    means, df = s._get_avg_income_df(quarters=["20241"])
+    assert len(df) and means["mt_avrg_income_amt"] > 0
+    with pytest.raises(ValueError, match=r"No data for quarters \['19991'\]"):
+        s._get_avg_income_df(quarters=["19991"])
+    with pytest.raises(ValueError, match="window"):
+        s._get_avg_income_df(window=0)
+
+
+def test_import_defers_analysis_modules():
+    import subprocess
+    import sys
+
+    from tests.stubs import _project_root
+
+    lazy = (
+        "src.utils.gis.adjacency", "src.utils.gis.crosswalk", "src.utils.gis.simplify",
+        "src.utils.gis.triangulate", "src.io_format.web_layer", "src.io_format.shared_result",
+    )
+    code = (
+        f"import sys; sys.path[:0] = [{str(_project_root)!r}, {str(_project_root / 'works' / 'URSUS')!r}]; "
+        f"import solver; print(','.join(m for m in {lazy!r} if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
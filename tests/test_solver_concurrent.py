@@ -0,0 +1,73 @@
+import time
+
+import numpy as np
+import pytest
+
+import solver as solver_module
+from src.utils.pipeline.stage_graph import StageError, StageTimeout
+from tests.stubs import SolverFixture
+
+
+@pytest.fixture
+def delayed(tmp_path):
+    """stub 응답마다 지연 — 원천 단계가 실제처럼 I/O를 기다린다"""
+    fixtures = []
+
+    def make(vworld_delay=0.0, seoul_delay=0.0):
+        fixtures.append(SolverFixture(tmp_path, vworld_delay=vworld_delay, seoul_delay=seoul_delay))
+        return fixtures[-1]
+
+    yield make
+    for fixture in fixtures:
+        fixture.close()
+
+
+def _seconds(graph):
+    return {r["stage"]: r["seconds"] for r in graph.report() if r["status"] == "computed"}
+
+
+def test_concurrent_run_overlaps_sources(delayed):
+    fixture = delayed(vworld_delay=0.2, seoul_delay=0.2)
+    fixture.use_cache("serial")
+    serial = fixture.make()
+    t0 = time.perf_counter()
+    expected = serial.run()
+    t_serial = time.perf_counter() - t0
+    stages = _seconds(serial.graph)
+
+    fixture.use_cache("concurrent")  # 콜드 캐시
+    concurrent = fixture.make()
+    t0 = time.perf_counter()
+    _, centroids, incomes = concurrent.run(concurrent=True)
+    t_concurrent = time.perf_counter() - t0
+    np.testing.assert_allclose(incomes, expected[2])
+    np.testing.assert_allclose(np.asarray(centroids, dtype=float), np.asarray(expected[1], dtype=float))
+    # 임계 경로 = 가장 느린 원천, 합이 아니다
+    assert t_concurrent < t_serial - 0.5 * min(stages["boundaries"], stages["income"])
+    assert {r["stage"]: r["status"] for r in concurrent.graph.report()}["income"] == "memory"
+
+
+def test_slow_source_times_out(delayed):
+    fixture = delayed(seoul_delay=1.0)
+    s = fixture.make()
+    t0 = time.perf_counter()
+    with pytest.raises(StageTimeout) as info:
+        s.run(concurrent=True, timeouts={"income": 0.3})
+    assert info.value.stage == "income" and info.value.timeout == 0.3
+    assert time.perf_counter() - t0 < 0.9
+    # 다른 원천은 memo에 남아 다음 run이 다시 받지 않는다
+    before = fixture.vworld.calls("/wfs")
+    s.graph.run("boundaries", **s._params())
+    assert fixture.vworld.calls("/wfs") == before
+
+
+def test_failing_source_does_not_wait_for_others(delayed, monkeypatch):
+    fixture = delayed(seoul_delay=1.0)
+    monkeypatch.setattr(solver_module, "_BBOX_ADDRESSES", ("ERROR", "MAX"))
+    s = fixture.make()
+    t0 = time.perf_counter()
+    with pytest.raises(StageError) as info:
+        s.run(concurrent=True)
+    assert info.value.stage == "boundaries" and not isinstance(info.value, StageTimeout)
+    assert "INVALID_KEY" in str(info.value.__cause__)
+    assert time.perf_counter() - t0 < 0.9  # 소득 페이지 (1초 이상) 를 기다리지 않음
@@ -0,0 +1,75 @@
+import socket
+import threading
+import time
+from multiprocessing import AuthenticationError
+
+import pytest
+
+import solver_daemon as sd
+
+
+class _FakeSolver:
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, indicators=None, **params):
+        self.calls += 1
+        return [], [], {"calls": self.calls}
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(sd, "_KEY_PATH", tmp_path / "daemon.key")
+    d = sd.SolverDaemon(address=("127.0.0.1", 0), solver=_FakeSolver())
+    thread = threading.Thread(target=d.serve_forever, daemon=True)
+    thread.start()
+    while d.listener is None:
+        time.sleep(0.01)
+    yield d
+    d.shutdown()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_failed_handshakes_do_not_stop_daemon(daemon):
+    addr = daemon.listener.address
+    with pytest.raises(AuthenticationError):
+        sd.SolverClient(addr, authkey=b"wrong key")
+
+    # 핸드셰이크 없이 연결만 하고 끊기
+    with socket.create_connection(addr):
+        pass
+
+    client = sd.SolverClient(addr)
+    assert client.ping() > 0
+    assert client.run()[2] == {"calls": 1}
+    client.close()
+
+
+def test_unknown_method_is_reported_to_client(daemon):
+    client = sd.SolverClient(daemon.listener.address)
+    with pytest.raises(ValueError, match="Unknown method"):
+        client._request("nope")
+    assert client.stats()["errors"] == 1
+    client.close()
+
+
+def test_stats_counters_are_exact_under_concurrency():
+    d = sd.SolverDaemon(address=("127.0.0.1", 0), authkey=b"stub", solver=_FakeSolver())
+    n_threads, n_calls = 8, 250
+
+    def worker(t):
+        for i in range(n_calls):
+            d._dispatch({"method": "run", "kwargs": {"seed": (t, i)}})
+            d._dispatch({"method": "nope"})
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = d._dispatch({"method": "stats"})["result"]
+    assert stats["requests"] == 2 * n_threads * n_calls + 1  # stats 요청 자신 포함
+    assert stats["computed"] == d.solver.calls == n_threads * n_calls
+    assert stats["errors"] == n_threads * n_calls
+    assert stats["inflight"] == 0
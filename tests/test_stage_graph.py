@@ -0,0 +1,117 @@
+import threading
+
+import pytest
+
+from src.utils.cache.cache_store import CacheStore
+from src.utils.pipeline.stage_graph import StageError, StageGraph, StageTimeout
+
+
+def _graph(root, source_value, calls=None):
+    graph = StageGraph(store=CacheStore(root))
+    graph.add("source", lambda: source_value, persist=False)
+
+    def derived(source):
+        if calls is not None:
+            calls.append(source)
+        return source * 10 + 1
+
+    graph.add("derived", derived, deps=("source",))
+    return graph
+
+
+def _statuses(graph):
+    return {r["stage"]: r["status"] for r in graph.report()}
+
+
+def test_disk_memo_reused_across_graphs(tmp_path):
+    assert _graph(tmp_path, 1).run("derived") == 11
+    graph = _graph(tmp_path, 1)
+    assert graph.run("derived") == 11
+    assert _statuses(graph)["derived"] == "disk"
+
+
+def test_disk_memo_follows_source_content(tmp_path):
+    # 새 프로세스(새 graph)에서 원천 데이터가 바뀌면 디스크의 이전 출력을 쓰면 안 된다
+    assert _graph(tmp_path, 1).run("derived") == 11
+    graph = _graph(tmp_path, 3)
+    assert graph.run("derived") == 31
+    assert _statuses(graph)["derived"] == "computed"
+
+
+def test_params_and_invalidate(tmp_path):
+    calls = []
+    graph = StageGraph(store=CacheStore(tmp_path))
+    graph.add("source", lambda scale: scale, params=("scale",), persist=False)
+    graph.add("derived", lambda source: calls.append(source) or source + 1, deps=("source",))
+    assert graph.run("derived", scale=1) == 2
+    assert graph.run("derived", scale=1) == 2
+    assert graph.run("derived", scale=2) == 3
+    assert calls == [1, 2]
+    graph.invalidate("derived")
+    assert graph.run("derived", scale=2) == 3
+    assert _statuses(graph)["derived"] == "computed"
+    assert calls == [1, 2, 2]
+
+
+def test_run_concurrent_overlaps_and_shares_dependencies(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+    shared_calls = []
+    graph = StageGraph(store=CacheStore(tmp_path))
+    graph.add("shared", lambda: shared_calls.append(1) or 5, persist=False)
+    graph.add("a", lambda shared: barrier.wait() * 0 + shared, deps=("shared",), persist=False)
+    graph.add("b", lambda shared: barrier.wait() * 0 + shared * 2, deps=("shared",), persist=False)
+    # a와 b가 동시에 돌지 않으면 barrier에서 BrokenBarrierError
+    assert graph.run_concurrent(["a", "b"]) == {"a": 5, "b": 10}
+    assert shared_calls == [1]
+
+
+def test_run_concurrent_timeout_and_error(tmp_path):
+    release = threading.Event()
+    graph = StageGraph(store=CacheStore(tmp_path))
+    graph.add("slow", lambda: release.wait(5) and 1, persist=False)
+    graph.add("broken", lambda: 1 / 0, persist=False)
+    graph.add("fast", lambda: 2, persist=False)
+
+    with pytest.raises(StageTimeout) as info:
+        graph.run_concurrent(["slow", "fast"], timeouts={"slow": 0.1})
+    assert info.value.stage == "slow" and isinstance(info.value, TimeoutError)
+    release.set()
+
+    with pytest.raises(StageError) as info:
+        graph.run_concurrent(["broken", "fast"])
+    assert info.value.stage == "broken"
+    assert isinstance(info.value.__cause__, ZeroDivisionError)
+
+
+def test_memo_keeps_recent_fingerprints_per_stage(tmp_path):
+    calls = []
+    graph = StageGraph(store=CacheStore(tmp_path), memo_size=2)
+    graph.add("source", lambda scale: calls.append(scale) or scale, params=("scale",), persist=False)
+    for scale in (1, 2, 1, 3):  # 1은 다시 쓰였으므로 3이 들어올 때 2가 밀려난다
+        graph.run("source", scale=scale)
+    assert calls == [1, 2, 3]
+    assert len(graph._memo) == 2 and set(graph._owners) == set(graph._memo)
+    graph.run("source", scale=1)
+    graph.run("source", scale=2)
+    assert calls == [1, 2, 3, 2]
+
+
+def test_records_are_bounded(tmp_path):
+    graph = StageGraph(store=CacheStore(tmp_path))
+    graph.add("source", lambda: 1, persist=False)
+    for _ in range(1000):
+        graph._run("source", {})  # run()을 거치지 않으면 기록이 비워지지 않는다
+    assert len(graph.report()) == graph._records.maxlen
+
+
+def test_invalidate_calls_source_refresh(tmp_path):
+    refreshed = []
+    graph = StageGraph(store=CacheStore(tmp_path))
+    graph.add("source", lambda: 1, persist=False, refresh=lambda: refreshed.append("source"))
+    graph.add("derived", lambda source: source + 1, deps=("source",))
+    graph.run("derived")
+    graph.invalidate("derived")  # 하위 단계만 — 원천은 다시 받지 않는다
+    assert refreshed == []
+    graph.invalidate("source")
+    graph.invalidate()
+    assert refreshed == ["source", "source"]
@@ -0,0 +1,72 @@
+import numpy as np
+
+from src.utils.cache.cache_store import CacheStore
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.topology import Topology
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _with_island():
+    """합성 분할 + 구멍 뚫린 사각형과 그 구멍을 채우는 섬 (junction 없는 닫힌 arc)"""
+    base, _ = synthetic_districts(nx=5, ny=4, edge_points=6)
+    outer = [[40000, 0], [44000, 0], [44000, 4000], [40000, 4000], [40000, 0]]
+    hole = [[41000, 1000], [41000, 3000], [43000, 3000], [43000, 1000], [41000, 1000]]
+    extra = [[[outer, hole]], [[hole[::-1]]]]
+    return PackedPolygons.from_geometries(base.features() + extra)
+
+
+def _same_cycle(a, b, tol):
+    """닫힌 링 a, b가 시작 정점만 다른 같은 순환인지"""
+    a, b = a[:-1], b[:-1]
+    if len(a) != len(b):
+        return False
+    start = int(np.argmin(np.hypot(*(b - a[0]).T)))
+    return np.abs(np.roll(b, -start, axis=0) - a).max() <= tol
+
+
+def test_round_trip_restores_rings():
+    polygons = _with_island()
+    topology = Topology.from_polygons(polygons, quantum=1e-3)
+    restored = topology.to_polygons()
+    np.testing.assert_array_equal(restored.geom_offsets, polygons.geom_offsets)
+    np.testing.assert_array_equal(restored.part_offsets, polygons.part_offsets)
+    for r in range(len(polygons.ring_offsets) - 1):
+        original = polygons.rings.ring(r)
+        assert _same_cycle(original, restored.rings.ring(r), 1e-3 / 2 + 1e-9)
+        assert _same_cycle(original, topology.ring(r), 1e-3 / 2 + 1e-9)
+    np.testing.assert_allclose(restored.areas(), polygons.areas(), rtol=1e-6)  # 스냅 오차만
+    assert [len(part) for part in topology.feature(len(topology) - 2)] == [2]
+
+
+def _undirected_edges(coords, offsets, quantum):
+    grid = np.round(coords / quantum).astype(np.int64)
+    ids = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    same = ids[1:] == ids[:-1]
+    a, b = grid[:-1][same], grid[1:][same]
+    swap = (a[:, 0] > b[:, 0]) | ((a[:, 0] == b[:, 0]) & (a[:, 1] > b[:, 1]))
+    return np.where(swap[:, None], np.hstack([b, a]), np.hstack([a, b]))
+
+
+def test_shared_edges_are_stored_once():
+    polygons = _with_island()
+    topology = Topology.from_polygons(polygons)
+    arc_edges = _undirected_edges(topology.arc_coords(), topology.arc_offsets, topology.quantum)
+    ring_edges = _undirected_edges(polygons.coords, polygons.ring_offsets, topology.quantum)
+    # 원본은 내부 간선을 양쪽 링에 한 번씩 — arc에는 서로 다른 간선이 정확히 한 번씩
+    assert len(np.unique(arc_edges, axis=0)) == len(arc_edges)
+    assert len(arc_edges) == len(np.unique(ring_edges, axis=0)) < len(ring_edges)
+
+    # 구멍과 섬은 같은 arc를 반대 방향으로 참조
+    hole_ref = topology.ring_arcs[topology.ring_offsets[-3]:topology.ring_offsets[-2]]
+    island_ref = topology.ring_arcs[topology.ring_offsets[-2]:topology.ring_offsets[-1]]
+    assert len(hole_ref) == len(island_ref) == 1 and hole_ref[0] == ~island_ref[0]
+
+
+def test_cache_round_trip(tmp_path):
+    polygons = _with_island()
+    topology = Topology.from_polygons(polygons)
+    cache = CacheStore(tmp_path)
+    cache.put_arrays("topology", topology.to_arrays("t_"))
+    loaded = Topology.from_arrays(cache.get_arrays("topology"), "t_")
+    np.testing.assert_array_equal(loaded.to_polygons().coords, topology.to_polygons().coords)
+    assert loaded.arc_deltas.dtype == np.int32
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.triangulate import TriangleMesh, triangulate
+from tests.bench_spatial_index import synthetic_districts
+
+
+def _square(x0, y0, size, clockwise=False):
+    ring = [[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]
+    return ring[::-1] if clockwise else ring
+
+
+def _edges(mesh: TriangleMesh):
+    """(면 수 * 3, 2) 정점 인덱스 쌍 (정렬)"""
+    faces = mesh.faces.astype(np.int64)
+    return np.sort(np.stack([faces, np.roll(faces, -1, axis=1)], axis=-1).reshape(-1, 2), axis=1)
+
+
+def _edge_lengths(mesh: TriangleMesh):
+    e = _edges(mesh)
+    return np.hypot(*(mesh.vertices[e[:, 1]] - mesh.vertices[e[:, 0]]).T)
+
+
+def _assert_conforming(mesh: TriangleMesh):
+    """모든 내부 변은 정확히 두 면이 공유, 면은 반시계 (T-junction/겹침 없음)"""
+    _, counts = np.unique(_edges(mesh), axis=0, return_counts=True)
+    assert counts.max() <= 2
+    assert (mesh.face_areas() > 0).all()
+
+
+def test_square_is_two_triangles():
+    for clockwise in (False, True):
+        mesh = triangulate(PackedPolygons.from_geometries([[[_square(0, 0, 10, clockwise)]]]))
+        assert mesh.faces.shape == (2, 3)
+        assert len(mesh.vertices) == 4
+        np.testing.assert_allclose(mesh.face_areas(), 50.0)
+
+
+def test_areas_match_polygons_and_holes_are_respected():
+    l_shape = [[0, 0], [30, 0], [30, 10], [10, 10], [10, 30], [0, 30], [0, 0]]
+    donut = [_square(100, 0, 40), _square(110, 10, 10, clockwise=True), _square(125, 20, 8, clockwise=True)]
+    polygons = PackedPolygons.from_geometries([
+        [[l_shape]],
+        [donut],
+        [[_square(200, 0, 5)], [_square(210, 0, 5)]],  # 두 조각
+    ])
+    for max_edge in (None, 4.0):
+        mesh = triangulate(polygons, max_edge)
+        assert len(mesh) == 3
+        np.testing.assert_allclose(mesh.areas(), polygons.areas(), rtol=1e-12)
+        np.testing.assert_allclose(mesh.areas(), [500.0, 1600 - 100 - 64, 50.0])
+        _assert_conforming(mesh)
+
+        # hole 안에는 어떤 면의 무게중심도 없다
+        centers = mesh.vertices[mesh.faces].mean(axis=1)
+        in_hole = (
+            (centers[:, 0] > 110) & (centers[:, 0] < 120) & (centers[:, 1] > 10) & (centers[:, 1] < 20)
+        ) | (
+            (centers[:, 0] > 125) & (centers[:, 0] < 133) & (centers[:, 1] > 20) & (centers[:, 1] < 28)
+        )
+        assert not in_hole.any()
+        # L자 안쪽 모서리 바깥 (10..30, 10..30)도 비어 있다
+        assert not ((centers[:, 0] > 10) & (centers[:, 1] > 10) & (centers[:, 0] < 30)).any()
+
+        for i in range(len(mesh)):
+            vertices, faces = mesh.feature(i)
+            assert faces.min() >= 0 and faces.max() < len(vertices)
+
+
+def test_refinement_bounds_every_edge():
+    polygons, _ = synthetic_districts(4, 3, edge_points=4)
+    coarse = triangulate(polygons)
+    assert _edge_lengths(coarse).max() > 2000
+    for max_edge in (2000.0, 750.0):
+        mesh = triangulate(polygons, max_edge)
+        assert _edge_lengths(mesh).max() <= max_edge
+        np.testing.assert_allclose(mesh.areas(), polygons.areas(), rtol=1e-9)
+        _assert_conforming(mesh)
+        assert len(mesh.faces) > len(coarse.faces)
+
+
+def test_arrays_round_trip():
+    polygons, _ = synthetic_districts(3, 2, edge_points=2)
+    mesh = triangulate(polygons, 3000.0)
+    back = TriangleMesh.from_arrays(mesh.to_arrays("mesh_"), "mesh_")
+    np.testing.assert_array_equal(back.faces, mesh.faces)
+    np.testing.assert_array_equal(back.face_feature_ids(), mesh.face_feature_ids())
+    assert back.areas() == pytest.approx(mesh.areas())
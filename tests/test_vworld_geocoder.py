@@ -0,0 +1,60 @@
+import pytest
+
+from src.utils.api.http_transport import HttpTransport
+from src.utils.api.vworld_geocoder import GeocodeError, VworldGeocoder
+from tests.stubs import StubServer, vworld_handler
+
+
+@pytest.fixture
+def server():
+    server = StubServer(vworld_handler())
+    yield server
+    server.close()
+
+
+def _geocoder(server, tmp_path):
+    return VworldGeocoder(
+        "stub",
+        transport=HttpTransport(max_retries=0),
+        cache_path=tmp_path / "geocode.sqlite",
+        rate_limit=None,
+        url=server.url + "/req/address",
+    )
+
+
+def test_not_found_is_negative_cached(server, tmp_path):
+    geocoder = _geocoder(server, tmp_path)
+    coords = geocoder.geocode_many(["서울 종로구 1", "없는 주소", "서울  종로구 1"])
+    assert coords[0] is not None and coords[0] == coords[2]
+    assert coords[1] is None
+    # road + parcel 두 번 시도 후 NOT_FOUND 캐시, 정상 주소는 road 한 번
+    assert server.calls("/address") == 3
+    assert geocoder.geocode("없는 주소") is None
+    assert server.calls("/address") == 3
+
+
+def test_error_response_is_raised_per_address_and_not_cached(server, tmp_path):
+    geocoder = _geocoder(server, tmp_path)
+    addresses = ["서울 중구 1", "ERROR 주소", "서울 중구 2", "없는 곳"]
+    with pytest.raises(GeocodeError) as info:
+        geocoder.geocode_many(addresses)
+    error = info.value
+    assert list(error.errors) == ["ERROR 주소"]
+    assert "INVALID_KEY" in str(error.errors["ERROR 주소"])
+    assert error.coords[1] is None and error.coords[3] is None
+    assert error.coords[0] is not None and error.coords[2] is not None
+
+    # 성공/NOT_FOUND는 캐시됨, 오류 주소만 다시 요청
+    before = server.calls("/address")
+    with pytest.raises(GeocodeError):
+        geocoder.geocode_many(addresses)
+    assert server.calls("/address") == before + 1
+
+
+def test_http_failure_does_not_abort_batch(server, tmp_path):
+    geocoder = _geocoder(server, tmp_path)
+    server.fail_next = [503]
+    with pytest.raises(GeocodeError) as info:
+        geocoder.geocode_many(["서울 a"])
+    assert "503" in str(info.value)
+    assert geocoder.geocode("서울 a") is not None
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from src.io_format.web_layer import (
+    _to_lnglat, decode_positions, layer_to_polygons, read_binary_layer, write_binary_layer,
+    write_geoarrow,
+)
+from src.utils.gis.packed_geometry import PackedPolygons
+
+# 서울 부근 UTM 52S
+X0, Y0 = 310_000.0, 4_150_000.0
+
+
+def _square(x, y, size):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+@pytest.fixture
+def layer():
+    geometries = [[[_square(X0 + 900 * i, Y0 + 700 * j, 600)]] for i in range(8) for j in range(6)]
+    # hole이 있는 피처, 두 part 피처
+    geometries[0] = [[_square(X0, Y0, 600), _square(X0 + 200, Y0 + 200, 100)[::-1]]]
+    geometries[1] = [[_square(X0, Y0 + 700, 300)], [_square(X0 + 350, Y0 + 1000, 200)]]
+    polygons = PackedPolygons.from_geometries(geometries)
+    rng = np.random.default_rng(0)
+    values = {"income": rng.normal(3e6, 5e5, len(polygons)), "pop": np.arange(len(polygons), dtype=float)}
+    ids = [f"11{i:06d}" for i in range(len(polygons))]
+    return polygons, values, ids
+
+
+def test_lnglat_round_trip(layer, tmp_path):
+    polygons, values, ids = layer
+    path = write_binary_layer(tmp_path / "l.bin", polygons, values, ids, polygons.centroids())
+    header, buffers = read_binary_layer(path)
+
+    assert header["crs"] == "EPSG:4326" and header["ids"] == ids
+    assert buffers["positions"].dtype == np.float32
+    assert all(buffers[k].dtype == np.uint32 for k in ("ring_offsets", "part_offsets", "geom_offsets"))
+    restored = layer_to_polygons(header, buffers)
+    np.testing.assert_array_equal(restored.ring_offsets, polygons.ring_offsets)
+    np.testing.assert_array_equal(restored.geom_offsets, polygons.geom_offsets)
+    # float32 오프셋 (원점 기준) -> 1e-6도 (~10cm) 이내
+    np.testing.assert_allclose(restored.coords, _to_lnglat(polygons.coords), rtol=0, atol=1e-6)
+    cent = buffers["centroids"] + np.asarray(header["coordinate_origin"])
+    np.testing.assert_allclose(cent, _to_lnglat(polygons.centroids()), rtol=0, atol=1e-6)
+    np.testing.assert_array_equal(buffers["value:pop"], values["pop"].astype(np.float32))
+    np.testing.assert_array_equal(buffers["value:income"], values["income"].astype(np.float32))
+
+
+def test_utm_and_quantized_round_trip(layer, tmp_path):
+    polygons, values, _ = layer
+    header, buffers = read_binary_layer(
+        write_binary_layer(tmp_path / "u.bin", polygons, values, coordinates="utm")
+    )
+    np.testing.assert_allclose(layer_to_polygons(header, buffers).coords, polygons.coords, atol=0.01)
+    # 면적은 hole을 빼고 그대로
+    np.testing.assert_allclose(layer_to_polygons(header, buffers).areas(), polygons.areas(), rtol=1e-6)
+
+    header, buffers = read_binary_layer(
+        write_binary_layer(tmp_path / "q.bin", polygons, values, coordinates="utm", quantize_bits=12)
+    )
+    assert buffers["positions"].dtype == np.uint16
+    scale = np.asarray(header["quantization"]["scale"])
+    err = np.abs(decode_positions(header, buffers) - polygons.coords)
+    assert (err <= scale / 2 + 1e-9).all()
+
+
+def test_mmap_views_are_read_only(layer, tmp_path):
+    polygons, values, _ = layer
+    path = write_binary_layer(tmp_path / "l.bin", polygons, values)
+    _, buffers = read_binary_layer(path, mmap=True)
+    assert not buffers["positions"].flags.writeable
+    _, copied = read_binary_layer(path, mmap=False)
+    np.testing.assert_array_equal(copied["positions"], buffers["positions"])
+
+
+def test_invalid_arguments(layer, tmp_path):
+    polygons, values, _ = layer
+    with pytest.raises(ValueError):
+        write_binary_layer(tmp_path / "x.bin", polygons, {"bad": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        write_binary_layer(tmp_path / "x.bin", polygons, values, quantize_bits=17)
+    with pytest.raises(ValueError):
+        write_binary_layer(tmp_path / "x.bin", polygons, values, coordinates="mercator")
+
+
+def test_geoarrow_round_trip(layer, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    polygons, values, ids = layer
+    table = pq.read_table(write_geoarrow(tmp_path / "l.parquet", polygons, values, ids))
+    assert table.column("id").to_pylist() == ids
+    geometry = table.column("geometry").combine_chunks()
+    assert isinstance(geometry, pa.ListArray) and len(geometry) == len(polygons)
+    np.testing.assert_allclose(table.column("pop").to_numpy(), values["pop"])
+
+
+def test_solver_export_web_layer(ursus, tmp_path):
+    s = ursus.make()
+    path = s.export_web_layer(tmp_path / "seoul.bin", quantize_bits=16)
+    header, buffers = read_binary_layer(path)
+    join = s.graph.run("join", **s._params())
+    assert header["ids"] == join["legald_cd"].astype(str).tolist()
+    assert header["feature_count"] == len(buffers["value:mt_avrg_income_amt"]) == len(join)
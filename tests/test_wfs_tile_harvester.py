@@ -0,0 +1,62 @@
+import pytest
+
+from src.utils.api.vworld_api_parser import VworldOpenAPIParser
+from src.utils.api.wfs_tile_harvester import WfsTileHarvester
+from tests.stubs import STEP, X0, Y0, StubServer, vworld_handler
+
+NX, NY = 20, 15
+BBOX = (X0 - 0.001, Y0 - 0.001, X0 + NX * STEP + 0.001, Y0 + NY * STEP + 0.001)
+
+
+@pytest.fixture
+def server():
+    server = StubServer(vworld_handler(NX, NY))
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def parser(server):
+    parser = VworldOpenAPIParser("stub")
+    parser.wfs_url = server.url + "/req/wfs"
+    parser.geocoder.url = server.url + "/req/address"
+    return parser
+
+
+def _harvester(parser, **kwargs):
+    return WfsTileHarvester(
+        lambda start, count, b: parser._get_district_boundary_data(start, count, b[1], b[0], b[3], b[2]),
+        **kwargs,
+    )
+
+
+def _codes(features):
+    return [f["properties"]["emd_cd"] for f in features]
+
+
+def test_quadtree_split_collects_every_feature_once(parser, server):
+    features = _harvester(parser, page_size=40, concurrency=4).harvest(BBOX)
+    codes = _codes(features)
+    assert len(codes) == len(set(codes)) == NX * NY
+    # 경계에 걸친 피처가 여러 타일에 나왔어도 한 번만
+    assert server.calls("/wfs") > 4
+
+    again = _harvester(parser, page_size=40, concurrency=1).harvest(BBOX)
+    assert _codes(again) == codes  # 동시성과 무관하게 같은 순서
+
+
+def test_pages_on_number_matched_when_not_splitting(parser, server):
+    features = _harvester(parser, page_size=70, tile_cap=10_000).harvest(BBOX)
+    assert len(features) == len(set(_codes(features))) == NX * NY
+    assert server.calls("/wfs") == -(-NX * NY // 70)
+
+
+def test_max_depth_falls_back_to_paging(parser, server):
+    features = _harvester(parser, page_size=25, max_depth=1).harvest(BBOX)
+    assert len(set(_codes(features))) == NX * NY
+
+
+def test_full_row_data_geocodes_bbox_corners(parser):
+    collections = parser._get_full_row_data("MIN", "MAX", batch_size=60)
+    assert len(collections) == 1
+    assert len(collections[0]["features"]) == NX * NY
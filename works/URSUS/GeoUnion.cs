@@ -25,7 +25,8 @@ public class Script_Instance : GH_ScriptInstance
     // ─────────────────────────────────────────────────────────────────────
     //  ENTRY POINT
     //
-    //  입력:  geometries   행정동 경계 Curve 목록 (List<Curve>)
+    //  입력:  geometries   법정동 경계 Curve 트리 (DataTree<Curve>, 법정동별 branch에
+    //                      part 외곽/hole 순 — solver.run()의 rhino 출력)
     //         snapTol      인접 구역 간격 폐합 허용 오차 (double, 기본 5.0 = 5m)
     //                      Rust의 polygon_snap_distance에 대응
     //
@@ -33,7 +34,7 @@ public class Script_Instance : GH_ScriptInstance
     //         dbg          디버그 요약 (string)
     // ─────────────────────────────────────────────────────────────────────
     private void RunScript(
-        List<Curve> geometries,
+        DataTree<Curve> geometries,
         double      snapTol,
         ref object  unionCurves,
         ref object  dbg)
@@ -43,11 +44,11 @@ public class Script_Instance : GH_ScriptInstance
         double tol = RhinoDoc.ActiveDoc?.ModelAbsoluteTolerance ?? 0.001;
         if (snapTol <= 0) snapTol = 5.0;
 
-        Print($"[0] 입력={geometries?.Count ?? -1}, snapTol={snapTol}");
+        Print($"[0] 입력={geometries?.DataCount ?? -1} (branch={geometries?.BranchCount ?? -1}), snapTol={snapTol}");
 
         // ── 1. 유효한 닫힌 Curve 수집 ─────────────────────────────────────
         var valid = new List<Curve>();
-        foreach (Curve c in geometries ?? Enumerable.Empty<Curve>())
+        foreach (Curve c in geometries?.AllData() ?? Enumerable.Empty<Curve>())
             if (c != null && c.IsClosed) valid.Add(c.DuplicateCurve());
 
         Print($"[1] 유효 curve={valid.Count}");
@@ -0,0 +1,189 @@
+// Grasshopper Script Instance
+// solver.run_shared() 결과 읽기 — 공유 메모리 / 메모리 맵 파일 (src/io_format/shared_result.py)
+#region Usings
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Linq;
+using System.Text;
+using System.Text.Json;
+
+using Rhino;
+using Rhino.Geometry;
+
+using Grasshopper;
+using Grasshopper.Kernel;
+using Grasshopper.Kernel.Data;
+using Grasshopper.Kernel.Types;
+#endregion
+
+public class Script_Instance : GH_ScriptInstance
+{
+    // ─────────────────────────────────────────────────────────────────────
+    //  ENTRY POINT
+    //
+    //  입력:  target      공유 메모리 이름 또는 결과 파일 경로 (string)
+    //         column      지표 컬럼 이름, 비우면 첫 컬럼 (string)
+    //
+    //  출력:  curves      법정동 경계 (DataTree<PolylineCurve>, 피처별 branch)
+    //         centroids   법정동 중심점 (List<Point3d>)
+    //         values      지표 값 (List<double>)
+    //         ids         법정동 코드 (List<string>)
+    // ─────────────────────────────────────────────────────────────────────
+    private void RunScript(
+        string     target,
+        string     column,
+        ref object curves,
+        ref object centroids,
+        ref object values,
+        ref object ids)
+    {
+        try
+        {
+        if (string.IsNullOrEmpty(target))
+        { AddRuntimeMessage(GH_RuntimeMessageLevel.Warning, "target이 비어 있습니다."); return; }
+
+        using (var result = SharedResult.Open(target))
+        {
+            Print($"[0] features={result.FeatureCount}, columns={string.Join(",", result.Columns)}, bytes={result.Length}");
+
+            if (string.IsNullOrEmpty(column)) column = result.Columns.FirstOrDefault();
+            if (column == null || !result.Columns.Contains(column))
+            { AddRuntimeMessage(GH_RuntimeMessageLevel.Error, $"컬럼이 없습니다: {column}"); return; }
+
+            curves    = result.ReadCurves();
+            centroids = result.ReadCentroids();
+            values    = result.ReadDoubles("value:" + column).ToList();
+            ids       = result.Ids;
+        }
+        Print("[1] 완료.");
+        }
+        catch (Exception ex)
+        {
+            Print($"[ERR] {ex.GetType().Name}: {ex.Message}\n{ex.StackTrace}");
+            AddRuntimeMessage(GH_RuntimeMessageLevel.Error, ex.Message);
+        }
+    }
+
+    // ─────────────────────────────────────────────────────────────────────
+    //  SharedResult
+    //
+    //  b"URSL" | uint32 헤더 길이 | JSON 헤더 | 8바이트 정렬 버퍼 (little-endian)
+    //  버퍼 offset은 헤더 끝 기준. 배열은 view accessor에서 바로 읽는다 (중간 byte[] 없음)
+    // ─────────────────────────────────────────────────────────────────────
+    private sealed class SharedResult : IDisposable
+    {
+        private readonly MemoryMappedFile _file;
+        private readonly MemoryMappedViewAccessor _view;
+        private readonly long _base;
+        private readonly Dictionary<string, (long Offset, long Length, string Dtype)> _buffers;
+
+        public int          FeatureCount { get; }
+        public List<string> Columns      { get; }
+        public List<string> Ids          { get; }
+        public long         Length       => _view.Capacity;
+
+        private SharedResult(MemoryMappedFile file)
+        {
+            _file = file;
+            _view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+
+            var magic = new byte[4];
+            _view.ReadArray(0, magic, 0, 4);
+            if (Encoding.ASCII.GetString(magic) != "URSL")
+                throw new InvalidDataException("URSUS 결과 컨테이너가 아닙니다.");
+
+            int headerLen = _view.ReadInt32(4);
+            var headerBytes = new byte[headerLen];
+            _view.ReadArray(8, headerBytes, 0, headerLen);
+            _base = 8 + headerLen;
+
+            using (var doc = JsonDocument.Parse(headerBytes))
+            {
+                var root = doc.RootElement;
+                if (root.GetProperty("format").GetString() != "ursus-result" ||
+                    root.GetProperty("version").GetInt32() != 1)
+                    throw new InvalidDataException("지원하지 않는 결과 형식/버전입니다.");
+
+                FeatureCount = root.GetProperty("feature_count").GetInt32();
+                Columns = root.GetProperty("columns").EnumerateArray().Select(c => c.GetString()).ToList();
+                Ids = root.TryGetProperty("ids", out var idArray)
+                    ? idArray.EnumerateArray().Select(c => c.GetString()).ToList()
+                    : new List<string>();
+
+                _buffers = new Dictionary<string, (long, long, string)>();
+                foreach (var entry in root.GetProperty("buffers").EnumerateArray())
+                    _buffers[entry.GetProperty("name").GetString()] = (
+                        entry.GetProperty("offset").GetInt64(),
+                        entry.GetProperty("byte_length").GetInt64(),
+                        entry.GetProperty("dtype").GetString());
+            }
+        }
+
+        // 존재하는 파일 경로면 메모리 맵 파일, 아니면 공유 메모리 이름 (Windows named mapping)
+        public static SharedResult Open(string target)
+        {
+            var file = File.Exists(target)
+                ? MemoryMappedFile.CreateFromFile(target, FileMode.Open, null, 0, MemoryMappedFileAccess.Read)
+                : MemoryMappedFile.OpenExisting(target, MemoryMappedFileRights.Read);
+            return new SharedResult(file);
+        }
+
+        private T[] Read<T>(string name, string dtype) where T : struct
+        {
+            if (!_buffers.TryGetValue(name, out var buffer))
+                throw new KeyNotFoundException($"버퍼가 없습니다: {name}");
+            if (buffer.Dtype != dtype)
+                throw new InvalidDataException($"{name}: {dtype} 예상, {buffer.Dtype}");
+            int size = System.Runtime.InteropServices.Marshal.SizeOf<T>();
+            var array = new T[buffer.Length / size];
+            _view.ReadArray(_base + buffer.Offset, array, 0, array.Length);
+            return array;
+        }
+
+        public double[] ReadDoubles(string name) => Read<double>(name, "<f8");
+        public long[]   ReadOffsets(string name) => Read<long>(name, "<i8");
+
+        public List<Point3d> ReadCentroids()
+        {
+            var xy = ReadDoubles("centroids");
+            var points = new List<Point3d>(xy.Length / 2);
+            for (int i = 0; i + 1 < xy.Length; i += 2)
+                points.Add(new Point3d(xy[i], xy[i + 1], 0.0));
+            return points;
+        }
+
+        // 피처별 branch에 각 part의 외곽, hole 순으로 닫힌 PolylineCurve
+        public DataTree<PolylineCurve> ReadCurves()
+        {
+            var xy    = ReadDoubles("coords");
+            var rings = ReadOffsets("ring_offsets");
+            var parts = ReadOffsets("part_offsets");
+            var geoms = ReadOffsets("geom_offsets");
+
+            var tree = new DataTree<PolylineCurve>();
+            for (int f = 0; f + 1 < geoms.Length; f++)
+            {
+                var path = new GH_Path(f);
+                tree.EnsurePath(path);
+                for (long p = geoms[f]; p < geoms[f + 1]; p++)
+                for (long r = parts[p]; r < parts[p + 1]; r++)
+                {
+                    var pl = new Polyline((int)(rings[r + 1] - rings[r]) + 1);
+                    for (long v = rings[r]; v < rings[r + 1]; v++)
+                        pl.Add(xy[2 * v], xy[2 * v + 1], 0.0);
+                    if (!pl.IsClosed) pl.Add(pl[0]);
+                    tree.Add(new PolylineCurve(pl), path);
+                }
+            }
+            return tree;
+        }
+
+        public void Dispose()
+        {
+            _view.Dispose();
+            _file.Dispose();
+        }
+    }
+}
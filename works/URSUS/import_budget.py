@@ -0,0 +1,105 @@
+#! python3
+# venv: JAH
+"""
+공개 모듈 import 시간 예산 점검 (python -X importtime)
+
+모듈마다 새 인터프리터에서 repeat번 import해 누적 시간(중앙값)을 재고,
+- budget_ms를 넘거나
+- import만으로 무거운 의존성(pandas, requests, dotenv, openpyxl, scipy, pyarrow, Rhino)이 올라오면
+실패로 보고 종료 코드 1을 반환한다.
+
+사용:
+    python works/URSUS/import_budget.py                # 표 + 예산 초과 시 exit 1
+    python works/URSUS/import_budget.py --scale 2.0    # 느린 머신에서 예산 배율
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_here = Path(__file__).resolve()
+_project_root = _here.parent.parent.parent  # works/URSUS -> works -> JAH
+
+# import 시점에 올라오면 안 되는 모듈 (해당 기능을 실제로 쓸 때만 import)
+_DEFERRED = ("pandas", "requests", "dotenv", "openpyxl", "scipy", "pyarrow", "Rhino")
+
+# 모듈 -> 누적 import 예산 (ms). numpy(~80ms)가 바닥이다
+_BUDGETS_MS: Dict[str, float] = {
+    "src.utils.api.http_transport": 30,
+    "src.utils.api.rate_limiter": 30,
+    "src.utils.api.vworld_geocoder": 40,
+    "src.utils.api.wfs_tile_harvester": 30,
+    "src.utils.api.data_seoul_api_parser": 40,
+    "src.utils.api.vworld_api_parser": 200,
+    "src.utils.cache.cache_store": 200,
+    "src.utils.cache.quarter_store": 200,
+    "src.utils.gis.adjacency": 200,
+    "src.utils.gis.adstrd_cd_to_legald_cd": 200,
+    "src.utils.gis.crosswalk": 200,
+    "src.utils.gis.idw": 200,
+    "src.utils.gis.packed_geometry": 200,
+    "src.utils.gis.polygon_union": 200,
+    "src.utils.gis.rhino_geometry": 200,
+    "src.utils.gis.simplify": 200,
+    "src.utils.gis.spatial_index": 200,
+    "src.utils.gis.topology": 200,
+    "src.utils.gis.triangulate": 200,
+    "src.utils.pipeline.stage_graph": 200,
+    "src.io_format.web_layer": 200,
+    "src.io_format.shared_result": 200,
+    "solver": 250,
+    "solver_daemon": 40,
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """새 인터프리터에서 module import -> (누적 ms, 같이 올라온 _DEFERRED 모듈)"""
+    code = (
+        f"import sys; sys.path[:0] = [{str(_project_root)!r}, {str(_here.parent)!r}]; "
+        f"import {module}; "
+        f"print(','.join(m for m in {_DEFERRED!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=str(_project_root),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    cumulative = 0
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m and m.group(4) == module:
+            cumulative = int(m.group(2))
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return cumulative / 1000.0, loaded
+
+
+def check(repeat: int = 5, scale: float = 1.0) -> bool:
+    ok = True
+    print(f"{'module':40s} {'median ms':>10s} {'budget':>8s}  deferred loaded")
+    for module, budget in _BUDGETS_MS.items():
+        samples, loaded = [], []
+        for _ in range(repeat):
+            ms, loaded = measure(module)
+            samples.append(ms)
+        median = statistics.median(samples)
+        over = median > budget * scale
+        ok &= not over and not loaded
+        flag = "OVER" if over else ("LOAD" if loaded else "")
+        print(f"{module:40s} {median:10.1f} {budget * scale:8.0f}  {','.join(loaded) or '-'} {flag}")
+    return ok
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="URSUS import-time budget")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="예산 배율 (느린 머신)")
+    cli = parser.parse_args()
+    sys.exit(0 if check(cli.repeat, cli.scale) else 1)
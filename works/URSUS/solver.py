@@ -1,8 +1,9 @@
 #! python3
 # venv: JAH
 
+from __future__ import annotations
+
 import sys
-import time
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 
@@ -14,29 +15,59 @@ if str(_project_root) not in sys.path:
 
 from src.utils.api.vworld_api_parser import VworldOpenAPIParser
 from src.utils.api.data_seoul_api_parser import DataSeoulOpenAPIParser
+from src.utils.cache.cache_store import CacheStore
+from src.utils.cache.quarter_store import QuarterPartitionStore
 from src.utils.gis.adstrd_cd_to_legald_cd import get_mapping_df
-from dotenv import load_dotenv
+from src.utils.gis import rhino_geometry
+from src.utils.gis.packed_geometry import PackedPolygons
+from src.utils.gis.spatial_index import DistrictIndex, polygons_fingerprint
+from src.utils.pipeline.stage_graph import StageGraph
 import os
-import pandas as pd
+import numpy as np
+from typing import TYPE_CHECKING, Optional, Sequence
 
-_CACHE_DIR = _project_root / "src" / "cache"
-_CACHE_TTL_DAYS = 30  # 캐시 유효 기간 (일)
+if TYPE_CHECKING:
+    import pandas as pd
 
+    from src.io_format.shared_result import SharedResult
+    from src.utils.gis.adjacency import SpatialWeights
+    from src.utils.gis.crosswalk import Crosswalk
+    from src.utils.gis.triangulate import TriangleMesh
 
-def _is_cache_valid(path: Path) -> bool:
-    """캐시 파일이 존재하고 TTL 이내인지 확인"""
-    if not path.exists():
-        return False
-    age_days = (time.time() - path.stat().st_mtime) / 86400
-    return age_days < _CACHE_TTL_DAYS
+_CACHE_DIR = _project_root / "src" / "cache"
+_CACHE_TTL_DAYS = 30  # 캐시 유효 기간 (일)
+_AVG_INCOME_SERVICE = "VwsmAdstrdNcmCnsmpW"
+_DEFAULT_INDICATORS = ("mt_avrg_income_amt",)
+_DISTRICT_INDEX_SCHEMA_VERSION = 1
+_SIMPLIFY_SCHEMA_VERSION = 3
+_SIDO = "서울"
+# 서로 독립인 원천 단계와 concurrent 실행 시 단계별 제한 시간 (초, 콜드 캐시 기준 여유 있게)
+_SOURCE_STAGES = ("boundaries", "income", "mapping")
+_SOURCE_TIMEOUTS = {"boundaries": 180.0, "income": 600.0, "mapping": 120.0}
+# 서울 전역을 덮는 WFS bbox의 양 끝 주소
+_BBOX_ADDRESSES = ("인천 남동구 도림동", "경기 남양주시 해밀예당1로 272")
 
 
 class URSUSSolver:
 
-    def __init__(self):
+    def __init__(self, geometry_backend: Optional[str] = None):
+        """
+        geometry_backend: "numpy" (좌표 배열/튜플) | "rhino" (법정동별 branch의 DataTree[Curve]/Point3d)
+            None이면 Rhino가 설치된 경우 "rhino", 아니면 "numpy"
+        """
+        if geometry_backend is None:
+            geometry_backend = "rhino" if rhino_geometry.has_rhino() else "numpy"
+        if geometry_backend not in ("numpy", "rhino"):
+            raise ValueError(f"Unknown geometry_backend: {geometry_backend}")
+        self.geometry_backend = geometry_backend
         vworld_api_key, data_seoul_api_key = self._load_api_keys()
-        self.vworld_parser = VworldOpenAPIParser(vworld_api_key, cache_dir=_CACHE_DIR)
+        self.cache = CacheStore(_CACHE_DIR, ttl_days=_CACHE_TTL_DAYS)
+        self.vworld_parser = VworldOpenAPIParser(vworld_api_key, cache=self.cache)
         self.data_seoul_parser = DataSeoulOpenAPIParser(data_seoul_api_key)
+        # graph.invalidate()로 표시된 원천 단계 — 다음 실행에서 자체 캐시를 건너뛰고 다시 받는다
+        self._stale: set[str] = set()
+        self.graph = self._build_graph()
+        self._shared: dict[str, SharedResult] = {}
 
     def _file_uri_to_path(self, raw: str) -> Path:
         if raw.startswith("file:///"):
@@ -50,6 +81,8 @@ class URSUSSolver:
         """
         API 키 불러오기
         """
+        from dotenv import load_dotenv
+
         script_path = self._file_uri_to_path(__file__)
         load_dotenv(script_path.parent / ".env")
         vworld_api_key = os.getenv("VWORLD_API_KEY")
@@ -70,57 +103,115 @@ class URSUSSolver:
         "centroid": 법정동 중점,
         """
         legald_df = self.vworld_parser.get_legal_district_by_addresses(
-            address1, address2
+            address1, address2, refresh="boundaries" in self._stale
         )
+        self._stale.discard("boundaries")
         legald_df = legald_df.query("area > 100").reset_index(drop=True)
         return legald_df
 
+    def _get_district_index(self, legald_df: pd.DataFrame) -> DistrictIndex:
+        """
+        법정동 경계 R-tree 인덱스 — 경계 데이터 해시를 키로 경계 캐시 옆에 저장
+        """
+        polygons = PackedPolygons.from_geometries(legald_df["geometry"])
+        codes = legald_df["legald_cd"].to_list()
+        key = CacheStore.make_key(
+            "gis/district_index",
+            {"boundaries": polygons_fingerprint(polygons, codes)},
+            _DISTRICT_INDEX_SCHEMA_VERSION,
+        )
+        arrays = self.cache.get_arrays(key)
+        if arrays is not None:
+            return DistrictIndex.from_arrays(arrays)
+        index = DistrictIndex(polygons, codes)
+        self.cache.put_arrays(key, index.to_arrays())
+        return index
+
+    def _get_simplified_geometries(
+        self, legald_df: pd.DataFrame, lod: Optional[float], simplify_method: str
+    ) -> list:
+        """
+        LOD 단순화 geometry — 공유 arc 토폴로지와 arc 정점별 중요도를 경계 해시 키로
+        경계 캐시 옆에 저장해 두고 lod(허용오차, m)가 바뀌면 마스크만 다시 적용한다.
+        arc 단위로 줄이므로 이웃 법정동의 공유 경계가 양쪽에서 같다. lod가 None이면 원본 그대로
+        """
+        if lod is None:
+            return legald_df["geometry"].to_list()
+        from src.utils.gis.simplify import arc_significance, simplify_topology
+        from src.utils.gis.topology import Topology
+
+        polygons = PackedPolygons.from_geometries(legald_df["geometry"])
+        codes = legald_df["legald_cd"].to_list()
+        key = CacheStore.make_key(
+            "gis/simplify_significance",
+            {"boundaries": polygons_fingerprint(polygons, codes), "method": simplify_method},
+            _SIMPLIFY_SCHEMA_VERSION,
+        )
+        arrays = self.cache.get_arrays(key)
+        if arrays is not None:
+            topology, sig = Topology.from_arrays(arrays, "topo_"), arrays["significance"]
+        else:
+            topology = Topology.from_polygons(polygons)
+            sig = arc_significance(topology, simplify_method)
+            self.cache.put_arrays(key, {"significance": sig, **topology.to_arrays("topo_")})
+        return simplify_topology(topology, sig, lod, simplify_method).features()
+
+    def locate_districts(self, points) -> list:
+        """
+        (x, y) UTM 좌표 목록 -> 점별 legald_cd (어느 법정동에도 없으면 "")
+        """
+        index: DistrictIndex = self.graph.run("district_index", **self._params())
+        return index.locate(points).tolist()
+
     # avg_income
-    def _get_avg_income_df(self) -> tuple[float, pd.DataFrame]:
+    def _get_avg_income_df(
+        self,
+        indicators: Sequence[str] = _DEFAULT_INDICATORS,
+        quarters: Optional[Sequence[str]] = None,
+        window: Optional[int] = None,
+    ) -> tuple[dict, pd.DataFrame]:
         """
-        행정동 기준 월 평균 소득 df (TTL 캐시 적용)
+        행정동 기준 지표 평균 df (분기 파티션 저장소, TTL마다 증분 갱신)
 
         "adstrd_cd": 행정동 코드,
-        "mt_avrg_income_amt": 월 평균 소득,
+        "mt_avrg_income_amt": 월 평균 소득 (등 indicators 컬럼),
+
+        quarters: 특정 분기(stdr_yyqu_cd)만, window: 최신 N개 분기만 (없으면 전체 분기 평균)
+        Returns: ({지표: 전체 평균}, df)
         """
-        cache_path = _CACHE_DIR / "avg_income.json"
+        import pandas as pd
 
-        if _is_cache_valid(cache_path):
+        indicators = list(indicators)
+        store = QuarterPartitionStore(_CACHE_DIR / _AVG_INCOME_SERVICE)
+        if not store.quarters or store.age_days() >= _CACHE_TTL_DAYS or "income" in self._stale:
+            print("[CACHE] avg_income 분기 파티션 갱신 중...")
+            summary = store.refresh(self.data_seoul_parser, _AVG_INCOME_SERVICE)
+            self._stale.discard("income")
+            print(
+                f"[CACHE] avg_income {summary['mode']} 갱신 완료 "
+                f"({summary['fetched_rows']}건, 분기 {summary['quarters']})"
+            )
+        else:
             print(
-                f"[CACHE] avg_income 캐시 사용 (만료까지 {_CACHE_TTL_DAYS - (time.time() - cache_path.stat().st_mtime) / 86400:.1f}일)"
+                f"[CACHE] avg_income 분기 파티션 사용 (만료까지 {_CACHE_TTL_DAYS - store.age_days():.1f}일)"
+            )
+
+        raw_df = store.load(quarters=quarters, window=window)
+        if raw_df.empty:
+            raise ValueError(
+                f"No data for quarters {list(quarters)} (stored: {store.quarters})"
+                if quarters is not None
+                else "No income data in the quarter store"
             )
-            avg_income_by_adstrd = pd.read_json(str(cache_path))
-            avg_income_by_adstrd["adstrd_cd"] = avg_income_by_adstrd[
-                "adstrd_cd"
-            ].astype(str)
-            mean = avg_income_by_adstrd["mt_avrg_income_amt"].mean()
-            return mean, avg_income_by_adstrd
-
-        print("[CACHE] avg_income API 호출 중...")
-        avg_income_df = self.data_seoul_parser.to_dataframe_full("VwsmAdstrdNcmCnsmpW")
-        avg_income_df.columns = avg_income_df.columns.str.strip().str.lower()
-        avg_income_df["mt_avrg_income_amt"] = pd.to_numeric(
-            avg_income_df["mt_avrg_income_amt"], errors="coerce"
-        )
-        mean = avg_income_df["mt_avrg_income_amt"].mean()
-        avg_income_by_adstrd = (
-            avg_income_df.groupby("adstrd_cd")["mt_avrg_income_amt"]
-            .mean()
-            .reset_index()
-        )
-        avg_income_by_adstrd["adstrd_cd"] = avg_income_by_adstrd["adstrd_cd"].astype(
-            str
-        )
-        avg_income_by_adstrd["mt_avrg_income_amt"] = avg_income_by_adstrd[
-            "mt_avrg_income_amt"
-        ].fillna(mean)
-
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        avg_income_by_adstrd.to_json(str(cache_path))
-        print(f"[CACHE] avg_income 저장 완료 ({len(avg_income_by_adstrd)}건)")
-        return mean, avg_income_by_adstrd
-
-    def _get_mapping_df(self) -> pd.DataFrame:
+        raw_df.columns = raw_df.columns.str.strip().str.lower()
+        for col in indicators:
+            raw_df[col] = pd.to_numeric(raw_df[col], errors="coerce")
+        means = {col: raw_df[col].mean() for col in indicators}
+        avg_by_adstrd = raw_df.groupby("adstrd_cd")[indicators].mean().reset_index()
+        avg_by_adstrd["adstrd_cd"] = avg_by_adstrd["adstrd_cd"].astype(str)
+        return means, avg_by_adstrd.fillna(means)
+
+    def _get_mapping_df(self, sido: Optional[str] = _SIDO) -> pd.DataFrame:
         """
         행정동 df <-> 법정동 df 매칭
         """
@@ -128,48 +219,351 @@ class URSUSSolver:
         file_path = (
             script_path.parent.parent.parent / "src" / "sheets" / "KIKmix.20240201.xlsx"
         )
-        mapping_df = get_mapping_df(file_path)
+        # 원본 해시로 무효화되는 컴파일 산출물(.npy, mmap)을 캐시 디렉터리에 둔다
+        mapping_df = get_mapping_df(file_path, sido=sido, cache_dir=_CACHE_DIR)
         return mapping_df
 
-    def run(self):
+    # ---------- pipeline ----------
+
+    def _build_graph(self) -> StageGraph:
         """
-        solver.run()
+        boundaries ──────────────┬─ geometry ─┐
+        income ──────────────────┼─ join ─────┴─ export
+        mapping ─ crosswalk ─────┘
+        boundaries ─ outline / weights (인접 그래프) / district_index (점 -> 법정동)
+        geometry ─ mesh (삼각분할)
 
-        TODO: to be continued
+        boundaries/income/mapping/district_index는 자체 캐시가 있으므로 메모리에만 memoize
+        graph.invalidate("boundaries" | "income")는 경계 캐시 / 소득 파티션도 다시 받게 한다
+        (mapping은 xlsx 해시로 무효화되므로 memo만 버린다)
+        export는 Rhino 객체를 만들 수 있으므로 디스크에 저장하지 않는다
         """
-        legald_df = self._get_legal_district_df(
-            address1="인천 남동구 도림동", address2="경기 남양주시 해밀예당1로 272"
+        graph = StageGraph(store=self.cache)
+        graph.add(
+            "boundaries",
+            lambda address1, address2: self._get_legal_district_df(address1, address2),
+            params=("address1", "address2"),
+            persist=False,
+            refresh=lambda: self._stale.add("boundaries"),
+        )
+        graph.add(
+            "income",
+            lambda indicators, quarters, window: self._get_avg_income_df(
+                indicators, quarters, window
+            ),
+            params=("indicators", "quarters", "window"),
+            persist=False,
+            refresh=lambda: self._stale.add("income"),
+        )
+        graph.add(
+            "mapping", lambda sido: self._get_mapping_df(sido), params=("sido",), persist=False
+        )
+        graph.add(
+            "crosswalk",
+            self._build_crosswalk,
+            deps=("mapping",),
+            version=2,  # overlap 필드 추가
+        )
+        graph.add("join", self._join, deps=("boundaries", "income", "crosswalk"))
+        graph.add(
+            "outline",
+            self._union_outline,
+            deps=("boundaries",),
+            params=("union_tolerance",),
+            version=2,  # snap_vertices 연쇄 병합 제거
+        )
+        graph.add(
+            "weights",
+            self._contiguity_weights,
+            deps=("boundaries",),
+            params=("contiguity_mode",),
+            version=2,  # snap_vertices 연쇄 병합 제거
         )
-        mean, avg_income_by_adstrd = self._get_avg_income_df()
-        mapping_df = self._get_mapping_df()
-        mapping_with_income: pd.DataFrame = mapping_df.merge(
-            avg_income_by_adstrd,
-            on="adstrd_cd",
-            how="left",
+        graph.add(
+            "district_index",
+            lambda boundaries: self._get_district_index(boundaries),
+            deps=("boundaries",),
+            persist=False,
         )
+        graph.add(
+            "geometry",
+            lambda boundaries, lod, simplify_method: self._get_simplified_geometries(
+                boundaries, lod, simplify_method
+            ),
+            deps=("boundaries",),
+            params=("lod", "simplify_method"),
+            persist=False,
+        )
+        graph.add(
+            "mesh",
+            self._triangulate_mesh,
+            deps=("geometry",),
+            params=("mesh_max_edge",),
+        )
+        graph.add(
+            "export",
+            self._export,
+            deps=("join", "geometry"),
+            params=("indicators", "geometry_backend"),
+            persist=False,
+        )
+        return graph
+
+    def _params(self, **overrides) -> dict:
+        params = {
+            "address1": _BBOX_ADDRESSES[0],
+            "address2": _BBOX_ADDRESSES[1],
+            "sido": _SIDO,
+            "indicators": _DEFAULT_INDICATORS,
+            "quarters": None,
+            "window": None,
+            "union_tolerance": 0.5,
+            "lod": None,
+            "simplify_method": "dp",
+            "contiguity_mode": "queen",
+            "mesh_max_edge": None,
+            "geometry_backend": self.geometry_backend,
+        }
+        params.update(overrides)
+        return params
+
+    @staticmethod
+    def _build_crosswalk(mapping: pd.DataFrame) -> Crosswalk:
+        from src.utils.gis.crosswalk import Crosswalk
+
+        return Crosswalk.from_frame(mapping)
+
+    @staticmethod
+    def _union_outline(boundaries: pd.DataFrame, union_tolerance: float) -> PackedPolygons:
+        from src.utils.gis.polygon_union import union_polygons
+
+        return union_polygons(PackedPolygons.from_geometries(boundaries["geometry"]), union_tolerance)
+
+    @staticmethod
+    def _contiguity_weights(boundaries: pd.DataFrame, contiguity_mode: str) -> SpatialWeights:
+        from src.utils.gis.adjacency import contiguity
+
+        return contiguity(PackedPolygons.from_geometries(boundaries["geometry"]), contiguity_mode)
+
+    @staticmethod
+    def _triangulate_mesh(geometry: list, mesh_max_edge: Optional[float]) -> TriangleMesh:
+        from src.utils.gis.triangulate import triangulate
 
-        # 6. legald_cd 기준으로 평균 내기
-        avg_income_by_legald = mapping_with_income.groupby("legald_cd", as_index=False)[
-            "mt_avrg_income_amt"
-        ].mean()
+        return triangulate(PackedPolygons.from_geometries(geometry), mesh_max_edge)
 
-        # 7. legal df에 avg_income 붙이기
-        legald_with_avg_income: pd.DataFrame = legald_df.merge(
-            avg_income_by_legald,
-            on="legald_cd",
-            how="left",
+    @staticmethod
+    def _join(boundaries: pd.DataFrame, income, crosswalk: Crosswalk) -> pd.DataFrame:
+        """
+        행정동 지표 전부를 크로스워크 희소 행렬 곱 한 번으로 법정동에 재배분 후
+        legal df에 붙이기 (없으면 지표별 전체 평균)
+        """
+        means, avg_by_adstrd = income
+        indicators = list(means)
+        values = crosswalk.align(
+            avg_by_adstrd["adstrd_cd"], avg_by_adstrd[indicators].to_numpy()
         )
-        legald_with_avg_income["mt_avrg_income_amt"].fillna(mean, inplace=True)
+        by_legald = crosswalk.to_frame(values, indicators)
+        joined: pd.DataFrame = boundaries.merge(by_legald, on="legald_cd", how="left")
+        return joined.fillna(means)
+
+    @staticmethod
+    def _export(
+        join: pd.DataFrame, geometry: list, indicators: Sequence[str], geometry_backend: str
+    ):
+        geometries = geometry
+        centroids = join["centroid"].to_list()
+        if geometry_backend == "rhino":
+            geometries = rhino_geometry.features_to_curve_tree(geometries)
+            centroids = rhino_geometry.to_point3d(centroids)
+        values = {col: join[col].to_list() for col in indicators}
+        return geometries, centroids, values
+
+    def prefetch(self, timeouts: Optional[dict] = None, **params) -> None:
+        """
+        경계(지오코딩 + WFS) / 소득(서울 API 페이지) / 매핑(xlsx 파싱)을 스레드 풀에서 동시에 준비
+
+        셋 다 준비되는 즉시 반환하고, 이후 단계는 memo된 결과를 쓴다.
+        timeouts: {단계: 초} (없는 단계는 _SOURCE_TIMEOUTS) — 초과하면 StageTimeout,
+        한 원천이 실패하면 나머지를 기다리지 않고 StageError (원래 예외는 __cause__)
+        """
+        self.graph.run_concurrent(
+            _SOURCE_STAGES, {**_SOURCE_TIMEOUTS, **(timeouts or {})}, **self._params(**params)
+        )
+
+    def run(
+        self,
+        indicators: Optional[Sequence[str]] = None,
+        concurrent: bool = False,
+        timeouts: Optional[dict] = None,
+        **params,
+    ):
+        """
+        solver.run()
 
-        # 8. 결과 활용
-        geometries = legald_with_avg_income["geometry"].to_list()
-        centroids = legald_with_avg_income["centroid"].to_list()
-        avg_incomes = legald_with_avg_income["mt_avrg_income_amt"].to_list()
+        indicators가 없으면 (geometries, centroids, avg_incomes) —
+        있으면 (geometries, centroids, {지표: 값 목록})
 
-        return geometries, centroids, avg_incomes
+        단계별 결과는 입력 fingerprint 기준으로 memoize되므로
+        바뀐 인자(address1/address2/sido/indicators/quarters/window/geometry_backend)의
+        하위 단계만 다시 계산한다. quarters(분기 목록)/window(최신 N개 분기)로 기간 선택
+        lod(허용오차, m)를 주면 simplify_method("dp" | "vw")로 단순화한 geometry 반환
+        concurrent면 세 원천을 prefetch()로 동시에 받은 뒤 합친다 (timeouts는 prefetch 참고)
+        단계별 상태/시간은 self.graph.report()로 확인
+        """
+        if concurrent:
+            self.prefetch(
+                timeouts,
+                **params,
+                **({} if indicators is None else {"indicators": tuple(indicators)}),
+            )
+        if indicators is None:
+            geometries, centroids, values = self.graph.run("export", **self._params(**params))
+            return geometries, centroids, values[_DEFAULT_INDICATORS[0]]
+        params["indicators"] = tuple(indicators)
+        return self.graph.run("export", **self._params(**params))
+
+    def outline(self, tolerance: float = 0.5, **params):
+        """
+        서울 외곽선 (GeoUnion.cs 대체) — 경계를 tolerance(m) 격자 스냅 후 공유 간선 상쇄로 합친 결과
+
+        numpy 백엔드: [part][ring] 좌표 배열 (각 part의 첫 링이 외곽, 나머지는 hole)
+        rhino 백엔드: PolylineCurve 목록 (외곽, hole 순)
+        """
+        params["union_tolerance"] = tolerance
+        merged = self.graph.run("outline", **self._params(**params))
+        parts = merged.feature(0) if len(merged) else []
+        if self.geometry_backend == "rhino":
+            return rhino_geometry.feature_to_polyline_curves(parts)
+        return parts
+
+    def mesh(self, max_edge: Optional[float] = None, **params):
+        """
+        법정동 삼각 메시 (Brep.CreatePlanarBreps + Mesh.CreateFromBrep 대체)
+
+        max_edge: 최대 변 길이 (m), None이면 세분 없음. lod를 주면 단순화한 경계로 메시 생성
+        numpy 백엔드: TriangleMesh (정점/면 버퍼 + 법정동별 범위, vertices는 IDW 질의점으로 바로 사용)
+        rhino 백엔드: 법정동별 rg.Mesh 목록
+        """
+        params["mesh_max_edge"] = max_edge
+        result: TriangleMesh = self.graph.run("mesh", **self._params(**params))
+        if self.geometry_backend == "rhino":
+            return [rhino_geometry.to_mesh(*result.feature(i)) for i in range(len(result))]
+        return result
+
+    def export_web_layer(
+        self,
+        path,
+        indicators: Optional[Sequence[str]] = None,
+        coordinates: str = "lnglat",
+        quantize_bits: Optional[int] = None,
+        **params,
+    ) -> Path:
+        """
+        웹 지도(deck.gl/kepler.gl)용 레이어 파일 내보내기
+
+        .bin: 바이너리 컬럼 버퍼 + JSON 헤더 (src.io_format.web_layer)
+        .parquet / .arrow: GeoArrow multipolygon (pyarrow 필요)
+        lod를 주면 단순화한 경계로 내보낸다
+        """
+        from src.io_format.web_layer import write_binary_layer, write_geoarrow
+
+        indicators = tuple(indicators or _DEFAULT_INDICATORS)
+        params["indicators"] = indicators
+        resolved = self._params(**params)
+        join = self.graph.run("join", **resolved)
+        polygons = PackedPolygons.from_geometries(self.graph.run("geometry", **resolved))
+        values = {col: join[col].to_numpy() for col in indicators}
+        ids = join["legald_cd"].to_list()
+        path = Path(path)
+        if path.suffix in (".parquet", ".arrow", ".feather"):
+            return write_geoarrow(path, polygons, values, ids, coordinates)
+        return write_binary_layer(
+            path, polygons, values, ids, np.array(join["centroid"].to_list()),
+            coordinates, quantize_bits,
+        )
+
+    def run_shared(
+        self,
+        name: Optional[str] = None,
+        path=None,
+        indicators: Optional[Sequence[str]] = None,
+        **params,
+    ) -> str:
+        """
+        run() 결과를 공유 메모리 (path가 있으면 메모리 맵 파일)에 기록하고 그 이름/경로 반환
+
+        Python 리스트 대신 원본 좌표/오프셋/지표 버퍼를 그대로 넘기므로 소비자
+        (SharedResult.open / SharedResultReader.cs)는 파싱이나 복사 없이 읽는다.
+        세그먼트는 solver가 살아 있는 동안 유지되고, 같은 이름으로 다시 부르면 이전 것을 지운다
+        """
+        from src.io_format.shared_result import SharedResult
+
+        indicators = tuple(indicators or _DEFAULT_INDICATORS)
+        params["indicators"] = indicators
+        resolved = self._params(**params)
+        join = self.graph.run("join", **resolved)
+        polygons = PackedPolygons.from_geometries(self.graph.run("geometry", **resolved))
+        key = str(Path(path)) if path is not None else name
+        previous = self._shared.pop(key, None) if key is not None else None
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+        result = SharedResult.create(
+            polygons,
+            np.array(join["centroid"].to_list()),
+            {col: join[col].to_numpy() for col in indicators},
+            join["legald_cd"].to_list(),
+            name=name,
+            path=path,
+        )
+        self._shared[result.name] = result
+        return result.name
+
+    def release_shared(self) -> None:
+        """run_shared()로 만든 세그먼트/파일 모두 삭제"""
+        for result in self._shared.values():
+            result.close()
+            result.unlink()
+        self._shared.clear()
+
+    def autocorrelation(
+        self,
+        indicator: str = _DEFAULT_INDICATORS[0],
+        contiguity_mode: str = "queen",
+        permutations: int = 999,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        **params,
+    ):
+        """
+        법정동별 지표의 공간 자기상관 -> (Moran, LocalMoran)
+
+        인접 그래프는 경계 공유(queen: 정점 / rook: 간선)로 만들고 행 표준화해 사용
+        순열 검정은 workers > 1이면 프로세스 병렬
+        """
+        from src.utils.gis.adjacency import local_morans_i, morans_i
+
+        params["contiguity_mode"] = contiguity_mode
+        params["indicators"] = tuple(dict.fromkeys((*params.get("indicators", ()), indicator)))
+        resolved = self._params(**params)
+        w = self.graph.run("weights", **resolved).row_standardized()
+        values = self.graph.run("join", **resolved)[indicator].to_numpy()
+        return (
+            morans_i(w, values, permutations, seed, workers),
+            local_morans_i(w, values, permutations, seed, workers),
+        )
 
 
 if __name__ == "__main__":
+    from src.io_format import shared_result
+
     solver = URSUSSolver()
-    geometries, centroids, avg_incomes = solver.run()
-    print(geometries)
+    name = solver.run_shared()
+    try:
+        with shared_result.SharedResult.open(name) as result:
+            print(
+                f"[INFO] 법정동 {len(result.polygons())}개, 지표 {result.columns}, "
+                f"공유 메모리 {name} ({result.nbytes / 1024:.1f} KiB)"
+            )
+    finally:
+        solver.release_shared()
@@ -0,0 +1,339 @@
+#! python3
+# venv: JAH
+"""
+상주 URSUS solver 데몬 + 얇은 클라이언트
+
+Grasshopper 컴포넌트가 실행될 때마다 URSUSSolver를 새로 만들면 .env 로드, pandas/requests import,
+캐시 파일 읽기, KIKmix 매핑 로드가 매번 반복된다. 데몬은 solver 하나를 띄워 두고
+경계/매핑/소득/파생 인덱스를 메모리(StageGraph memo)에 유지한 채 로컬 소켓으로 요청을 받는다.
+
+- 프로토콜: multiprocessing.connection (127.0.0.1 TCP, authkey 인증, pickle 메시지)
+    요청 {"method": str, "args": tuple, "kwargs": dict} -> 응답 {"ok": bool, "result" | "error"}
+- 같은 요청이 동시에 들어오면 한 번만 계산하고 결과를 나눠 준다 (request coalescing)
+- invalidate(stage)로 단계 memo를 명시적으로 무효화 (None이면 전체)
+- 데몬의 solver는 항상 numpy 백엔드이고, Rhino 변환은 클라이언트 쪽에서 한다
+
+사용:
+    python works/URSUS/solver_daemon.py          # 데몬 실행 (포그라운드)
+
+    from solver_daemon import SolverClient
+    client = SolverClient.connect()              # 데몬이 없으면 띄운 뒤 연결
+    geometries, centroids, avg_incomes = client.run()
+"""
+
+import hashlib
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+_here = Path(__file__).resolve()
+_project_root = _here.parent.parent.parent  # works/URSUS -> works -> JAH
+for _p in (str(_project_root), str(_here.parent)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+_DEFAULT_ADDRESS = ("127.0.0.1", int(os.getenv("URSUS_DAEMON_PORT", "47831")))
+_KEY_PATH = _project_root / "src" / "cache" / "daemon.key"
+# 데몬에서 호출할 수 있는 solver 메서드 (결과가 pickle 가능한 것만)
+_SOLVER_METHODS = frozenset(
+    {
+        "run", "prefetch", "run_shared", "release_shared", "outline", "mesh",
+        "locate_districts", "autocorrelation", "export_web_layer",
+    }
+)
+
+
+def _load_authkey(create: bool = False) -> bytes:
+    if _KEY_PATH.exists():
+        return _KEY_PATH.read_bytes()
+    if not create:
+        raise FileNotFoundError(f"Daemon key not found: {_KEY_PATH}")
+    _KEY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    key = os.urandom(32)
+    tmp = _KEY_PATH.with_suffix(".tmp")
+    tmp.write_bytes(key)
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, _KEY_PATH)
+    return key
+
+
+class SolverDaemon:
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = _DEFAULT_ADDRESS,
+        authkey: Optional[bytes] = None,
+        solver=None,
+    ):
+        """
+        solver: 미리 만든 URSUSSolver (없으면 numpy 백엔드로 생성)
+        """
+        if solver is None:
+            from solver import URSUSSolver
+
+            solver = URSUSSolver(geometry_backend="numpy")
+        self.solver = solver
+        self.address = address
+        self.authkey = authkey or _load_authkey(create=True)
+        self._compute_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()  # _inflight와 _stats 카운터를 함께 보호
+        self._stop = threading.Event()
+        self._stats = {"requests": 0, "computed": 0, "coalesced": 0, "errors": 0, "seconds": 0.0}
+        self.listener: Optional[Listener] = None
+
+    def serve_forever(self) -> None:
+        self.listener = Listener(self.address, authkey=self.authkey)
+        self.address = self.listener.address
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn = self.listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    # 잘못된 키 / 핸드셰이크 전에 끊긴 연결 — 데몬은 계속 받는다
+                    if self._stop.is_set():
+                        break
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self.listener.close()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        # accept() 대기를 깨우기 위한 빈 연결
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except OSError:
+            pass
+
+    def _handle(self, conn) -> None:
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                response = self._dispatch(request)
+                try:
+                    conn.send(response)
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    conn.send({"ok": False, "error": RuntimeError(f"Unpicklable result: {e}")})
+                if request.get("method") == "shutdown":
+                    self.shutdown()
+                    return
+
+    def _dispatch(self, request: dict) -> dict:
+        method = request.get("method")
+        args = tuple(request.get("args", ()))
+        kwargs = dict(request.get("kwargs", {}))
+        self._count(requests=1)
+        try:
+            if method in _SOLVER_METHODS:
+                result = self._coalesced(method, args, kwargs)
+            elif method == "invalidate":
+                with self._compute_lock:
+                    self.solver.graph.invalidate(*args, **kwargs)
+                result = None
+            elif method == "stats":
+                with self._inflight_lock:
+                    result = {**self._stats, "inflight": len(self._inflight)}
+            elif method in ("ping", "shutdown"):
+                result = os.getpid()
+            else:
+                raise ValueError(f"Unknown method: {method}")
+            return {"ok": True, "result": result}
+        except Exception as e:
+            self._count(errors=1)
+            try:
+                pickle.dumps(e)
+            except Exception:
+                e = RuntimeError(f"{type(e).__name__}: {e}")
+            return {"ok": False, "error": e}
+
+    def _count(self, **deltas) -> None:
+        """_stats 카운터 증가 (핸들러 스레드마다 호출하므로 lock 안에서)"""
+        with self._inflight_lock:
+            for name, delta in deltas.items():
+                self._stats[name] += delta
+
+    def _coalesced(self, method: str, args: tuple, kwargs: dict) -> Any:
+        """같은 (method, args, kwargs)가 계산 중이면 그 결과를 기다린다"""
+        key = hashlib.sha256(
+            pickle.dumps((method, args, sorted(kwargs.items())), protocol=4)
+        ).hexdigest()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self._stats["coalesced"] += 1
+        if not owner:
+            return future.result()
+
+        try:
+            t0 = time.perf_counter()
+            with self._compute_lock:
+                result = getattr(self.solver, method)(*args, **kwargs)
+            self._count(computed=1, seconds=time.perf_counter() - t0)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return future.result()
+
+
+class SolverClient:
+    """
+    데몬 연결 — solver와 같은 이름의 메서드를 원격 호출
+    (이 모듈은 pandas/requests/solver를 import하지 않으므로 클라이언트 쪽 시작 비용이 거의 없다)
+    """
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = _DEFAULT_ADDRESS,
+        authkey: Optional[bytes] = None,
+        geometry_backend: str = "numpy",
+    ):
+        """
+        geometry_backend: "numpy" | "rhino" — rhino면 결과를 PolylineCurve/Point3d/Mesh로 변환
+        """
+        self.address = address
+        self.geometry_backend = geometry_backend
+        self._conn = Client(address, authkey=authkey or _load_authkey())
+        self._lock = threading.Lock()
+
+    @classmethod
+    def connect(
+        cls,
+        address: Tuple[str, int] = _DEFAULT_ADDRESS,
+        geometry_backend: str = "numpy",
+        spawn: bool = True,
+        timeout: float = 60.0,
+        python: Optional[str] = None,
+    ) -> "SolverClient":
+        """
+        데몬에 연결 — 없고 spawn이면 python(기본 sys.executable)으로 데몬을 띄우고 준비될 때까지 기다린다
+        """
+        try:
+            return cls(address, geometry_backend=geometry_backend)
+        except (ConnectionRefusedError, FileNotFoundError):
+            if not spawn:
+                raise
+        flags = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0) | getattr(
+            subprocess, "DETACHED_PROCESS", 0
+        )
+        subprocess.Popen(
+            [python or sys.executable, str(_here), "--port", str(address[1])],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=flags,
+            start_new_session=os.name != "nt",
+        )
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return cls(address, geometry_backend=geometry_backend)
+            except (ConnectionRefusedError, FileNotFoundError):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Solver daemon did not start within {timeout}s")
+                time.sleep(0.2)
+
+    def _request(self, method: str, *args, **kwargs) -> Any:
+        with self._lock:
+            self._conn.send({"method": method, "args": args, "kwargs": kwargs})
+            response = self._conn.recv()
+        if not response["ok"]:
+            raise response["error"]
+        return response["result"]
+
+    def run(self, indicators=None, **params):
+        geometries, centroids, values = self._request("run", indicators, **params)
+        if self.geometry_backend == "rhino":
+            from src.utils.gis import rhino_geometry
+
+            geometries = rhino_geometry.features_to_curve_tree(geometries)
+            centroids = rhino_geometry.to_point3d(centroids)
+        return geometries, centroids, values
+
+    def prefetch(self, timeouts: Optional[dict] = None, **params) -> None:
+        self._request("prefetch", timeouts, **params)
+
+    def run_shared(self, name: Optional[str] = None, path=None, indicators=None, **params):
+        """
+        데몬이 결과를 공유 메모리/메모리 맵 파일에 쓰고, 이쪽은 그 view를 연다 (pickle 전송 없음)
+        반환된 SharedResult는 다 쓰면 close() — 세그먼트는 데몬이 갖고 있다
+        """
+        from src.io_format.shared_result import SharedResult
+
+        target = self._request(
+            "run_shared", name, None if path is None else str(path), indicators, **params
+        )
+        return SharedResult.open(target)
+
+    def release_shared(self) -> None:
+        self._request("release_shared")
+
+    def outline(self, tolerance: float = 0.5, **params):
+        parts = self._request("outline", tolerance, **params)
+        if self.geometry_backend == "rhino":
+            from src.utils.gis import rhino_geometry
+
+            return rhino_geometry.feature_to_polyline_curves(parts)
+        return parts
+
+    def mesh(self, max_edge: Optional[float] = None, **params):
+        result = self._request("mesh", max_edge, **params)
+        if self.geometry_backend == "rhino":
+            from src.utils.gis import rhino_geometry
+
+            return [rhino_geometry.to_mesh(*result.feature(i)) for i in range(len(result))]
+        return result
+
+    def locate_districts(self, points) -> list:
+        return self._request("locate_districts", [tuple(p) for p in points])
+
+    def autocorrelation(self, *args, **kwargs):
+        return self._request("autocorrelation", *args, **kwargs)
+
+    def export_web_layer(self, path, *args, **kwargs):
+        return self._request("export_web_layer", str(path), *args, **kwargs)
+
+    def invalidate(self, stage: Optional[str] = None) -> None:
+        """stage(None이면 전체) 와 하위 단계 memo 무효화"""
+        self._request("invalidate", stage)
+
+    def stats(self) -> dict:
+        return self._request("stats")
+
+    def ping(self) -> int:
+        return self._request("ping")
+
+    def shutdown(self) -> None:
+        self._request("shutdown")
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="URSUS solver daemon")
+    parser.add_argument("--port", type=int, default=_DEFAULT_ADDRESS[1])
+    cli = parser.parse_args()
+    daemon = SolverDaemon(address=(_DEFAULT_ADDRESS[0], cli.port))
+    print(f"[DAEMON] listening on {daemon.address[0]}:{daemon.address[1]} (pid {os.getpid()})")
+    daemon.serve_forever()